@@ -0,0 +1,19 @@
+import streamlit as st
+
+from plant_care.instrumentation import (
+    diagnostics_panel, profile_requested, profiled_rerun, profiling_available,
+)
+
+# 🌱 Single multipage app: both pages share this process, the cached datasets
+# and st.session_state, so switching pages is a rerun rather than a new server.
+home_page = st.Page("home.py", title="Plant Care Analysis", icon="🌱", default=True)
+plant_page = st.Page("plant.py", title="Plant Health Analysis", icon="🌿")
+
+page = st.navigation([home_page, plant_page])
+
+# 🩺 Opt-in profiling: PLANT_CARE_PROFILE=1 for every session, ?profile=<PLANT_CARE_PROFILE_TOKEN> for one
+requested = profile_requested(st.query_params.get("profile"))
+if profiling_available(requested):
+    diagnostics_panel()
+with profiled_rerun(page.url_path or "home", requested=requested):
+    page.run()
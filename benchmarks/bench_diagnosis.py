@@ -0,0 +1,108 @@
+"""Benchmark symptom matching: per-phrase substring loop and regex vs the Aho-Corasick matcher.
+
+The knowledge base phrases are padded with generated synonyms up to
+``--phrases`` and matched against ``--tickets`` synthetic support tickets.
+
+Usage:
+    python benchmarks/bench_diagnosis.py [--phrases 5000] [--tickets 5000]
+"""
+
+import argparse
+import os
+import re
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from plant_care.diagnosis import KnowledgeBase, SymptomMatcher, normalize_text  # noqa: E402
+from plant_care.datasets import load_dataset  # noqa: E402
+
+PARTS = ["leaves", "stem", "roots", "buds", "flowers", "new growth", "lower leaves", "tips", "edges", "soil"]
+STATES = ["turning", "going", "looking", "getting", "becoming", "gone", "went", "are", "look", "seem"]
+QUALITIES = ["yellow", "brown", "black", "pale", "spotty", "crispy", "mushy", "limp", "curled", "sticky",
+             "dusty", "translucent", "wrinkled", "bleached", "soft", "shriveled", "patchy", "faded"]
+FILLER = ("hi i bought this plant last month and i water it every week near the window but now it "
+          "seems off can you help me figure out what is wrong thanks a lot").split()
+
+
+def synthetic_phrases(kb, count, rng):
+    """The knowledge-base phrases plus generated "<part> <state> <quality>" synonyms."""
+    phrases = list(kb.matcher.phrases)
+    seen = set(phrases)
+    while len(phrases) < count:
+        phrase = f"{rng.choice(PARTS)} {rng.choice(STATES)} {rng.choice(QUALITIES)}"
+        if rng.random() < 0.3:
+            phrase += f" {rng.choice(QUALITIES)}"
+        if phrase not in seen:
+            seen.add(phrase)
+            phrases.append(phrase)
+    return phrases
+
+
+def synthetic_tickets(phrases, count, rng, words=40):
+    """Tickets of filler text with one to three phrases mixed in."""
+    tickets = []
+    for _ in range(count):
+        text = list(rng.choice(FILLER, words))
+        for _ in range(rng.integers(1, 4)):
+            text.insert(int(rng.integers(0, len(text))), phrases[rng.integers(0, len(phrases))])
+        tickets.append(" ".join(text))
+    return tickets
+
+
+def substring_loop(phrases):
+    """What the condition check did, generalized: one substring search per phrase."""
+    def find(text):
+        text = text.lower()
+        return [phrase for phrase in phrases if phrase in text]
+    return find
+
+
+def regex_alternation(phrases):
+    """One regex alternation of all phrases (longest first), anchored at word starts."""
+    pattern = re.compile(r"\b(?:" + "|".join(map(re.escape, sorted(phrases, key=len, reverse=True))) + ")")
+    return lambda text: pattern.findall(normalize_text(text))
+
+
+def timed(fn, tickets):
+    start = time.perf_counter()
+    matches = sum(len(fn(ticket)) for ticket in tickets)
+    return time.perf_counter() - start, matches
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--phrases", type=int, default=5000)
+    parser.add_argument("--tickets", type=int, default=5000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    kb = KnowledgeBase.from_frame(load_dataset("symptoms"))
+    phrases = synthetic_phrases(kb, args.phrases, rng)
+    tickets = synthetic_tickets(phrases, args.tickets, rng)
+    megabytes = sum(map(len, tickets)) / 1e6
+    print(f"{len(phrases):,} phrases, {len(tickets):,} tickets ({megabytes:.1f} MB)")
+
+    print(f"{'method':<20}{'build ms':>10}{'total s':>10}{'tickets/s':>12}{'MB/s':>8}{'matches':>10}")
+    for label, build in (("substring loop", substring_loop), ("regex alternation", regex_alternation),
+                         ("aho-corasick", lambda p: SymptomMatcher(p).find)):
+        start = time.perf_counter()
+        find = build(phrases)
+        build_ms = (time.perf_counter() - start) * 1000
+        elapsed, matches = timed(find, tickets)
+        print(f"{label:<20}{build_ms:>10.1f}{elapsed:>10.2f}{len(tickets) / elapsed:>12,.0f}"
+              f"{megabytes / elapsed:>8.2f}{matches:>10,}")
+
+    start = time.perf_counter()
+    diagnosed = sum(bool(kb.diagnose(ticket)) for ticket in tickets)
+    elapsed = time.perf_counter() - start
+    print(f"\nknowledge base diagnose (ranked causes): {len(tickets) / elapsed:,.0f} tickets/s, "
+          f"{diagnosed:,} with a known symptom")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""Benchmark the home page filter engine against the old pandas chain.
+
+Usage:
+    python benchmarks/bench_filters.py [--rows 1000000] [--repeat 5]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from synthetic import synthetic_catalog  # noqa: E402
+
+from plant_care.filters import PlantFilter  # noqa: E402
+
+
+def legacy_filter(df, search_query, soil_filter, water_filter):
+    """The filter chain home.py used before plant_care.filters."""
+    if search_query:
+        df = df[df['Plant Name'].str.contains(search_query, case=False, na=False)]
+    if soil_filter:
+        df = df[df['Soil Type'].isin(soil_filter)]
+    if water_filter:
+        df = df[df['Watering'].isin(water_filter)]
+    return df
+
+
+def best_of(fn, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings) * 1000
+
+
+CASES = [
+    ("short query", ("ro", [], [])),
+    ("long query", ("lavender 12", [], [])),
+    ("soil + water", ("", ["Sandy", "Loamy"], ["Low"])),
+    ("all predicates", ("cactus", ["Sandy"], ["Low", "Moderate"])),
+]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    df = synthetic_catalog(args.rows)
+    start = time.perf_counter()
+    engine = PlantFilter(df)
+    print(f"{args.rows:,} rows, engine build {1000 * (time.perf_counter() - start):.1f} ms")
+
+    print(f"{'case':<16}{'legacy ms':>12}{'cold ms':>12}{'memoized ms':>14}{'rows':>10}")
+    for label, (query, soil, water) in CASES:
+        legacy_ms = best_of(lambda: legacy_filter(df, query, soil, water), args.repeat)
+        engine._cache.clear()
+        engine._name_matches.clear()
+        start = time.perf_counter()
+        result = engine.apply(query, soil, water)
+        cold_ms = (time.perf_counter() - start) * 1000
+        warm_ms = best_of(lambda: engine.apply(query, soil, water), args.repeat)
+        expected = legacy_filter(df, query, soil, water)
+        assert result.index.equals(expected.index), label
+        print(f"{label:<16}{legacy_ms:>12.1f}{cold_ms:>12.1f}{warm_ms:>14.2f}{len(result):>10,}")
+
+
+if __name__ == "__main__":
+    main()
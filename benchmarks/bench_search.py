@@ -0,0 +1,73 @@
+"""Benchmark plant-name search: pandas scans vs the prefix/fuzzy index.
+
+Usage:
+    python benchmarks/bench_search.py [--rows 100000] [--repeat 200]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from synthetic import synthetic_catalog  # noqa: E402
+
+from plant_care.search import SearchIndex  # noqa: E402
+
+
+def legacy_exact(df, query):
+    """What "Check Plant" did: lower-case the whole column and compare."""
+    return df[df["Plant Name"].str.lower() == query.strip().lower()]
+
+
+def legacy_contains(df, query):
+    """What the home search did: case-insensitive substring scan."""
+    return df[df["Plant Name"].str.contains(query, case=False, na=False)]
+
+
+def best_of(fn, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    df = synthetic_catalog(args.rows).drop_duplicates("Plant Name")
+    start = time.perf_counter()
+    index = SearchIndex.from_frames({"plants": df})
+    print(f"{len(index):,} names, index build {1000 * (time.perf_counter() - start):.0f} ms")
+
+    sample = df["Plant Name"].iloc[len(df) // 2]
+    genus, number = sample.split(" ")
+    cases = [
+        ("exact", sample),
+        ("prefix", f"{genus[:3]}"),
+        ("word prefix", number[:3]),
+        ("one typo", f"{genus[:2]}{genus[3:]} {number}"),
+        ("transposition", f"{genus[1]}{genus[0]}{genus[2:]} {number}"),
+        ("two typos", f"{genus[:-1]}x {number[:-1]}"),
+        ("no match", "qqqqqqq"),
+    ]
+
+    legacy_repeat = max(1, args.repeat // 50)
+    print(f"{'case':<15}{'query':<20}{'pandas ms':>11}{'index ms':>10}  top suggestion")
+    for label, query in cases:
+        legacy = legacy_exact if label == "exact" else legacy_contains
+        legacy_ms = best_of(lambda: legacy(df, query), legacy_repeat)
+        index_ms = best_of(lambda: index.suggest(query), args.repeat)
+        top = index.suggest(query)
+        found = f"{top[0].name} ({top[0].match}, d={top[0].distance})" if top else "-"
+        print(f"{label:<15}{query:<20}{legacy_ms:>11.2f}{index_ms:>10.3f}  {found}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,335 @@
+"""Time the analysis and UI data paths on synthetic tables of growing size.
+
+For every size, the three CSVs are generated (see synthetic.py) into a
+scratch data directory that the app modules load from, and each case is run
+headlessly: ``--repeat`` timed runs (best and median reported), then one
+extra run under ``tracemalloc`` for the allocation peak. Results are written
+as JSON so runs can be compared over time (``--compare`` prints the ratio
+against an earlier file).
+
+Usage:
+    python benchmarks/run_benchmarks.py [--sizes 1000 100000 1000000] [--repeat 5]
+        [--cases filters. analysis.] [--output results.json] [--compare old.json] [--no-memory]
+"""
+
+import argparse
+import datetime
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+# The app modules read their data and cache directories at import time
+WORK_DIR = os.path.join(tempfile.gettempdir(), f"plant_care_bench_{os.getpid()}")
+os.environ["PLANT_CARE_DATA_DIR"] = os.path.join(WORK_DIR, "data")
+os.environ["PLANT_CARE_CACHE_DIR"] = os.path.join(WORK_DIR, "cache")
+
+from synthetic import FILE_NAMES, synthetic_tables, write_tables  # noqa: E402
+
+from plant_care import datasets  # noqa: E402
+from plant_care.analysis import analyze_environment, analyze_flowering, find_plant  # noqa: E402
+from plant_care.columnar import read_columnar, write_columnar  # noqa: E402
+from plant_care.filters import PlantFilter  # noqa: E402
+from plant_care.growth import analyze_growth_batch, ideal_table  # noqa: E402
+from plant_care.ingest import SensorAggregates  # noqa: E402
+from plant_care.name_index import NameIndex  # noqa: E402
+from plant_care.phenology import PhenologyStore, season_counts  # noqa: E402
+from plant_care.schedule import CareTable, plan  # noqa: E402
+from plant_care.search import SearchIndex  # noqa: E402
+from plant_care.seasons import compute_season_scores, ideal_ranges_from_catalog  # noqa: E402
+
+RESULTS_DIR = os.path.join(ROOT, "benchmarks", "results")
+
+# Lookups per timed run for the per-request cases
+LOOKUPS = 1000
+
+# name -> setup(ctx) returning (run, calls); run() is what gets timed
+CASES = {}
+
+
+def case(name):
+    def register(setup):
+        CASES[name] = setup
+        return setup
+    return register
+
+
+@case("datasets.parse.plants")
+def _(ctx):
+    return lambda: datasets._parse_csv("plants", ctx["paths"]["plants"]), 1
+
+
+@case("datasets.parse.flowering")
+def _(ctx):
+    return lambda: datasets._parse_csv("flowering", ctx["paths"]["flowering"]), 1
+
+
+@case("datasets.parse.environment")
+def _(ctx):
+    return lambda: datasets._parse_csv("environment", ctx["paths"]["environment"]), 1
+
+
+@case("columnar.write.plants")
+def _(ctx):
+    frame = datasets._parse_csv("plants", ctx["paths"]["plants"])
+    return lambda: write_columnar(frame, os.path.join(WORK_DIR, "columnar"), "bench"), 1
+
+
+@case("columnar.read.plants")
+def _(ctx):
+    directory = os.path.join(WORK_DIR, "columnar")
+    write_columnar(datasets._parse_csv("plants", ctx["paths"]["plants"]), directory, "bench")
+    return lambda: read_columnar(directory, "bench"), 1
+
+
+@case("filters.build")
+def _(ctx):
+    return lambda: PlantFilter(ctx["plants"]), 1
+
+
+@case("filters.query.cold")
+def _(ctx):
+    engine = PlantFilter(ctx["plants"])
+
+    def run():
+        engine._cache.clear()
+        engine._name_matches.clear()
+        engine.positions("ro", ["Sandy", "Loamy"], ["Low"])
+    return run, 1
+
+
+@case("filters.query.memoized")
+def _(ctx):
+    engine = PlantFilter(ctx["plants"])
+    engine.positions("ro", ["Sandy", "Loamy"], ["Low"])
+    return lambda: engine.positions("ro", ["Sandy", "Loamy"], ["Low"]), 1
+
+
+@case("name_index.build")
+def _(ctx):
+    return lambda: NameIndex({"plants": ctx["plants"], "flowering": ctx["flowering"]}), 1
+
+
+@case("search.build")
+def _(ctx):
+    return lambda: SearchIndex.from_frames({"plants": ctx["plants"]}), 1
+
+
+@case("search.suggest.typo")
+def _(ctx):
+    index = SearchIndex.from_frames({"plants": ctx["plants"]})
+    queries = [name[:2] + name[3:] for name in ctx["sample_names"][:100]]  # one deleted character
+    return lambda: [index.suggest(query) for query in queries], len(queries)
+
+
+@case("phenology.parse")
+def _(ctx):
+    return lambda: PhenologyStore.from_frame(ctx["flowering"]), 1
+
+
+@case("phenology.season_counts")
+def _(ctx):
+    masks = PhenologyStore.from_frame(ctx["flowering"]).flowering_mask
+    return lambda: season_counts(masks), 1
+
+
+@case("seasons.score")
+def _(ctx):
+    environment = datasets.prepare_environment(ctx["environment"].copy())
+    ranges = ideal_ranges_from_catalog(datasets._prepare_plants(ctx["plants"].copy()))
+    return lambda: compute_season_scores(environment, ranges), 1
+
+
+@case("growth.batch")
+def _(ctx):
+    plants = ctx["plants"]
+    rng = np.random.default_rng(0)
+    readings = pd.DataFrame({
+        "Plant Name": plants["Plant Name"].to_numpy(),
+        "Sunlight Hours": plants["Sunlight Hours"].to_numpy() + rng.integers(-2, 3, len(plants)),
+        "Soil Type": plants["Soil Type"].sample(frac=1, random_state=0).to_numpy(),
+        "Height (cm)": plants["Height (cm)"].to_numpy() * rng.uniform(0.5, 1.5, len(plants)),
+    })
+    ideal = ideal_table(plants)
+    return lambda: analyze_growth_batch(readings, ideal), 1
+
+
+@case("schedule.table")
+def _(ctx):
+    scores = compute_season_scores(datasets.prepare_environment(ctx["environment"].copy()))
+    plants = datasets._prepare_plants(ctx["plants"].copy())
+    return lambda: CareTable(plants, scores.table), 1
+
+
+@case("schedule.plan.90d")
+def _(ctx):
+    scores = compute_season_scores(datasets.prepare_environment(ctx["environment"].copy()))
+    table = CareTable(datasets._prepare_plants(ctx["plants"].copy()), scores.table)
+    rng = np.random.default_rng(0)
+    pots = pd.DataFrame({
+        "Plant Name": ctx["plants"]["Plant Name"].to_numpy(),
+        "Last Watered": pd.Timestamp("2026-06-01") - pd.to_timedelta(rng.integers(0, 10, len(ctx["plants"])), "D"),
+        "Sunlight Hours": rng.integers(2, 12, len(ctx["plants"])),
+    })
+    # Chunked as the schedule command streams it
+    chunks = [pots.iloc[start:start + 10_000] for start in range(0, len(pots), 10_000)]
+    return lambda: [plan(chunk, table, "2026-06-01", 90) for chunk in chunks], 1
+
+
+@case("ingest.update")
+def _(ctx):
+    return lambda: SensorAggregates().update(ctx["environment"]), 1
+
+
+@case("datasets.load.cold")
+def _(ctx):
+    def run():
+        datasets.clear_cache()
+        for name in FILE_NAMES:
+            datasets.load_dataset(name)
+    return run, 1
+
+
+@case("analysis.find_plant")
+def _(ctx):
+    names = ctx["sample_names"]
+    find_plant(names[0])  # build the name index outside the timed runs
+    return lambda: [find_plant(name) for name in names], len(names)
+
+
+@case("analysis.flowering")
+def _(ctx):
+    names = ctx["sample_names"]
+    analyze_flowering(names[0])
+    return lambda: [analyze_flowering(name) for name in names], len(names)
+
+
+@case("analysis.environment")
+def _(ctx):
+    names = ctx["sample_names"]
+    analyze_environment(names[0])
+    return lambda: [analyze_environment(name) for name in names], len(names)
+
+
+def measure(run, repeat, memory):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        timings.append(time.perf_counter() - start)
+    peak = None
+    if memory:
+        tracemalloc.start()
+        try:
+            run()
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    return timings, peak
+
+
+def run_size(rows, names, repeat, memory, seed):
+    start = time.perf_counter()
+    tables = synthetic_tables(rows, seed)
+    paths = write_tables(os.environ["PLANT_CARE_DATA_DIR"], tables)
+    datasets.clear_cache()
+    print(f"\n{rows:,} rows (generated in {time.perf_counter() - start:.1f} s)")
+    sample = tables["plants"]["Plant Name"].sample(min(LOOKUPS, rows), random_state=seed)
+    ctx = dict(tables, paths=paths, sample_names=sample.tolist())
+
+    results = []
+    print(f"{'case':<30}{'best ms':>12}{'median ms':>12}{'per call µs':>13}{'peak MiB':>10}")
+    for name in names:
+        run, calls = CASES[name](ctx)
+        timings, peak = measure(run, repeat, memory)
+        best, median = min(timings), statistics.median(timings)
+        results.append({
+            "case": name, "rows": rows, "repeat": repeat, "calls": calls,
+            "best_ms": best * 1000, "median_ms": median * 1000, "per_call_us": best / calls * 1e6,
+            "peak_bytes": peak,
+        })
+        peak_text = f"{peak / 2**20:>10.1f}" if peak is not None else f"{'-':>10}"
+        print(f"{name:<30}{best * 1000:>12.2f}{median * 1000:>12.2f}{best / calls * 1e6:>13.1f}{peak_text}")
+    return results
+
+
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results, baseline_path):
+    with open(baseline_path, encoding="utf-8") as f:
+        baseline = {(row["case"], row["rows"]): row for row in json.load(f)["results"]}
+    print(f"\nvs {baseline_path} (ratio < 1 is faster)")
+    print(f"{'case':<30}{'rows':>12}{'best ratio':>12}{'peak ratio':>12}")
+    for row in results:
+        old = baseline.get((row["case"], row["rows"]))
+        if old is None:
+            continue
+        time_ratio = row["best_ms"] / old["best_ms"] if old["best_ms"] else float("nan")
+        peak_ratio = (row["peak_bytes"] / old["peak_bytes"]
+                      if row["peak_bytes"] and old.get("peak_bytes") else float("nan"))
+        print(f"{row['case']:<30}{row['rows']:>12,}{time_ratio:>12.2f}{peak_ratio:>12.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 100_000, 1_000_000])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--cases", nargs="+", default=[],
+                        help="only run cases whose name starts with one of these prefixes")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--no-memory", action="store_true", help="skip the tracemalloc run")
+    parser.add_argument("--output", help="results file (default: benchmarks/results/<timestamp>.json)")
+    parser.add_argument("--compare", help="earlier results file to compare against")
+    args = parser.parse_args()
+
+    names = [name for name in CASES if not args.cases or name.startswith(tuple(args.cases))]
+    if not names:
+        parser.error(f"no case matches {args.cases}; cases are: {', '.join(CASES)}")
+
+    started = datetime.datetime.now()
+    results = []
+    try:
+        for rows in args.sizes:
+            results.extend(run_size(rows, names, args.repeat, not args.no_memory, args.seed))
+    finally:
+        shutil.rmtree(WORK_DIR, ignore_errors=True)
+
+    output = args.output or os.path.join(RESULTS_DIR, f"{started:%Y%m%d-%H%M%S}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump({
+            "started_at": started.isoformat(timespec="seconds"),
+            "commit": git_commit(),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "pandas": pd.__version__,
+            "machine": platform.platform(),
+            "cpus": os.cpu_count(),
+            "seed": args.seed,
+            "results": results,
+        }, f, indent=1)
+    print(f"\nresults written to {output}")
+    if args.compare:
+        compare(results, args.compare)
+
+
+if __name__ == "__main__":
+    main()
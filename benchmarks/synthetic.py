@@ -0,0 +1,205 @@
+"""Synthetic plant_data / plant_flowering_fruiting / environment_data tables.
+
+The bundled CSVs hold ~30 plants; these generators produce the same columns
+and value formats at any size (1k to 10M rows) so the data paths can be
+benchmarked at scale. Distributions follow the real data: soil types and
+watering needs are weighted like the catalog, temperature ranges are
+"<low>-<high>°C" strings, about 60% of plants flower, month ranges are
+contiguous "March-June" / "All Year" / "N/A", and sensor readings vary by
+season around each plant's own baseline. Every value is drawn from a seeded
+generator, so a given (rows, seed) always yields the same tables.
+
+Usage:
+    python benchmarks/synthetic.py OUTPUT_DIR [--rows 100000] [--seed 0]
+"""
+
+import argparse
+import os
+
+import numpy as np
+import pandas as pd
+
+SOIL_TYPES = ["Loamy", "Sandy", "Well-drained", "Bark-based", "Moist", "Moist soil", "Clay", "Peaty"]
+SOIL_WEIGHTS = [0.30, 0.15, 0.25, 0.05, 0.10, 0.05, 0.05, 0.05]
+WATERING = ["Low", "Moderate", "Regular", "Medium", "Frequent"]
+WATERING_WEIGHTS = [0.25, 0.35, 0.15, 0.15, 0.10]
+GROWTH_RATES = ["Slow", "Medium", "Fast"]
+GROWTH_WEIGHTS = [0.35, 0.45, 0.20]
+GENERA = ["Rose", "Tulip", "Cactus", "Orchid", "Fern", "Palm", "Lily", "Basil", "Ivy", "Aloe",
+          "Begonia", "Daisy", "Jasmine", "Lavender", "Pothos", "Croton", "Dracaena", "Peperomia"]
+
+MONTH_NAMES = ["January", "February", "March", "April", "May", "June",
+               "July", "August", "September", "October", "November", "December"]
+# Season names used in the "... Season" columns, by month
+_MONTH_SEASON = ["Winter", "Winter", "Spring", "Spring", "Spring", "Summer",
+                 "Summer", "Summer", "Fall", "Fall", "Fall", "Winter"]
+HEIGHT_SEASONS = ["Spring", "Summer", "Fall", "Winter"]
+SOIL_NUTRIENTS = ["Rich in Phosphorus & Potassium", "Well-Drained", "Sandy & Low-Nutrient", "Nitrogen-Rich",
+                  "Moderate Nutrient", "Low Nutrient", "High Organic Matter", "Moist & Rich"]
+LEAF_COLORS = ["Dark Green", "Green", "Light Green", "Deep Green", "Thick Green", "Glossy Green",
+               "Bright Green", "Silvery Green", "Yellow", "Brown Edges", "Green with White Stripes"]
+LEAF_COLOR_WEIGHTS = [0.22, 0.18, 0.12, 0.10, 0.08, 0.08, 0.08, 0.04, 0.04, 0.03, 0.03]
+
+ENV_SEASONS = ["Monsoon", "Spring", "Summer", "Winter"]
+# Offset from a plant's baseline per season: temperature (°C), humidity (%), AQI
+_SEASON_SHIFT = np.array([[2.0, 20.0, -5.0], [0.0, 0.0, 0.0], [6.0, -10.0, 10.0], [-8.0, 5.0, 15.0]])
+
+FLOWERING_SHARE = 0.6
+FRUITING_SHARE = 0.3
+ALL_YEAR_SHARE = 0.05
+
+
+def plant_names(rows, seed=0):
+    """``rows`` names "<Genus> <variety number>" (duplicates possible, like a real catalog)."""
+    rng = np.random.default_rng(seed)
+    genus = rng.choice(GENERA, rows)
+    variety = rng.integers(0, rows, rows).astype(str)
+    return pd.Series(genus, dtype=object) + " " + variety
+
+
+def synthetic_catalog(rows, seed=0):
+    """plant_data.csv with ``rows`` plants."""
+    rng = np.random.default_rng(seed + 1)
+    temp_low = rng.integers(8, 22, rows)
+    height = np.clip(rng.lognormal(np.log(80), 0.8, rows), 5, 2000).round()
+    return pd.DataFrame({
+        "Plant Name": plant_names(rows, seed),
+        "Soil Type": rng.choice(SOIL_TYPES, rows, p=SOIL_WEIGHTS),
+        "Watering": rng.choice(WATERING, rows, p=WATERING_WEIGHTS),
+        "Temperature": _ranges(temp_low, temp_low + rng.integers(6, 15, rows), "°C"),
+        "Sunlight Hours": np.clip(rng.normal(6, 1.5, rows).round(), 2, 12).astype(np.int64),
+        "Growth Rate": rng.choice(GROWTH_RATES, rows, p=GROWTH_WEIGHTS),
+        "Height (cm)": height.astype(np.int64),
+    })
+
+
+def _ranges(low, high, suffix=""):
+    return pd.Series(low.astype(str), dtype=object) + "-" + high.astype(str) + suffix
+
+
+def _month_ranges(rng, active):
+    """Month range text and season text for each row (N/A where not ``active``)."""
+    n = len(active)
+    start = rng.integers(0, 12, n)
+    length = rng.integers(1, 5, n)
+    end = (start + length - 1) % 12
+    # Every (start, end) pair formats the same way, so format the 144 pairs once
+    months = np.array([[first if a == b else f"{first}-{MONTH_NAMES[b]}" for b in range(12)]
+                       for a, first in enumerate(MONTH_NAMES)], dtype=object)
+    seasons = np.array([[_MONTH_SEASON[a] if _MONTH_SEASON[a] == _MONTH_SEASON[b]
+                         else f"{_MONTH_SEASON[a]}-{_MONTH_SEASON[b]}" for b in range(12)]
+                        for a in range(12)], dtype=object)
+    month_text = months[start, end]
+    season_text = seasons[start, end]
+    all_year = active & (rng.random(n) < ALL_YEAR_SHARE)
+    month_text[all_year] = season_text[all_year] = "All Year"
+    month_text[~active] = season_text[~active] = "N/A"
+    return month_text, season_text
+
+
+def _seasonal_heights(rng, rows, pool_size=4096):
+    """"30-90 (Spring) | 50-120 (Summer)" strings drawn from a pool of realistic values."""
+    pool = []
+    for _ in range(pool_size):
+        low = int(rng.integers(10, 120))
+        if rng.random() < 0.3:
+            pool.append(f"{low}-{low * int(rng.integers(2, 6))} (All Year)")
+            continue
+        first = int(rng.integers(0, len(HEIGHT_SEASONS) - 1))
+        parts = []
+        for season in HEIGHT_SEASONS[first:first + int(rng.integers(1, 3))]:
+            parts.append(f"{low}-{low + int(rng.integers(20, 200))} ({season})")
+            low += int(rng.integers(10, 60))
+        pool.append(" | ".join(parts))
+    return np.array(pool, dtype=object)[rng.integers(0, pool_size, rows)]
+
+
+def synthetic_flowering(rows, seed=0):
+    """plant_flowering_fruiting.csv for the first ``rows`` names of :func:`plant_names`."""
+    rng = np.random.default_rng(seed + 2)
+    flowering = rng.random(rows) < FLOWERING_SHARE
+    fruiting = rng.random(rows) < FRUITING_SHARE
+    flowering_months, flowering_season = _month_ranges(rng, flowering)
+    fruiting_months, fruiting_season = _month_ranges(rng, fruiting)
+    return pd.DataFrame({
+        "Plant Name": plant_names(rows, seed),
+        "Flowering": np.where(flowering, "Yes", "No"),
+        "Fruiting": np.where(fruiting, "Yes", "No"),
+        "Flowering Season": flowering_season,
+        "Fruiting Season": fruiting_season,
+        "Soil Nutrient": rng.choice(SOIL_NUTRIENTS, rows),
+        "Leaf Color": rng.choice(LEAF_COLORS, rows, p=LEAF_COLOR_WEIGHTS),
+        "Flowering Months": flowering_months,
+        "Fruiting Months": fruiting_months,
+        "Height Based on Season (cm)": _seasonal_heights(rng, rows),
+    })
+
+
+def synthetic_environment(rows, plants=None, seed=0):
+    """environment_data.csv with ``rows`` readings of ``plants`` catalog names.
+
+    Readings are skewed towards popular plants (Zipf-like), and each plant's
+    readings scatter around its own baseline shifted by season.
+    """
+    rng = np.random.default_rng(seed + 3)
+    names = plant_names(max(1, rows // 4), seed) if plants is None else pd.Series(plants, dtype=object)
+    unique_names = names.drop_duplicates().to_numpy()
+    popularity = 1 / np.arange(1, len(unique_names) + 1) ** 0.8
+    plant = rng.choice(len(unique_names), rows, p=popularity / popularity.sum())
+    season = rng.integers(0, len(ENV_SEASONS), rows)
+
+    baseline = np.column_stack([
+        rng.normal(22, 4, len(unique_names)),
+        rng.normal(60, 10, len(unique_names)),
+        rng.gamma(4, 12, len(unique_names)),
+    ])
+    readings = baseline[plant] + _SEASON_SHIFT[season] + rng.normal(0, [2.0, 6.0, 8.0], (rows, 3))
+    return pd.DataFrame({
+        "Plant Name": unique_names[plant],
+        "Season": np.array(ENV_SEASONS, dtype=object)[season],
+        "Temperature (°C)": readings[:, 0].round().astype(np.int64),
+        "Humidity (%)": np.clip(readings[:, 1], 5, 100).round().astype(np.int64),
+        "AQI": np.clip(readings[:, 2], 0, 500).round().astype(np.int64),
+    })
+
+
+def synthetic_tables(rows, seed=0):
+    """{"plants", "flowering", "environment"} frames of ``rows`` rows each, sharing plant names."""
+    plants = synthetic_catalog(rows, seed)
+    return {
+        "plants": plants,
+        "flowering": synthetic_flowering(rows, seed),
+        "environment": synthetic_environment(rows, plants["Plant Name"], seed),
+    }
+
+
+# Dataset name -> CSV file name, as in plant_care.datasets.DATASETS
+FILE_NAMES = {
+    "plants": "plant_data.csv",
+    "flowering": "plant_flowering_fruiting.csv",
+    "environment": "environment_data.csv",
+}
+
+
+def write_tables(directory, tables):
+    """Write :func:`synthetic_tables` output as the app's CSVs; returns {name: path}."""
+    os.makedirs(directory, exist_ok=True)
+    paths = {}
+    for name, frame in tables.items():
+        paths[name] = os.path.join(directory, FILE_NAMES[name])
+        frame.to_csv(paths[name], index=False)
+    return paths
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("output_dir", help="directory for the three CSVs (usable as PLANT_CARE_DATA_DIR)")
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    for name, path in write_tables(args.output_dir, synthetic_tables(args.rows, args.seed)).items():
+        print(f"{name:<12}{path}")
+
+
+if __name__ == "__main__":
+    main()
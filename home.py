@@ -1,60 +1,79 @@
 import streamlit as st
-import pandas as pd
-import os
-from PIL import Image
+import math
 
-# Load plant dataset
-df = pd.read_csv("plant_data.csv")
+from plant_care.analysis import plant_details
+from plant_care.favorites import UserFavorites, get_favorites_store, user_key
+from plant_care.filters import get_plant_filter
+from plant_care.instrumentation import span
+from plant_care.search import get_search_index
+from plant_care.thumbnails import get_thumbnails, image_path
+from plant_care.views import counts
 
-# Folder containing plant images
-IMAGE_FOLDER = "plant_images"
+# Plant catalog, parsed once per process and pre-encoded for filtering
+plant_filter = get_plant_filter()
+
+# Plants shown per page of the plant list
+PAGE_SIZE_OPTIONS = [9, 18, 36]
 
 def fetch_image(plant_name):
-    """Fetch plant image from local storage."""
-    img_filename = f"{plant_name.lower().replace(' ', '_')}.jpg"
-    img_path = os.path.join(IMAGE_FOLDER, img_filename)
-    
-    # Check if the image file exists before returning
-    if os.path.exists(img_path) and os.path.getsize(img_path) > 0:
-        return img_path
-    return None  # Return None if image is missing
+    """Fetch the full-size plant image path from local storage (detail view only)."""
+    return image_path(plant_name)  # None if the image is missing
 
 # Streamlit UI
 # st.title("Plant Care Analysis")
 st.markdown("<h1 style='text-align: center; color: darkgreen;'>🌱 Plant Care Analysis </h1>", unsafe_allow_html=True)
 st.sidebar.header("🔍 Search & Filter Plants")
 
-search_query = st.sidebar.text_input("Enter plant name")
+search_query = st.sidebar.text_input("Enter plant name", key="search_query")
 
 # Filters
 st.sidebar.markdown("<hr style='border: dashed 1px #A9A9A9;'>", unsafe_allow_html=True)
-soil_filter = st.sidebar.multiselect("🌎 Select Soil Type", df["Soil Type"].unique())
-water_filter = st.sidebar.multiselect("💧 Select Watering Needs", df["Watering"].unique())
+# Plants per option come from the precomputed distribution views (plant_care/views.py)
+soil_counts, water_counts = counts("soil_counts"), counts("watering_counts")
+soil_filter = st.sidebar.multiselect("🌎 Select Soil Type", plant_filter.soil_options,
+                                     format_func=lambda soil: f"{soil} ({soil_counts.get(soil, 0)})")
+water_filter = st.sidebar.multiselect("💧 Select Watering Needs", plant_filter.water_options,
+                                      format_func=lambda water: f"{water} ({water_counts.get(water, 0)})")
 st.sidebar.markdown("<hr style='border: dashed 1px #A9A9A9;'>", unsafe_allow_html=True)
 
-def filter_plants(df):
-    if search_query:
-        df = df[df['Plant Name'].str.contains(search_query, case=False, na=False)]
-    if soil_filter:
-        df = df[df['Soil Type'].isin(soil_filter)]
-    if water_filter:
-        df = df[df['Watering'].isin(water_filter)]
-    return df
+def use_suggestion(name):
+    """Replace the search text with a suggested plant name."""
+    st.session_state["search_query"] = name
+
+def filter_plants():
+    """Row positions of the matching plants (one memoized mask, see plant_care/filters.py)."""
+    return plant_filter.positions(search_query, soil_filter, water_filter)
 
-# Sidebar button to open plant.py
+# Sidebar button to open the plant health page (same app and session, see app.py)
 st.sidebar.header(" How's Your Plant?")
 if st.sidebar.button("Check Your Plant 🌱"):
-    os.system("streamlit run plant.py")
+    st.switch_page("plant.py")
 
 st.sidebar.markdown("<hr style='border: dashed 1px #A9A9A9;'>", unsafe_allow_html=True)
+# Favorites persist across sessions (see plant_care/favorites.py). Logged-in users (st.login) get their
+# own list; otherwise ?user=... is only a label that keeps lists apart, not access control: anyone who
+# knows a label can read and change that list
+visitor = user_key(st.user.get("email") if st.user.get("is_logged_in") else None, st.query_params.get("user"))
+if "favorites" not in st.session_state or st.session_state["favorites"].user != visitor:
+    st.session_state["favorites"] = UserFavorites(get_favorites_store(), visitor)
+favorites = st.session_state["favorites"]
+
 # Check if a plant is selected
 if "selected_plant" not in st.session_state:
     st.session_state["selected_plant"] = None
 
+# Pagination state for the plant list
+if "page_size" not in st.session_state:
+    st.session_state["page_size"] = PAGE_SIZE_OPTIONS[0]
+if "page" not in st.session_state:
+    st.session_state["page"] = 0
+if "list_key" not in st.session_state:
+    st.session_state["list_key"] = None
+
 # If a plant is selected, show only that plant
 if st.session_state["selected_plant"]:
     selected_plant = st.session_state["selected_plant"]
-    plant_details = df[df['Plant Name'] == selected_plant].iloc[0]
+    details = plant_details(selected_plant)
     
     # Display the selected plant image
     # st.subheader(f"Details for {selected_plant}")
@@ -66,48 +85,65 @@ if st.session_state["selected_plant"]:
     else:
         st.write("Image not available")
 
-    # Display plant details
-    st.markdown(f"""
-    <div style="background-color: #f0f7f4; padding: 10px; border-radius: 10px;">
-    <p><strong>🟢 Soil Type:</strong> <span style="color: #008000;">{plant_details['Soil Type']}</span></p>
-    <p><strong>💦 Watering Needs:</strong> <span style="color: #1E90FF;">{plant_details['Watering']}</span></p>
-    <p><strong>🌡 Temperature Range:</strong> <span style="color: #FF4500;">{plant_details['Temperature']}</span></p>
-    <p><strong>☀ Sunlight Hours:</strong> <span style="color: #FFD700;">{plant_details['Sunlight Hours']}</span> hours/day</p>
-    <p><strong>📈 Growth Rate:</strong> <span style="color: #8B0000;">{plant_details['Growth Rate']}</span></p>
-    <p><strong>🌿 Height of the Plant (in cm):</strong> <span style="color: #4B0082;">{plant_details['Height (cm)']}</span></p>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    # Favorite button
-    if st.button("Save to Favorites"):
-        if "favorites" not in st.session_state:
-            st.session_state["favorites"] = []
-        if selected_plant not in st.session_state["favorites"]:
-            st.session_state["favorites"].append(selected_plant)
-            st.success(f"{selected_plant} added to favorites!")
+    # The plant may have left the catalog since it was selected (plant_data.csv reloaded)
+    if details is None:
+        st.error("❌ Plant not found in the dataset.")
+    else:
+        # Display plant details (the card's fields come from plant_care.analysis.plant_details)
+        rows = "".join(f'<p><strong>{label}:</strong> <span style="color: {color};">{value}</span></p>'
+                       for label, value, color in details.lines)
+        st.markdown(f'<div style="background-color: #f0f7f4; padding: 10px; border-radius: 10px;">{rows}</div>',
+                    unsafe_allow_html=True)
+
+        # Favorite button
+        if st.button("Save to Favorites"):
+            if favorites.add(selected_plant):
+                st.success(f"{selected_plant} added to favorites!")
 
     # Button to go back to full plant list
     if st.button("Back to Plant List"):
         st.session_state["selected_plant"] = None
         st.rerun()  # Updated from st.experimental_rerun()
 
-# If no plant is selected, show the full plant list
+# If no plant is selected, show the plant list one page at a time
 else:
-    filtered_df = filter_plants(df)
+    with span("home.filter"):
+        matches = filter_plants()
     st.subheader("Plant List")
+
+    # Nothing matched the search text: offer the closest plant names
+    if search_query and len(matches) == 0:
+        suggestions = get_search_index().suggest(search_query, limit=3, table="plants")
+        if suggestions:
+            st.write(f"No plants match \"{search_query}\". Did you mean:")
+            for col, suggestion in zip(st.columns(len(suggestions)), suggestions):
+                col.button(suggestion.name, key=f"suggest_{suggestion.key}",
+                           on_click=use_suggestion, args=(suggestion.name,))
+
+    # Go back to the first page whenever the search, filters or page size change
+    list_key = (search_query, tuple(soil_filter), tuple(water_filter), st.session_state["page_size"])
+    if st.session_state["list_key"] != list_key:
+        st.session_state["list_key"] = list_key
+        st.session_state["page"] = 0
+
+    page_size = st.session_state["page_size"]
+    page_count = max(1, math.ceil(len(matches) / page_size))
+    page = min(st.session_state["page"], page_count - 1)
+    start = page * page_size
+
+    # Only the visible slice gets images and widgets
+    page_df = plant_filter.frame.iloc[matches[start:start + page_size]]
     cols = st.columns(3)
 
-    for i, row in filtered_df.iterrows():
+    # Thumbnails for the whole page are loaded concurrently; full images are decoded in the detail view
+    plant_names = page_df["Plant Name"].tolist()
+    with span("home.thumbnails"):
+        thumbnails = get_thumbnails(plant_names)
+
+    for i, (plant_name, thumbnail) in enumerate(zip(plant_names, thumbnails)):
         with cols[i % 3]:
-            plant_name = row["Plant Name"]
-            img_path = fetch_image(plant_name)
-
-            if img_path:
-                try:
-                    img = Image.open(img_path)
-                    st.image(img, caption=plant_name, use_container_width=True)
-                except Exception:
-                    st.write("Error loading image")
+            if thumbnail:
+                st.image(thumbnail, caption=plant_name, use_container_width=True)
             else:
                 st.write("Image not available")
 
@@ -116,10 +152,28 @@ else:
                 st.session_state["selected_plant"] = plant_name
                 st.rerun()  # Updated from st.experimental_rerun()
 
+    # Pagination controls
+    st.markdown("---")
+    prev_col, info_col, next_col = st.columns([1, 2, 1])
+    with prev_col:
+        if st.button("⬅ Previous", disabled=page == 0):
+            st.session_state["page"] = page - 1
+            st.rerun()
+    with info_col:
+        st.markdown(f"<p style='text-align: center;'>Page {page + 1} of {page_count} ({len(matches)} plants)</p>", unsafe_allow_html=True)
+    with next_col:
+        if st.button("Next ➡", disabled=page >= page_count - 1):
+            st.session_state["page"] = page + 1
+            st.rerun()
+    st.selectbox("Plants per page", PAGE_SIZE_OPTIONS, key="page_size")
+
 # Display Favorite Plants in Sidebar
 st.sidebar.subheader("🌟 Favorite Plants")
-if "favorites" in st.session_state and st.session_state["favorites"]:
-    for fav in st.session_state["favorites"]:
+if favorites.save_error:
+    st.sidebar.warning(f"⚠️ Some favorite changes could not be saved and will be lost on restart "
+                       f"({favorites.save_error}).")
+if favorites:
+    for fav in favorites:
        st.sidebar.markdown(f"✅ {fav}")
 else:
     st.sidebar.write("No favorite plants added yet.")
@@ -0,0 +1,3 @@
+from plant_care.cli import main
+
+main()
@@ -0,0 +1,265 @@
+"""Headless growth, flowering and environment analyses.
+
+These functions hold everything plant.py used to compute inline between
+``st.*`` calls. They take plain inputs, return frozen dataclasses and never
+import streamlit or matplotlib, so they can be benchmarked, run in worker
+pools or served from anything else. plant.py only renders their results.
+"""
+
+from dataclasses import dataclass, field
+from typing import Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from plant_care.growth import score_reading
+from plant_care.name_index import get_name_index, normalize_name
+from plant_care.phenology import get_phenology, month_flags
+from plant_care.seasons import SeasonScores
+from plant_care.views import get_season_scores, get_view
+
+# Leaf colors a user can report in the condition check, with their diagnosis
+LEAF_ISSUES = {
+    "Yellow": {"cause": "Poor Nutrient Absorption (Nitrogen, Iron, Magnesium Deficiency)",
+               "effect": "Weak growth, delayed flowering, reduced fruit production",
+               "solution": "Add balanced fertilizers and ensure proper soil pH",
+               "color": "yellow"},
+    "Brown": {"cause": "Overwatering/Underwatering",
+              "effect": "Root rot or dehydration causing stress",
+              "solution": "Adjust watering and check drainage",
+              "color": "brown"},
+    "Drooping": {"cause": "Root Issues (Overwatering, Poor Aeration, Fungal Infections)",
+                 "effect": "Weak stem support, reducing flowering",
+                 "solution": "Improve soil drainage and avoid waterlogging",
+                 "color": "gray"},
+    "Dark Green": {"cause": "Excess Nitrogen",
+                   "effect": "Promotes leafy growth but inhibits flowering",
+                   "solution": "Reduce nitrogen and increase phosphorus & potassium",
+                   "color": "green"},
+    "Purplish": {"cause": "Phosphorus Deficiency",
+                 "effect": "Weak root development, poor fruit set",
+                 "solution": "Use phosphorus-rich fertilizers like bone meal",
+                 "color": "purple"},
+}
+
+# Catalog leaf colors with a care note: color -> (level, message)
+LEAF_COLOR_NOTES = {
+    "Yellow": ("warning", "Yellow leaves may indicate nutrient deficiency (e.g., nitrogen, iron). Consider adding fertilizers."),
+    "Brown": ("warning", "Brown leaves may indicate overwatering or root rot. Check soil drainage."),
+    "Dark Green": ("success", "Dark green leaves indicate healthy growth. Maintain current care routine."),
+    "Light Green": ("warning", "Light green leaves may indicate insufficient sunlight or nutrients."),
+}
+
+GROWTH_CATEGORIES = ("Sunlight (Hours)", "Soil Type", "Height (cm)")
+
+
+@dataclass(frozen=True)
+class GrowthInput:
+    """A user's (or sensor's) growth conditions for one plant."""
+
+    plant_name: str
+    sunlight_hours: float
+    soil_type: str
+    height_cm: float
+
+
+@dataclass(frozen=True)
+class GrowthResult:
+    """Reading vs ideal conditions, growth class and recommendation codes."""
+
+    plant_key: str
+    ideal_sunlight: int
+    ideal_soil: str
+    ideal_height: int
+    user_values: Tuple[float, float, float]
+    ideal_values: Tuple[float, float, float]
+    deviation: float
+    growth_rate: str
+    sunlight_advice: str
+    soil_advice: str
+    height_advice: str
+    categories: Tuple[str, ...] = GROWTH_CATEGORIES
+
+
+@dataclass(frozen=True)
+class FloweringResult:
+    """Flowering/fruiting profile of one plant."""
+
+    plant_key: str
+    flowering: bool
+    fruiting: bool
+    flowering_type: str
+    flowering_season: str
+    fruiting_season: str
+    soil_nutrient: str
+    leaf_color: str
+    flowering_months: Tuple[int, ...]
+    fruiting_months: Tuple[int, ...]
+    best_flowering_season: str
+    best_fruiting_season: str
+    height_seasons: Tuple[str, ...]
+    height_min: Tuple[int, ...]
+    height_max: Tuple[int, ...]
+    problems: Tuple[str, ...] = field(default_factory=tuple)
+
+    @property
+    def leaf_color_note(self) -> Optional[Tuple[str, str]]:
+        """(level, message) care note for the catalog leaf color, if any."""
+        return LEAF_COLOR_NOTES.get(self.leaf_color)
+
+
+@dataclass(frozen=True)
+class EnvironmentResult:
+    """Per-season environment means and scores of one plant."""
+
+    plant_key: str
+    seasons: Tuple[str, ...]
+    temperature: Tuple[float, ...]
+    humidity: Tuple[float, ...]
+    aqi: Tuple[float, ...]
+    scores: Tuple[float, ...]
+    best_season: str
+
+
+@dataclass(frozen=True)
+class PlantDetails:
+    """Catalog care card of one plant (home.py's detail view, the dossier's first section)."""
+
+    name: str
+    soil_type: str
+    watering: str
+    temperature: str
+    sunlight_hours: str
+    growth_rate: str
+    height_cm: str
+
+    @property
+    def lines(self) -> Tuple[Tuple[str, str, str], ...]:
+        """(label, value, color) rows of the card, in display order."""
+        return (
+            ("🟢 Soil Type", self.soil_type, "#008000"),
+            ("💦 Watering Needs", self.watering, "#1E90FF"),
+            ("🌡 Temperature Range", self.temperature, "#FF4500"),
+            ("☀ Sunlight Hours", f"{self.sunlight_hours} hours/day", "#FFD700"),
+            ("📈 Growth Rate", self.growth_rate, "#8B0000"),
+            ("🌿 Height of the Plant (in cm)", self.height_cm, "#4B0082"),
+        )
+
+
+def find_plant(plant_name: str) -> Optional[pd.Series]:
+    """Catalog row (plant_data.csv) for a plant name, or None."""
+    return get_name_index().row("plants", plant_name)
+
+
+def plant_details(plant_name: str) -> Optional[PlantDetails]:
+    """Care card of a catalog plant, or None if it is not in plant_data.csv."""
+    row = find_plant(plant_name)
+    if row is None:
+        return None
+    return PlantDetails(
+        name=str(row["Plant Name"]),
+        soil_type=str(row["Soil Type"]),
+        watering=str(row["Watering"]),
+        temperature=str(row["Temperature"]),
+        sunlight_hours=str(row["Sunlight Hours"]),
+        growth_rate=str(row["Growth Rate"]),
+        height_cm=str(row["Height (cm)"]),
+    )
+
+
+def analyze_growth(reading: GrowthInput) -> Optional[GrowthResult]:
+    """Compare a reading with the plant's ideal conditions (None if unknown).
+
+    Raises ``KeyError`` if the catalog row lacks an ideal-condition column.
+    """
+    plant_details = find_plant(reading.plant_name)
+    if plant_details is None:
+        return None
+    result = score_reading(plant_details, reading.sunlight_hours, reading.soil_type, reading.height_cm)
+    return GrowthResult(
+        plant_key=normalize_name(reading.plant_name),
+        ideal_sunlight=result["ideal_sunlight"],
+        ideal_soil=result["ideal_soil"],
+        ideal_height=result["ideal_height"],
+        user_values=(reading.sunlight_hours, result["user_soil_numeric"], reading.height_cm),
+        ideal_values=(result["ideal_sunlight"], result["ideal_soil_numeric"], result["ideal_height"]),
+        deviation=result["deviation"],
+        growth_rate=result["growth_rate"],
+        sunlight_advice=result["sunlight_advice"],
+        soil_advice=result["soil_advice"],
+        height_advice=result["height_advice"],
+    )
+
+
+def catalog_growth_rates() -> pd.DataFrame:
+    """Sunlight hours and numeric growth rate (1=Slow, 2=Medium, 3=Fast) per plant."""
+    return get_view("growth_rates")
+
+
+def flowering_type(flowering: bool, fruiting: bool) -> str:
+    if flowering and fruiting:
+        return "Flowering & Fruiting"
+    if flowering:
+        return "Flowering Only"
+    if fruiting:
+        return "Fruiting Only"
+    return "Neither Flowering nor Fruiting"
+
+
+def analyze_flowering(plant_name: str) -> Optional[FloweringResult]:
+    """Flowering/fruiting months, best seasons and seasonal heights (None if unknown)."""
+    key = normalize_name(plant_name)
+    plant_data = get_name_index().row("flowering", key)
+    phenology = get_phenology()
+    position = phenology.position(key)
+    if plant_data is None or position is None:
+        return None
+
+    flowering = bool(phenology.flowering[position])
+    fruiting = bool(phenology.fruiting[position])
+    seasons, height_min, height_max = phenology.season_heights(position)
+    return FloweringResult(
+        plant_key=key,
+        flowering=flowering,
+        fruiting=fruiting,
+        flowering_type=flowering_type(flowering, fruiting),
+        flowering_season=plant_data["Flowering Season"],
+        fruiting_season=plant_data["Fruiting Season"],
+        soil_nutrient=plant_data["Soil Nutrient"],
+        leaf_color=plant_data["Leaf Color"],
+        flowering_months=tuple(month_flags(phenology.flowering_mask[position]).tolist()),
+        fruiting_months=tuple(month_flags(phenology.fruiting_mask[position]).tolist()),
+        best_flowering_season=str(phenology.best_flowering_season[position]),
+        best_fruiting_season=str(phenology.best_fruiting_season[position]),
+        height_seasons=tuple(seasons),
+        height_min=tuple(height_min.tolist()),
+        height_max=tuple(height_max.tolist()),
+        problems=tuple(phenology.row_errors(position)),
+    )
+
+
+def analyze_environment(plant_name: str, season_scores: Optional[SeasonScores] = None) -> Optional[EnvironmentResult]:
+    """Season means, scores and best season (None if the plant has no readings).
+
+    Uses environment_data.csv unless other ``season_scores`` are given (e.g.
+    the streamed sensor aggregates of :mod:`plant_care.ingest`).
+    """
+    key = normalize_name(plant_name)
+    if season_scores is None:
+        season_scores = get_season_scores()
+    season_grouped = season_scores.for_plant(key)
+    if season_grouped.empty:
+        return None
+
+    def column(name):
+        return tuple(np.asarray(season_grouped[name], dtype=float).tolist())
+
+    return EnvironmentResult(
+        plant_key=key,
+        seasons=tuple(season_grouped.index),
+        temperature=column("temperature (°c)"),
+        humidity=column("humidity (%)"),
+        aqi=column("aqi"),
+        scores=column("score"),
+        best_season=season_scores.best_season(key),
+    )
@@ -0,0 +1,100 @@
+"""Chart drawing for the analysis views.
+
+Each ``draw_*`` function fills a blank ``matplotlib.figure.Figure`` from plain
+values, so charts can be rendered through :mod:`plant_care.figure_cache` (or
+anywhere else) without pyplot state. matplotlib/seaborn are only imported by
+the functions that need them.
+"""
+
+from plant_care.datasets import dataset_digest
+
+# Figure sizes used by the views
+GROWTH_SCATTER_SIZE = (8, 5)
+COMPARISON_SIZE = (6.4, 4.8)
+TRENDS_SIZE = (10, 5)
+ENVIRONMENT_SIZE = (6, 4)
+
+
+def chart_key(chart, plant=None, params=(), datasets=()):
+    """Cache key: chart type, plant, input parameters and dataset versions."""
+    return (chart, plant, tuple(params), tuple(dataset_digest(name) for name in datasets))
+
+
+def draw_growth_scatter(fig, sunlight_hours, growth_rate_num, plant_names):
+    """Sunlight hours vs growth rate for the whole catalog."""
+    import seaborn as sns
+
+    ax = fig.subplots()
+    sns.scatterplot(x=sunlight_hours, y=growth_rate_num,
+                    hue=plant_names, palette="viridis", s=150, alpha=0.8, ax=ax)
+    ax.set_xlabel("Sunlight Hours")
+    ax.set_ylabel("Growth Rate (1=Slow, 2=Medium, 3=Fast)")
+    ax.set_title("Sunlight Hours vs Growth Rate")
+    ax.legend(title="Plant Name", bbox_to_anchor=(1.05, 1), loc="upper left", ncol=2)
+    fig.tight_layout()
+
+
+def draw_growth_comparison(fig, categories, user_values, ideal_values):
+    """Side-by-side bars of the user's input and the ideal conditions."""
+    ax = fig.subplots()
+    bar_width = 0.3
+    index = range(len(categories))
+
+    ax.bar(index, user_values, bar_width, label="Your Input", color="blue")
+    ax.bar([i + bar_width for i in index], ideal_values, bar_width, label="Ideal Conditions", color="green")
+
+    ax.set_xlabel("Growth Factors")
+    ax.set_ylabel("Values (Numeric Scale)")
+    ax.set_title("Comparison: Your Input vs. Ideal Conditions")
+    ax.set_xticks([i + bar_width / 2 for i in index])
+    ax.set_xticklabels(categories)
+    ax.legend()
+
+
+def draw_month_trends(fig, title, months, flowering_flags, fruiting_flags):
+    """Flowering and fruiting months over the year."""
+    ax = fig.subplots()
+    ax.bar(months, flowering_flags, color="green", label="Flowering")
+    ax.bar(months, fruiting_flags, color="orange", alpha=0.7, label="Fruiting")
+    ax.set_xlabel("Months of the Year")
+    ax.set_ylabel("Number of Occurrences")
+    ax.set_title(title)
+    ax.legend()
+    ax.tick_params(axis="x", labelrotation=45)
+
+
+def draw_season_heights(fig, title, seasons, height_min, height_max):
+    """Min/max height range per season."""
+    ax = fig.subplots()
+    ax.bar(seasons, height_max, color="blue", alpha=0.6, label="Max Height")
+    ax.bar(seasons, height_min, color="green", alpha=0.6, label="Min Height")
+    ax.set_xlabel("Season")
+    ax.set_ylabel("Height (cm)")
+    ax.set_title(title)
+    ax.legend()
+    ax.tick_params(axis="x", labelrotation=45)
+
+
+def draw_temperature_pie(fig, seasons, temperatures):
+    """Share of the yearly temperature per season."""
+    ax = fig.subplots()
+    ax.pie(temperatures, labels=seasons, autopct='%1.1f%%', colors=['red', 'orange', 'yellow', 'pink'])
+    ax.set_title("🌡️ Temperature Distribution by Season")
+
+
+def draw_humidity_bars(fig, seasons, humidity):
+    """Mean humidity per season."""
+    ax = fig.subplots()
+    ax.bar(seasons, humidity, color=['blue', 'cyan', 'navy', 'skyblue'])
+    ax.set_xlabel("Season")
+    ax.set_ylabel("Humidity (%)")
+    ax.set_title("💧 Humidity Levels by Season")
+
+
+def draw_aqi_line(fig, seasons, aqi):
+    """Mean AQI per season."""
+    ax = fig.subplots()
+    ax.plot(seasons, aqi, marker='o', color='green', linestyle='-', linewidth=2)
+    ax.set_xlabel("Season")
+    ax.set_ylabel("Air Quality Index (AQI)")
+    ax.set_title("🌫️ AQI Trends Across Seasons")
@@ -0,0 +1,105 @@
+"""Chunked CSV/Parquet reading and writing for the batch commands.
+
+Inputs are streamed in fixed-size chunks so memory stays bounded no matter
+how large a readings file is; ``-`` means stdin/stdout (CSV only). Parquet
+support needs ``pyarrow``.
+"""
+
+import os
+import sys
+
+import pandas as pd
+
+DEFAULT_CHUNKSIZE = 100_000
+
+
+def _is_parquet(path):
+    return path != "-" and os.path.splitext(path)[1].lower() in (".parquet", ".pq")
+
+
+def _require_pyarrow():
+    try:
+        import pyarrow  # noqa: F401
+        import pyarrow.parquet
+    except ImportError as e:
+        raise RuntimeError("Parquet files need pyarrow: pip install pyarrow") from e
+    return pyarrow, pyarrow.parquet
+
+
+def read_chunks(path, chunksize=DEFAULT_CHUNKSIZE, columns=None):
+    """Yield DataFrames of at most ``chunksize`` rows from a CSV or Parquet file."""
+    if _is_parquet(path):
+        _, pq = _require_pyarrow()
+        parquet_file = pq.ParquetFile(path)
+        for batch in parquet_file.iter_batches(batch_size=chunksize, columns=columns):
+            yield batch.to_pandas()
+        return
+
+    source = sys.stdin if path == "-" else path
+    yield from pd.read_csv(source, chunksize=chunksize, usecols=columns)
+
+
+def _file_schema(schema, pa):
+    """The first chunk's ``schema`` widened so every later chunk can be cast to it.
+
+    Null-typed fields (columns that were all missing in the chunk) become
+    strings, and categoricals get int32 dictionary indices: pandas picks the
+    smallest index type for each chunk's categories, so a later chunk with
+    more categories would not fit int8 indices.
+    """
+    for index, schema_field in enumerate(schema):
+        field_type = schema_field.type
+        if pa.types.is_null(field_type):
+            schema = schema.set(index, schema_field.with_type(pa.string()))
+        elif pa.types.is_dictionary(field_type):
+            values = pa.string() if pa.types.is_null(field_type.value_type) else field_type.value_type
+            schema = schema.set(index, schema_field.with_type(pa.dictionary(pa.int32(), values)))
+    return schema
+
+
+class ChunkWriter:
+    """Append DataFrame chunks to one CSV or Parquet file.
+
+    Use as a context manager; the header (or Parquet schema) comes from the
+    first chunk written, widened so later chunks still fit it (see
+    :func:`_file_schema`).
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.rows = 0
+        self._parquet = _is_parquet(path)
+        self._writer = None
+        self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def write(self, chunk):
+        if self._parquet:
+            pa, pq = _require_pyarrow()
+            table = pa.Table.from_pandas(chunk, preserve_index=False)
+            if self._writer is None:
+                self._writer = pq.ParquetWriter(self.path, _file_schema(table.schema, pa))
+            self._writer.write_table(table.cast(self._writer.schema))
+        else:
+            if self._file is None:
+                self._file = sys.stdout if self.path == "-" else open(self.path, "w", newline="", encoding="utf-8")
+                chunk.to_csv(self._file, index=False)
+            else:
+                chunk.to_csv(self._file, index=False, header=False)
+        self.rows += len(chunk)
+
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        if self._file is not None:
+            if self._file is sys.stdout:
+                self._file.flush()
+            else:
+                self._file.close()
+            self._file = None
@@ -0,0 +1,380 @@
+"""Command-line entry point: ``python -m plant_care <command> ...``."""
+
+import argparse
+import os
+import sys
+import time
+
+from plant_care.chunked_io import DEFAULT_CHUNKSIZE
+from plant_care.datasets import DATASETS
+from plant_care.ingest import BLOCK, DEFAULT_MAX_PENDING, DROP, STATE_FILE
+from plant_care.ingest import DEFAULT_CHUNKSIZE as INGEST_CHUNKSIZE
+
+
+def _growth(args):
+    from plant_care.chunked_io import ChunkWriter, read_chunks
+    from plant_care.datasets import load_plant_data
+    from plant_care.growth import analyze_growth_batch, ideal_table
+
+    ideal = ideal_table(load_plant_data())
+    start = time.perf_counter()
+    with ChunkWriter(args.output) as writer:
+        for chunk in read_chunks(args.input, args.chunksize):
+            writer.write(analyze_growth_batch(chunk, ideal))
+    elapsed = time.perf_counter() - start
+    print(f"Scored {writer.rows:,} readings in {elapsed:.2f}s -> {args.output}", file=sys.stderr)
+
+
+def _seasons(args):
+    from plant_care.chunked_io import ChunkWriter
+    from plant_care.datasets import load_environment_data, load_plant_data
+    from plant_care.seasons import compute_season_scores, ideal_ranges_from_catalog
+
+    ideal_ranges = ideal_ranges_from_catalog(load_plant_data()) if args.catalog_ranges else None
+    scores = compute_season_scores(load_environment_data(), ideal_ranges)
+    table = scores.best.reset_index() if args.best else scores.table
+    with ChunkWriter(args.output) as writer:
+        writer.write(table)
+
+
+def _compile(args):
+    from plant_care.datasets import compile_dataset, compiled_path
+
+    unknown = sorted(set(args.datasets) - set(DATASETS))
+    if unknown:
+        sys.exit(f"unknown dataset(s): {', '.join(unknown)} (choose from {', '.join(DATASETS)})")
+    for name in args.datasets or list(DATASETS):
+        start = time.perf_counter()
+        meta = compile_dataset(name)
+        elapsed = time.perf_counter() - start
+        print(f"Compiled {name}: {meta['rows']:,} rows, {len(meta['columns'])} columns "
+              f"in {elapsed:.2f}s -> {compiled_path(name)}", file=sys.stderr)
+
+
+def _materialize(args):
+    from plant_care.views import VIEWS, refresh_views, view_path, view_stats
+
+    unknown = sorted(set(args.views) - set(VIEWS))
+    if unknown:
+        sys.exit(f"unknown view(s): {', '.join(unknown)} (choose from {', '.join(VIEWS)})")
+    start = time.perf_counter()
+    results = refresh_views(args.views or None)
+    elapsed = time.perf_counter() - start
+    stats = view_stats()
+    for name, result in results.items():
+        print(f"{name}: {stats[name]['rows']:,} rows ({result}) -> {view_path(name)}", file=sys.stderr)
+    print(f"Refreshed {len(results)} view(s) in {elapsed:.2f}s", file=sys.stderr)
+
+
+def _leaves(args):
+    import numpy as np
+    import pandas as pd
+
+    from plant_care.chunked_io import ChunkWriter
+    from plant_care.leaf_color import CACHE_SUBDIR, HUE_BINS, analyze_files, iter_image_files
+
+    histogram_columns = [f"hue_{i * 360 // HUE_BINS:03d}" for i in range(HUE_BINS)] if args.histogram else []
+
+    def row(path, result, error):
+        # Unreadable images keep every column (empty/NaN), so all chunks share one header and schema
+        if result is None:
+            fields = {
+                "path": path, "digest": "", "issue": "", "issues": "", "coverage": np.nan, "green": np.nan,
+                "yellow": np.nan, "brown": np.nan, "purplish": np.nan, "dark_green": np.nan, "cached": False,
+                "error": error,
+            }
+            fields.update(dict.fromkeys(histogram_columns, np.nan))
+            return fields
+        fields = {
+            "path": path, "digest": result.digest, "issue": result.primary_issue or "",
+            "issues": "; ".join(result.issues), "coverage": result.coverage, "green": result.green,
+            "yellow": result.yellow, "brown": result.brown, "purplish": result.purplish,
+            "dark_green": result.dark_green, "cached": result.cached, "error": "",
+        }
+        fields.update(zip(histogram_columns, result.hue_histogram))
+        return fields
+
+    cache_dir = None if args.no_cache else CACHE_SUBDIR
+    start = time.perf_counter()
+    rows, failed = [], 0
+    with ChunkWriter(args.output) as writer:
+        for path, result, error in analyze_files(iter_image_files(args.paths), args.workers, cache_dir):
+            failed += result is None
+            rows.append(row(path, result, error))
+            if len(rows) >= args.chunksize:
+                writer.write(pd.DataFrame(rows))
+                rows = []
+        if rows:
+            writer.write(pd.DataFrame(rows))
+    elapsed = time.perf_counter() - start
+    print(f"Analyzed {writer.rows:,} images in {elapsed:.2f}s ({failed:,} unreadable) -> {args.output}",
+          file=sys.stderr)
+
+
+def _diagnose(args):
+    import itertools
+
+    import pandas as pd
+
+    from plant_care.chunked_io import ChunkWriter, read_chunks
+    from plant_care.diagnosis import get_knowledge_base
+
+    kb = get_knowledge_base()
+
+    def diagnose_frame(frame, texts):
+        top, scores, leaf_issues, causes, symptoms = [], [], [], [], []
+        for text in texts:
+            found = kb.diagnose("" if pd.isna(text) else text, args.limit)
+            top.append(found[0].cause if found else "")
+            scores.append(found[0].score if found else 0)
+            leaf_issues.append((found[0].leaf_issue or "") if found else "")
+            causes.append("; ".join(f"{d.cause} ({d.score})" for d in found))
+            symptoms.append("; ".join(dict.fromkeys(s for d in found for s in d.symptoms)))
+        return frame.assign(top_cause=top, score=scores, leaf_issue=leaf_issues, causes=causes, symptoms=symptoms)
+
+    def chunks():
+        if os.path.splitext(args.input)[1].lower() in (".csv", ".parquet", ".pq"):
+            for chunk in read_chunks(args.input, args.chunksize):
+                if args.column not in chunk.columns:
+                    sys.exit(f"{args.input} has no {args.column!r} column (use --column)")
+                yield diagnose_frame(chunk, chunk[args.column].tolist())
+            return
+        # Plain text: one ticket per non-empty line (stdin is read but left open)
+        if args.input == "-":
+            yield from text_chunks(sys.stdin)
+            return
+        with open(args.input, encoding="utf-8", errors="replace") as source:
+            yield from text_chunks(source)
+
+    def text_chunks(source):
+        numbered = ((number, line.strip()) for number, line in enumerate(source, 1) if line.strip())
+        while batch := list(itertools.islice(numbered, args.chunksize)):
+            frame = pd.DataFrame(batch, columns=["line", "text"])
+            yield diagnose_frame(frame, frame["text"].tolist())
+
+    start = time.perf_counter()
+    matched = 0
+    with ChunkWriter(args.output) as writer:
+        for chunk in chunks():
+            matched += int((chunk["score"] > 0).sum())
+            writer.write(chunk)
+    elapsed = time.perf_counter() - start
+    print(f"Diagnosed {writer.rows:,} tickets ({matched:,} with a known symptom) against {len(kb.matcher):,} "
+          f"phrases in {elapsed:.2f}s -> {args.output}", file=sys.stderr)
+
+
+def _dossiers(args):
+    from plant_care.dossier import generate, read_readings
+
+    readings = read_readings(args.readings) if args.readings else None
+    start = time.perf_counter()
+    counts = {"written": 0, "skipped": 0, "failed": 0}
+    for key, status, path, error, seconds in generate(args.output_dir, args.plants or None, args.format,
+                                                      args.workers, readings, args.force, args.dpi):
+        counts[status] += 1
+        if error:
+            print(f"{key}: {error}", file=sys.stderr)
+        elif args.verbose and status == "written":
+            print(f"{key}: {seconds:.2f}s -> {path}", file=sys.stderr)
+    elapsed = time.perf_counter() - start
+    print(f"Wrote {counts['written']:,} dossiers, skipped {counts['skipped']:,} unchanged, "
+          f"{counts['failed']:,} failed in {elapsed:.2f}s -> {args.output_dir}", file=sys.stderr)
+    if counts["failed"]:
+        sys.exit(1)
+
+
+def _schedule(args):
+    import datetime
+
+    from plant_care.chunked_io import ChunkWriter
+    from plant_care.schedule import CareTable, plan_file
+
+    table = CareTable.load()
+    start_date = datetime.date.fromisoformat(args.start) if args.start else datetime.date.today()
+    start = time.perf_counter()
+    waterings = alerts = 0
+    try:
+        with ChunkWriter(args.output) as writer:
+            for calendar in plan_file(args.input, start_date, args.days, args.chunksize, table):
+                waterings += int(calendar["Water"].sum())
+                alerts += int((calendar["Alerts"] != "").sum())
+                writer.write(calendar)
+    except KeyError as e:
+        sys.exit(str(e.args[0]))
+    elapsed = time.perf_counter() - start
+    print(f"Planned {args.days} days from {start_date} ({waterings:,} waterings, {alerts:,} alert days) "
+          f"in {elapsed:.2f}s -> {args.output}", file=sys.stderr)
+
+
+def _ingest(args):
+    from plant_care.chunked_io import ChunkWriter
+    from plant_care.ingest import SensorAggregates, ingest
+
+    aggregates = None if args.reset else SensorAggregates.load(args.state)
+    aggregates = aggregates or SensorAggregates()
+    start = time.perf_counter()
+    try:
+        stats = ingest(args.sources, aggregates, chunksize=args.chunksize, max_pending=args.max_pending,
+                       on_full=args.on_full, follow=args.follow, poll_interval=args.poll_interval,
+                       state_path=args.state, checkpoint_interval=args.checkpoint_interval)
+    except KeyboardInterrupt:
+        stats = None  # --follow runs until interrupted; the state was saved on the way out
+    elapsed = time.perf_counter() - start
+    if stats is not None:
+        print(f"Ingested {stats['rows']:,} readings in {stats['chunks']:,} chunks in {elapsed:.2f}s "
+              f"({stats['dropped_rows']:,} dropped, max {stats['max_pending']} chunks pending)", file=sys.stderr)
+    print(f"{len(aggregates.table):,} (plant, season) aggregates over {aggregates.rows:,} readings -> {args.state}",
+          file=sys.stderr)
+    if args.output:
+        with ChunkWriter(args.output) as writer:
+            writer.write(aggregates.summary())
+
+
+def _positive_int(value):
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="python -m plant_care", description="Plant Care Analysis batch tools")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    growth = commands.add_parser(
+        "growth",
+        help="score growth-condition readings against the catalog",
+        description="Score (Plant Name, Sunlight Hours, Soil Type, Height (cm)) readings "
+        "from a CSV/Parquet file and write deviation, growth rate and recommendation codes.",
+    )
+    growth.add_argument("input", help="readings file (.csv or .parquet, - for stdin)")
+    growth.add_argument("-o", "--output", default="-", help="output file (.csv or .parquet, default stdout)")
+    growth.add_argument("--chunksize", type=int, default=DEFAULT_CHUNKSIZE, help="rows per chunk")
+    growth.set_defaults(handler=_growth)
+
+    seasons = commands.add_parser(
+        "seasons",
+        help="score every (plant, season) in environment_data.csv",
+        description="Write the season score table for all plants, or only each plant's best season.",
+    )
+    seasons.add_argument("-o", "--output", default="-", help="output file (.csv or .parquet, default stdout)")
+    seasons.add_argument("--best", action="store_true", help="only the best season per plant")
+    seasons.add_argument(
+        "--catalog-ranges",
+        action="store_true",
+        help="use each plant's temperature range from plant_data.csv instead of the default 18-30°C",
+    )
+    seasons.set_defaults(handler=_seasons)
+
+    ingest = commands.add_parser(
+        "ingest",
+        help="stream sensor readings into per-(plant, season) aggregates",
+        description="Fold append-only environment readings (plant name, season, temperature (°C), "
+        "humidity (%%), AQI) into running mean/min/max/count aggregates. Input files are resumed from "
+        "the offset reached by the previous run; the plant page scores seasons from the result.",
+    )
+    ingest.add_argument("sources", nargs="+", help="CSV files to read (- for stdin)")
+    ingest.add_argument("--state", default=STATE_FILE, help="aggregate state file (default: %(default)s)")
+    ingest.add_argument("--reset", action="store_true", help="start from empty aggregates and offsets")
+    ingest.add_argument("--chunksize", type=int, default=INGEST_CHUNKSIZE, help="rows per chunk")
+    ingest.add_argument("--max-pending", type=int, default=DEFAULT_MAX_PENDING,
+                        help="chunks buffered between readers and the aggregator")
+    ingest.add_argument("--on-full", choices=[BLOCK, DROP], default=BLOCK,
+                        help="when the buffer is full, block the readers or drop the chunk")
+    ingest.add_argument("--follow", action="store_true", help="keep waiting for appended lines (like tail -f)")
+    ingest.add_argument("--poll-interval", type=float, default=1.0, help="seconds between --follow polls")
+    ingest.add_argument("--checkpoint-interval", type=float, default=5.0,
+                        help="seconds between saves of the state file")
+    ingest.add_argument("-o", "--output", help="also write the aggregate table (.csv or .parquet, - for stdout)")
+    ingest.set_defaults(handler=_ingest)
+
+    compile_ = commands.add_parser(
+        "compile",
+        help="compile the CSV datasets into the memory-mapped columnar format",
+        description="Write typed, dictionary-encoded .npy copies of the datasets. The app and batch "
+        "tools load these instead of parsing the CSVs for as long as the CSVs are unchanged.",
+    )
+    compile_.add_argument("datasets", nargs="*", metavar="DATASET",
+                          help=f"any of {', '.join(DATASETS)} (default: all)")
+    compile_.set_defaults(handler=_compile)
+
+    materialize = commands.add_parser(
+        "materialize",
+        help="build the catalog-wide derived tables the pages read",
+        description="Build or refresh the stored views (growth-rate encoding, season scores, soil and "
+        "watering distributions). Only views whose source CSV changed are rebuilt; the app refreshes "
+        "them on demand as well.",
+    )
+    materialize.add_argument("views", nargs="*", metavar="VIEW", help="views to refresh (default: all)")
+    materialize.set_defaults(handler=_materialize)
+
+    leaves = commands.add_parser(
+        "leaves",
+        help="detect leaf-color issues in plant photos",
+        description="Measure green, yellow, brown and purplish leaf shares in photos and map them onto "
+        "the leaf issues of the plant page. Photos are scored on a process pool; results are cached "
+        "by image content, so re-runs only measure new photos.",
+    )
+    leaves.add_argument("paths", nargs="+", help="image files or directories of images")
+    leaves.add_argument("-o", "--output", default="-", help="output file (.csv or .parquet, default stdout)")
+    leaves.add_argument("--workers", type=int, help="worker processes (default: one per CPU, 1 = no pool)")
+    leaves.add_argument("--no-cache", action="store_true", help="measure every photo again")
+    leaves.add_argument("--histogram", action="store_true", help="add the 36-bin hue histogram columns")
+    leaves.add_argument("--chunksize", type=int, default=1000, help="rows per output chunk")
+    leaves.set_defaults(handler=_leaves)
+
+    diagnose = commands.add_parser(
+        "diagnose",
+        help="match symptom descriptions against the knowledge base",
+        description="Rank the likely causes (plant_symptoms.csv) of every ticket in a text dump (one "
+        "ticket per line) or of a text column of a CSV/Parquet file, in a single pass per ticket.",
+    )
+    diagnose.add_argument("input", help="tickets: .txt (one per line, - for stdin), .csv or .parquet")
+    diagnose.add_argument("-o", "--output", default="-", help="output file (.csv or .parquet, default stdout)")
+    diagnose.add_argument("--column", default="text", help="text column of CSV/Parquet input (default: %(default)s)")
+    diagnose.add_argument("--limit", type=int, default=3, help="causes kept per ticket")
+    diagnose.add_argument("--chunksize", type=int, default=DEFAULT_CHUNKSIZE, help="tickets per chunk")
+    diagnose.set_defaults(handler=_diagnose)
+
+    schedule = commands.add_parser(
+        "schedule",
+        help="plan watering and out-of-range alerts for many pots",
+        description="Build the watering and alert calendar of every pot in a CSV/Parquet file (Plant Name, "
+        "optional Pot ID, Last Watered and Sunlight Hours) from the watering level, temperature range and "
+        "sunlight hours of plant_data.csv and the season means of environment_data.csv. Only days with a "
+        "watering or an alert are written.",
+    )
+    schedule.add_argument("input", help="pots file (.csv or .parquet, - for stdin)")
+    schedule.add_argument("-o", "--output", default="-", help="output file (.csv or .parquet, default stdout)")
+    schedule.add_argument("--days", type=_positive_int, default=30, help="days to plan, e.g. 30 or 90 (default: %(default)s)")
+    schedule.add_argument("--start", help="first day, YYYY-MM-DD (default: today)")
+    schedule.add_argument("--chunksize", type=int, default=10_000, help="pots per chunk")
+    schedule.set_defaults(handler=_schedule)
+
+    dossiers = commands.add_parser(
+        "dossiers",
+        help="render a static care dossier per plant",
+        description="Write one self-contained HTML (or PDF) page per plant with its details, growth "
+        "comparison, flowering/fruiting and environment charts and season scores. Plants are rendered "
+        "on a process pool; plants whose inputs are unchanged since the last run are skipped.",
+    )
+    dossiers.add_argument("plants", nargs="*", metavar="PLANT", help="plants to render (default: the whole catalog)")
+    dossiers.add_argument("-o", "--output-dir", default="dossiers", help="output directory (default: %(default)s)")
+    dossiers.add_argument("--format", choices=["html", "pdf"], default="html", help="output format")
+    dossiers.add_argument("--readings", help="growth readings to compare against (same file as the growth command)")
+    dossiers.add_argument("--workers", type=int, help="worker processes (default: one per CPU, 1 = no pool)")
+    dossiers.add_argument("--dpi", type=int, default=100, help="chart resolution")
+    dossiers.add_argument("--force", action="store_true", help="render every plant again")
+    dossiers.add_argument("-v", "--verbose", action="store_true", help="list every dossier written")
+    dossiers.set_defaults(handler=_dossiers)
+
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    args.handler(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""Compiled, memory-mapped form of the CSV datasets.
+
+``python -m plant_care compile`` writes each dataset to a directory of
+``.npy`` files (one per column) plus ``meta.json``:
+
+* numeric columns are stored with their parsed dtype and loaded with
+  ``np.load(mmap_mode="r")``, so reading them is zero-copy and every worker
+  process shares the same pages through the OS cache;
+* text columns are dictionary encoded (``NNN.codes.npy`` with the
+  smallest integer dtype, -1 for missing, plus ``NNN.categories.npy``)
+  and decoded back to the dtype ``read_csv`` produced;
+* derived columns added by a dataset's prepare step (e.g. the pre-split
+  temperature range of plant_data.csv) are stored like any other column, so
+  nothing is re-parsed from text.
+
+``meta.json`` records the blake2b digest of the source CSV; a compiled copy
+whose digest no longer matches is ignored and the CSV is parsed instead.
+"""
+
+import json
+import os
+import shutil
+
+import numpy as np
+import pandas as pd
+
+FORMAT_VERSION = 1
+META_FILE = "meta.json"
+
+
+def _column_file(directory, index, suffix):
+    # Column names contain spaces, "%" and "°", so files are numbered instead
+    return os.path.join(directory, f"{index:03d}.{suffix}.npy")
+
+
+def _code_dtype(n_categories):
+    for dtype in (np.int8, np.int16, np.int32):
+        if n_categories < np.iinfo(dtype).max:
+            return dtype
+    return np.int64
+
+
+def _is_numeric(series):
+    return pd.api.types.is_numeric_dtype(series.dtype) and not isinstance(series.dtype, pd.CategoricalDtype)
+
+
+def write_columnar(frame, directory, digest):
+    """Write ``frame`` to ``directory`` tagged with the source file's digest.
+
+    The directory is built next to the target and swapped in at the end, so
+    readers never see a half-written copy.
+    """
+    parent = os.path.dirname(os.path.abspath(directory))
+    os.makedirs(parent, exist_ok=True)
+    tmp_dir = f"{directory}.{os.getpid()}.tmp"
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    os.makedirs(tmp_dir)
+
+    columns = []
+    for index, name in enumerate(frame.columns):
+        series = frame[name]
+        if _is_numeric(series):
+            np.save(_column_file(tmp_dir, index, "values"), series.to_numpy())
+            columns.append({"name": name, "kind": "numeric"})
+        else:
+            codes, categories = pd.factorize(series, use_na_sentinel=True)
+            np.save(_column_file(tmp_dir, index, "codes"), codes.astype(_code_dtype(len(categories))))
+            np.save(_column_file(tmp_dir, index, "categories"), np.asarray(categories, dtype=str))
+            columns.append({"name": name, "kind": "text", "dtype": str(series.dtype)})
+
+    meta = {"format_version": FORMAT_VERSION, "digest": digest, "rows": len(frame), "columns": columns}
+    with open(os.path.join(tmp_dir, META_FILE), "w", encoding="utf-8") as f:
+        json.dump(meta, f, ensure_ascii=False, indent=1)
+
+    old_dir = f"{directory}.{os.getpid()}.old"
+    if os.path.isdir(directory):
+        os.replace(directory, old_dir)
+    os.replace(tmp_dir, directory)
+    shutil.rmtree(old_dir, ignore_errors=True)
+
+
+def read_meta(directory):
+    """The ``meta.json`` of a compiled dataset, or None if there is none."""
+    try:
+        with open(os.path.join(directory, META_FILE), encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _text_column(directory, index, dtype, categorical):
+    codes = np.load(_column_file(directory, index, "codes"), mmap_mode="r").view(np.ndarray)
+    categories = np.load(_column_file(directory, index, "categories"))
+    if categorical:
+        # Zero-copy: the Categorical keeps the memory-mapped codes
+        return pd.Categorical.from_codes(codes, categories=pd.Index(categories, dtype=object), validate=False)
+    # -1 (missing) picks the trailing NaN
+    values = np.append(categories.astype(object), np.nan)[codes]
+    return pd.array(values, dtype=None if dtype == "object" else dtype)
+
+
+def read_columnar(directory, digest=None, categorical=False):
+    """Load a compiled dataset, or return None if it is missing or stale.
+
+    Numeric columns are memory-mapped (read-only, zero-copy). Text columns
+    are decoded to their original dtype, or returned as ``Categorical`` over
+    the memory-mapped codes when ``categorical`` is true. With ``digest``,
+    a copy compiled from a different source file counts as stale.
+    """
+    meta = read_meta(directory)
+    if meta is None or meta.get("format_version") != FORMAT_VERSION:
+        return None
+    if digest is not None and meta.get("digest") != digest:
+        return None
+    try:
+        data = {}
+        for index, column in enumerate(meta["columns"]):
+            if column["kind"] == "numeric":
+                values = np.load(_column_file(directory, index, "values"), mmap_mode="r")
+                # Plain ndarray view of the mapping (keeps memmap out of downstream results)
+                data[column["name"]] = pd.Series(values.view(np.ndarray), copy=False)
+            else:
+                values = _text_column(directory, index, column["dtype"], categorical)
+                data[column["name"]] = pd.Series(values, copy=False)
+    except (OSError, KeyError, ValueError):
+        return None
+    return pd.DataFrame(data, copy=False)
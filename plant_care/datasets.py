@@ -0,0 +1,222 @@
+"""Process-wide cache for the plant CSV datasets.
+
+Every Streamlit rerun used to call ``pd.read_csv`` again. The loaders here
+parse each CSV once per process and only re-read it when the file on disk
+actually changes (mtime/size first, then a content hash so a plain ``touch``
+does not trigger a re-parse). When ``python -m plant_care compile`` has
+written an up-to-date columnar copy (see :mod:`plant_care.columnar`), that
+copy is memory-mapped instead of parsing the CSV.
+"""
+
+import hashlib
+import os
+import threading
+import time
+
+import pandas as pd
+
+from plant_care.columnar import read_columnar, read_meta, write_columnar
+from plant_care.instrumentation import span
+
+# Hand out shallow copies only: with copy-on-write a page that adds a column
+# or assigns into its frame never touches the cached one.
+if int(pd.__version__.split(".")[0]) < 3:
+    pd.set_option("mode.copy_on_write", True)  # always on from pandas 3
+
+# Folder containing the CSV files (the repository root by default)
+DATA_DIR = os.environ.get(
+    "PLANT_CARE_DATA_DIR", os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+)
+
+# Derived data (parsed stores, materialized tables...) is cached here
+CACHE_DIR = os.environ.get("PLANT_CARE_CACHE_DIR", os.path.join(DATA_DIR, ".plant_care_cache"))
+
+# Compiled columnar copies of the datasets, one directory per dataset
+COMPILED_DIR = os.path.join(CACHE_DIR, "compiled")
+
+ENV_NUMERIC_COLUMNS = ["temperature (°c)", "humidity (%)", "aqi"]
+
+# "15-25°C" in plant_data.csv is pre-split into these two numeric columns
+TEMPERATURE_MIN, TEMPERATURE_MAX = "Temperature Min (°C)", "Temperature Max (°C)"
+_TEMPERATURE_RANGE = r"(-?\d+(?:\.\d+)?)\s*-\s*(-?\d+(?:\.\d+)?)"
+
+
+def _prepare_plants(df):
+    """Add the numeric temperature range (NaN where it cannot be parsed)."""
+    bounds = df["Temperature"].astype("string").str.extract(_TEMPERATURE_RANGE)
+    df[TEMPERATURE_MIN] = pd.to_numeric(bounds[0]).astype(float).to_numpy()
+    df[TEMPERATURE_MAX] = pd.to_numeric(bounds[1]).astype(float).to_numpy()
+    return df
+
+
+def prepare_environment(df):
+    """Normalize column names and convert the reading columns to numbers."""
+    df.columns = df.columns.str.strip().str.lower()
+    for col in ENV_NUMERIC_COLUMNS:
+        df[col] = pd.to_numeric(df[col], errors="coerce")
+    return df
+
+
+# name -> (file name, post-processing step applied once after parsing)
+DATASETS = {
+    "plants": ("plant_data.csv", _prepare_plants),
+    "flowering": ("plant_flowering_fruiting.csv", None),
+    "environment": ("environment_data.csv", prepare_environment),
+    "symptoms": ("plant_symptoms.csv", None),
+}
+
+
+class _Entry:
+    """Cached frame plus what is needed to decide whether it is stale."""
+
+    def __init__(self):
+        self.frame = None
+        self.signature = None
+        self.digest = None
+        self.version = 0
+        self.source = None
+        self.loads = 0
+        self.hits = 0
+        self.revalidations = 0
+        self.last_load_ms = 0.0
+        self.total_load_ms = 0.0
+
+
+_lock = threading.Lock()
+_entries = {name: _Entry() for name in DATASETS}
+
+
+def dataset_path(name):
+    """Return the absolute path of a registered dataset."""
+    return os.path.join(DATA_DIR, DATASETS[name][0])
+
+
+def compiled_path(name):
+    """Directory of the named dataset's compiled columnar copy."""
+    return os.path.join(COMPILED_DIR, name)
+
+
+def _file_digest(path):
+    hasher = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            hasher.update(block)
+    return hasher.hexdigest()
+
+
+def _parse_csv(name, path):
+    frame = pd.read_csv(path)
+    prepare = DATASETS[name][1]
+    if prepare is not None:
+        frame = prepare(frame)
+    return frame
+
+
+def _refresh(name, entry):
+    """Re-parse the file behind ``entry`` if it changed since the last load."""
+    path = dataset_path(name)
+    stat = os.stat(path)
+    signature = (stat.st_mtime_ns, stat.st_size)
+    if entry.frame is not None and signature == entry.signature:
+        entry.hits += 1
+        return
+
+    digest = _file_digest(path)
+    if entry.frame is not None and digest == entry.digest:
+        # Touched but not modified: keep the parsed frame
+        entry.signature = signature
+        entry.revalidations += 1
+        entry.hits += 1
+        return
+
+    start = time.perf_counter()
+    with span(f"datasets.parse.{name}"):
+        frame = read_columnar(compiled_path(name), digest)
+        source = "compiled"
+        if frame is None:
+            frame = _parse_csv(name, path)
+            source = "csv"
+    elapsed_ms = (time.perf_counter() - start) * 1000
+
+    entry.frame = frame
+    entry.source = source
+    entry.signature = signature
+    entry.digest = digest
+    entry.version += 1
+    entry.loads += 1
+    entry.last_load_ms = elapsed_ms
+    entry.total_load_ms += elapsed_ms
+
+
+def load_dataset(name):
+    """Return a read-only view of the named dataset, parsing it at most once."""
+    entry = _entries[name]
+    with span("datasets.load"), _lock:
+        _refresh(name, entry)
+        frame = entry.frame
+    return frame.copy(deep=False)
+
+
+def load_plant_data():
+    """Plant catalog from plant_data.csv."""
+    return load_dataset("plants")
+
+
+def load_flowering_data():
+    """Flowering and fruiting details from plant_flowering_fruiting.csv."""
+    return load_dataset("flowering")
+
+
+def load_environment_data():
+    """Seasonal readings from environment_data.csv (lower-case columns)."""
+    return load_dataset("environment")
+
+
+def dataset_version(name):
+    """Counter that changes every time the named dataset is re-parsed."""
+    entry = _entries[name]
+    with _lock:
+        _refresh(name, entry)
+        return entry.version
+
+
+def dataset_digest(name):
+    """Content hash of the named dataset's file as of its current version."""
+    entry = _entries[name]
+    with _lock:
+        _refresh(name, entry)
+        return entry.digest
+
+
+def load_stats():
+    """Load counts and timings per dataset, for checking the cache works."""
+    with _lock:
+        return {
+            name: {
+                "version": entry.version,
+                "source": entry.source,
+                "loads": entry.loads,
+                "hits": entry.hits,
+                "revalidations": entry.revalidations,
+                "last_load_ms": round(entry.last_load_ms, 3),
+                "total_load_ms": round(entry.total_load_ms, 3),
+            }
+            for name, entry in _entries.items()
+        }
+
+
+def clear_cache():
+    """Drop every cached frame (the next access re-parses from disk)."""
+    with _lock:
+        for entry in _entries.values():
+            entry.frame = None
+            entry.signature = None
+            entry.digest = None
+
+
+def compile_dataset(name):
+    """Parse the named CSV and write its columnar copy; returns its metadata."""
+    path = dataset_path(name)
+    digest = _file_digest(path)
+    write_columnar(_parse_csv(name, path), compiled_path(name), digest)
+    return read_meta(compiled_path(name))
@@ -0,0 +1,169 @@
+"""Symptom matching and ranked diagnoses for the plant condition check.
+
+plant_symptoms.csv is the knowledge base: one row per cause with its
+symptom phrases (``|``-separated synonyms), the leaf issue it corresponds to
+in :data:`plant_care.analysis.LEAF_ISSUES` (if any), its effect and the
+solution. The phrases of all causes are compiled once per file version into
+an Aho-Corasick automaton, so a description is scanned in a single pass
+whatever the number of phrases, instead of one substring search per phrase.
+
+Text and phrases are normalized the same way (lower case, runs of anything
+but letters and digits become one space). A phrase only matches at the
+start of a word but may end inside one, so "wilt" matches "wilting" and
+"not grow" matches "not growing", but "dry" does not match "laundry".
+
+A cause scores the number of words of each distinct phrase of it that was
+found, so specific phrases ("leaves turning yellow") outweigh single words.
+"""
+
+import re
+import threading
+from collections import deque, namedtuple
+
+from plant_care.datasets import dataset_version, load_dataset
+
+DEFAULT_LIMIT = 3
+PHRASE_SEPARATOR = "|"
+
+_NON_WORD = re.compile(r"[^0-9a-z]+")
+
+Diagnosis = namedtuple("Diagnosis", ["cause", "score", "symptoms", "leaf_issue", "effect", "solution"])
+
+
+def normalize_text(text):
+    """Lower case with every run of non-alphanumerics collapsed to one space, padded with spaces."""
+    return f" {_NON_WORD.sub(' ', str(text).lower()).strip()} "
+
+
+class SymptomMatcher:
+    """Aho-Corasick automaton over normalized phrases.
+
+    ``find`` yields the id of every phrase occurring at a word start, in one
+    pass over the text. Each phrase is compiled with a leading space, and the
+    text is padded with one, which anchors matches at word starts.
+    """
+
+    def __init__(self, phrases):
+        self.phrases = list(phrases)
+        goto = [{}]
+        outputs = [[]]
+        for phrase_id, phrase in enumerate(self.phrases):
+            state = 0
+            for char in normalize_text(phrase).rstrip(" "):
+                next_state = goto[state].get(char)
+                if next_state is None:
+                    next_state = goto[state][char] = len(goto)
+                    goto.append({})
+                    outputs.append([])
+                state = next_state
+            outputs[state].append(phrase_id)
+
+        # Breadth-first failure links; outputs are merged along them so a state
+        # reports every phrase ending there, not only the longest one
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in goto[state].items():
+                queue.append(next_state)
+                fallback = fail[state]
+                while fallback and char not in goto[fallback]:
+                    fallback = fail[fallback]
+                target = goto[fallback].get(char, 0)
+                fail[next_state] = target if target != next_state else 0
+                outputs[next_state].extend(outputs[fail[next_state]])
+
+        self._goto = goto
+        self._fail = fail
+        self._outputs = [tuple(ids) for ids in outputs]
+
+    def __len__(self):
+        return len(self.phrases)
+
+    def find(self, text):
+        """Ids of the phrases found in ``text`` (repeated per occurrence)."""
+        goto, fail, outputs = self._goto, self._fail, self._outputs
+        state = 0
+        found = []
+        for char in normalize_text(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if outputs[state]:
+                found.extend(outputs[state])
+        return found
+
+
+class KnowledgeBase:
+    """Causes of plant_symptoms.csv with a compiled matcher over their phrases."""
+
+    def __init__(self, causes):
+        # causes: list of dicts with cause, symptoms (phrases), leaf_issue, effect, solution
+        self.causes = causes
+        phrase_causes = {}
+        for cause_id, cause in enumerate(causes):
+            for phrase in cause["symptoms"]:
+                key = normalize_text(phrase).strip()
+                if key:
+                    phrase_causes.setdefault(key, []).append(cause_id)
+        self.matcher = SymptomMatcher(phrase_causes)
+        self._phrase_causes = list(phrase_causes.values())
+        self._weights = [len(phrase.split()) for phrase in self.matcher.phrases]
+
+    def __len__(self):
+        return len(self.causes)
+
+    @classmethod
+    def from_frame(cls, df):
+        def text(value):
+            return "" if value != value else str(value).strip()  # NaN -> ""
+
+        causes = []
+        for row in df.to_dict("records"):
+            symptoms = [phrase.strip() for phrase in text(row["Symptoms"]).split(PHRASE_SEPARATOR) if phrase.strip()]
+            causes.append({
+                "cause": text(row["Cause"]),
+                "symptoms": symptoms,
+                "leaf_issue": text(row.get("Leaf Issue", "")) or None,
+                "effect": text(row["Effect"]),
+                "solution": text(row["Solution"]),
+            })
+        return cls(causes)
+
+    def diagnose(self, text, limit=DEFAULT_LIMIT):
+        """Up to ``limit`` :class:`Diagnosis` es, highest score first (empty if nothing matched)."""
+        found = set(self.matcher.find(text))
+        if not found:
+            return []
+        scores = {}
+        symptoms = {}
+        for phrase_id in sorted(found):
+            for cause_id in self._phrase_causes[phrase_id]:
+                scores[cause_id] = scores.get(cause_id, 0) + self._weights[phrase_id]
+                symptoms.setdefault(cause_id, []).append(self.matcher.phrases[phrase_id])
+        ranked = sorted(scores, key=lambda cause_id: (-scores[cause_id], cause_id))[:limit]
+        return [
+            Diagnosis(self.causes[cause_id]["cause"], scores[cause_id], tuple(symptoms[cause_id]),
+                      self.causes[cause_id]["leaf_issue"], self.causes[cause_id]["effect"],
+                      self.causes[cause_id]["solution"])
+            for cause_id in ranked
+        ]
+
+
+_lock = threading.Lock()
+_cached = {"version": None, "kb": None}
+
+
+def get_knowledge_base():
+    """Knowledge base for the current plant_symptoms.csv, recompiled when it changes."""
+    version = dataset_version("symptoms")
+    with _lock:
+        if _cached["version"] != version:
+            _cached["kb"] = KnowledgeBase.from_frame(load_dataset("symptoms"))
+            _cached["version"] = version
+        return _cached["kb"]
+
+
+def diagnose(text, limit=DEFAULT_LIMIT):
+    """Ranked :class:`Diagnosis` es for a free-text description."""
+    return get_knowledge_base().diagnose(text, limit)
@@ -0,0 +1,446 @@
+"""Offline care dossiers: one static page per plant (``python -m plant_care dossiers``).
+
+A dossier holds what the app shows about a plant across its pages: the
+details card and photo of home.py, and the growth, flowering and environment
+analyses of plant.py with their charts and the season scores. It is built
+from the same analysis functions (:mod:`plant_care.analysis`) and chart
+functions (:mod:`plant_care.charts`) and written as a self-contained HTML
+file (charts and photo embedded) or a PDF.
+
+Plants are rendered on a process pool. Each worker loads the datasets and
+their derived stores once, in the pool initializer, and then renders plants
+until the run is done. The inputs of a dossier -- its rows of the three
+datasets, its season scores, its photo, its growth reading and the output
+format -- are hashed into a fingerprint kept in a manifest next to the
+output (one entry per output file, so HTML and PDF dossiers of a plant can
+share a directory), and plants whose fingerprint and file are unchanged are
+skipped, so regenerating the whole catalog only renders what changed.
+"""
+
+import base64
+import hashlib
+import html
+import io
+import json
+import os
+import re
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Optional, Tuple
+
+import pandas as pd
+
+from plant_care.analysis import (
+    GrowthInput, analyze_environment, analyze_flowering, analyze_growth, plant_details,
+)
+from plant_care.charts import (
+    COMPARISON_SIZE, ENVIRONMENT_SIZE, TRENDS_SIZE, draw_aqi_line, draw_growth_comparison, draw_humidity_bars,
+    draw_month_trends, draw_season_heights, draw_temperature_pie,
+)
+from plant_care.datasets import load_dataset
+from plant_care.growth import (
+    CHANGE_SOIL, INCREASE_HEIGHT, INCREASE_SUNLIGHT, READING_COLUMNS, REDUCE_SUNLIGHT, TALLER_THAN_USUAL,
+)
+from plant_care.name_index import NAME_COLUMNS, get_name_index, normalize_name, normalize_names
+from plant_care.phenology import MONTHS, get_phenology
+from plant_care.thumbnails import get_thumbnail, image_path
+from plant_care.views import get_season_scores
+
+HTML, PDF = "html", "pdf"
+FORMATS = (HTML, PDF)
+
+MANIFEST_FILE = "dossiers.json"
+
+# Charts are embedded at a lower resolution than the app serves them
+DEFAULT_DPI = 100
+PHOTO_WIDTH = 640
+
+# A4 portrait with its top/bottom margin (share of the height), for the PDF summary pages
+PAGE_SIZE = (8.27, 11.69)
+PAGE_MARGIN = 0.05
+
+# Bump when the dossier layout or content changes, so every plant is rendered again
+_FORMAT_VERSION = 2
+
+_UNSAFE_FILENAME = re.compile(r"[^0-9a-z]+")
+
+
+@dataclass(frozen=True)
+class Chart:
+    title: str
+    draw: Any
+    args: Tuple[Any, ...]
+    figsize: Tuple[float, float]
+
+
+@dataclass(frozen=True)
+class Dossier:
+    """Everything rendered for one plant; ``sections`` are (heading, lines) pairs."""
+
+    plant_name: str
+    photo: Optional[bytes]
+    sections: Tuple[Tuple[str, Tuple[str, ...]], ...]
+    charts: Tuple[Chart, ...]
+
+
+def dossier_filename(plant_key, fmt=HTML):
+    """Output file name of a plant, e.g. "aloe vera" -> "aloe_vera.html"."""
+    return f"{_UNSAFE_FILENAME.sub('_', plant_key).strip('_') or 'plant'}.{fmt}"
+
+
+def growth_recommendations(result):
+    """The recommendation lines plant.py shows for a :class:`~plant_care.analysis.GrowthResult`."""
+    lines = []
+    if result.sunlight_advice == INCREASE_SUNLIGHT:
+        lines.append(f"🔆 Increase Sunlight: the plant needs at least {result.ideal_sunlight} hours/day.")
+    elif result.sunlight_advice == REDUCE_SUNLIGHT:
+        lines.append(f"☀ Too Much Sunlight: reduce to {result.ideal_sunlight} hours/day for best growth.")
+    else:
+        lines.append("✅ Sunlight Level is Perfect!")
+    if result.soil_advice == CHANGE_SOIL:
+        lines.append(f"🌱 Change Soil Type: the plant prefers {result.ideal_soil} soil.")
+    if result.height_advice == INCREASE_HEIGHT:
+        lines.append(f"📏 Increase Plant Height: the plant should ideally be {result.ideal_height} cm.")
+    elif result.height_advice == TALLER_THAN_USUAL:
+        lines.append(f"📏 The plant is taller than usual! Normal height: {result.ideal_height} cm.")
+    else:
+        lines.append("✅ The plant's height is perfect!")
+    return lines
+
+
+def build_dossier(plant_name, reading=None):
+    """:class:`Dossier` of a catalog plant; ``reading`` is (sunlight hours, soil type, height cm) or None."""
+    key = normalize_name(plant_name)
+    details = plant_details(key)
+    title = plant_name.strip()
+    sections, charts = [], []
+
+    # 🌿 Details card (home.py)
+    if details is not None:
+        title = details.name
+        sections.append(("🌿 Plant Details", tuple(f"{label}: {value}" for label, value, _ in details.lines)))
+
+    # 📈 Growth comparison, for plants with a reading
+    if reading is not None and details is not None:
+        try:
+            growth = analyze_growth(GrowthInput(key, *reading))
+        except KeyError as e:
+            sections.append(("📈 Growth Rate", (f"❌ Missing data in the dataset: {e}",)))
+        else:
+            sections.append(("📈 Growth Rate", (
+                f"Reading: {reading[0]} hours of sunlight, {reading[1]} soil, {reading[2]} cm",
+                f"🌱 Growth Rate: {growth.growth_rate}",
+                *growth_recommendations(growth),
+            )))
+            charts.append(Chart("📊 Growth Condition vs. Ideal Conditions", draw_growth_comparison,
+                                (growth.categories, growth.user_values, growth.ideal_values), COMPARISON_SIZE))
+
+    # 🌼 Flowering & fruiting stages
+    flowering = analyze_flowering(key)
+    if flowering is not None:
+        lines = [
+            f"🌱 This plant is categorized as: {flowering.flowering_type}",
+            f"🌼 Flowering Season: {flowering.flowering_season}",
+        ]
+        if flowering.fruiting:
+            lines.append(f"🍎 Fruiting Season: {flowering.fruiting_season}")
+        lines.append(f"🌱 Soil Nutrient Requirements: {flowering.soil_nutrient}")
+        lines.append(f"🍃 Leaf Color: {flowering.leaf_color}")
+        if flowering.leaf_color_note:
+            level, message = flowering.leaf_color_note
+            lines.append(f"{'✅' if level == 'success' else '⚠️'} {message}")
+        if flowering.flowering:
+            lines.append(f"✅ Best Season for Flowering: {flowering.best_flowering_season}")
+        if flowering.fruiting:
+            lines.append(f"✅ Best Season for Fruiting: {flowering.best_fruiting_season}")
+        lines.extend(f"⚠️ Skipped malformed data ({problem})" for problem in flowering.problems)
+        sections.append(("🌼 Flowering & Fruiting Stages", tuple(lines)))
+
+        plant_title = key.capitalize()
+        charts.append(Chart("📊 Flowering & Fruiting Trends Over the Year", draw_month_trends,
+                            (f"🌼 {plant_title} - Flowering & Fruiting Trends", MONTHS,
+                             flowering.flowering_months, flowering.fruiting_months), TRENDS_SIZE))
+        charts.append(Chart("📏 Flowering/Fruiting Height vs. Season", draw_season_heights,
+                            (f"📏 {plant_title} - Height Trends by Season", flowering.height_seasons,
+                             flowering.height_min, flowering.height_max), TRENDS_SIZE))
+
+    # 🌡️ Environment and season scores
+    environment = analyze_environment(key)
+    if environment is not None:
+        sections.append(("🌡️ Environmental Impact", (
+            f"✅ Best suited for the {environment.best_season.capitalize()} season",
+            *(f"{season.capitalize()} → Score: {score:.1f}"
+              for season, score in zip(environment.seasons, environment.scores)),
+        )))
+        charts.append(Chart("🌡️ Temperature Distribution by Season", draw_temperature_pie,
+                            (environment.seasons, environment.temperature), ENVIRONMENT_SIZE))
+        charts.append(Chart("💧 Humidity Levels by Season", draw_humidity_bars,
+                            (environment.seasons, environment.humidity), ENVIRONMENT_SIZE))
+        charts.append(Chart("🌫️ AQI Trends Across Seasons", draw_aqi_line,
+                            (environment.seasons, environment.aqi), ENVIRONMENT_SIZE))
+
+    try:
+        photo = get_thumbnail(title, PHOTO_WIDTH)
+    except OSError:
+        photo = None  # an unreadable photo does not stop the dossier
+    return Dossier(title, photo, tuple(sections), tuple(charts))
+
+
+def _chart_png(chart, dpi):
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=chart.figsize)
+    try:
+        chart.draw(fig, *chart.args)
+        buffer = io.BytesIO()
+        fig.savefig(buffer, format="png", dpi=dpi, bbox_inches="tight")
+    finally:
+        fig.clear()
+    return buffer.getvalue()
+
+
+_STYLE = """
+body { font-family: sans-serif; max-width: 960px; margin: 2em auto; color: #222; }
+h1 { text-align: center; color: darkgreen; }
+section { background-color: #f0f7f4; padding: 10px 20px; border-radius: 10px; margin: 1em 0; }
+figure { margin: 1em 0; text-align: center; }
+img { max-width: 100%; }
+footer { color: #888; font-size: small; text-align: center; }
+"""
+
+
+def render_html(dossier, dpi=DEFAULT_DPI):
+    """Self-contained HTML page of a dossier (charts and photo embedded as data URIs)."""
+    def data_uri(data, mime):
+        return f"data:{mime};base64,{base64.b64encode(data).decode('ascii')}"
+
+    name = html.escape(dossier.plant_name)
+    parts = [
+        "<!DOCTYPE html>",
+        f"<html lang='en'><head><meta charset='utf-8'><title>{name} - Plant Care Dossier</title>",
+        f"<style>{_STYLE}</style></head><body>",
+        f"<h1>🌱 {name} - Plant Care Dossier</h1>",
+    ]
+    if dossier.photo:
+        parts.append(f"<figure><img src='{data_uri(dossier.photo, 'image/jpeg')}' alt='{name}'></figure>")
+    for heading, lines in dossier.sections:
+        parts.append(f"<section><h2>{html.escape(heading)}</h2>")
+        parts.extend(f"<p>{html.escape(line)}</p>" for line in lines)
+        parts.append("</section>")
+    for chart in dossier.charts:
+        parts.append(f"<figure><h3>{html.escape(chart.title)}</h3>"
+                     f"<img src='{data_uri(_chart_png(chart, dpi), 'image/png')}' alt='{html.escape(chart.title)}'>"
+                     "</figure>")
+    parts.append(f"<footer>Generated {time.strftime('%Y-%m-%d %H:%M')} by python -m plant_care dossiers</footer>")
+    parts.append("</body></html>")
+    return "\n".join(parts).encode("utf-8")
+
+
+def render_pdf(dossier, dpi=DEFAULT_DPI):
+    """PDF of a dossier: a summary page (photo and sections), then one page per chart."""
+    from matplotlib.backends.backend_pdf import PdfPages
+    from matplotlib.figure import Figure
+
+    # Summary text flows onto further pages once a page is full
+    entries = []
+    for heading, lines in dossier.sections:
+        entries.append((heading, {"fontsize": 13, "weight": "bold"}, 0.03, 0.08))
+        entries.extend((line, {"fontsize": 9.5}, 0.022, 0.1) for line in lines)
+        entries.append((None, None, 0.015, None))
+
+    buffer = io.BytesIO()
+    with PdfPages(buffer) as pdf:
+        fig = Figure(figsize=PAGE_SIZE)
+        try:
+            fig.text(0.5, 0.96, f"{dossier.plant_name} - Plant Care Dossier", ha="center", va="top",
+                     fontsize=18, color="darkgreen")
+            y = 0.92
+            if dossier.photo:
+                from PIL import Image
+
+                with Image.open(io.BytesIO(dossier.photo)) as img:
+                    ax = fig.add_axes((0.25, 0.62, 0.5, 0.29))
+                    ax.imshow(img.convert("RGB"))
+                    ax.set_axis_off()
+                y = 0.59
+            for text, style, height, x in entries:
+                if text is not None and y - height < PAGE_MARGIN:
+                    pdf.savefig(fig)
+                    fig.clear()
+                    fig = Figure(figsize=PAGE_SIZE)
+                    y = 1 - PAGE_MARGIN
+                if text is not None:
+                    fig.text(x, y, text, va="top", **style)
+                y -= height
+            pdf.savefig(fig)
+        finally:
+            fig.clear()
+        for chart in dossier.charts:
+            fig = Figure(figsize=chart.figsize)
+            try:
+                chart.draw(fig, *chart.args)
+                pdf.savefig(fig, dpi=dpi, bbox_inches="tight")
+            finally:
+                fig.clear()
+    return buffer.getvalue()
+
+
+RENDERERS = {HTML: render_html, PDF: render_pdf}
+
+
+def _write_atomic(path, data):
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+def catalog_plants():
+    """(key, name) of every plant in plant_data.csv, in catalog order (first row wins on duplicates)."""
+    names = load_dataset("plants")["Plant Name"].dropna().to_numpy()
+    plants = {}
+    for key, name in zip(normalize_names(names), names):
+        plants.setdefault(key, str(name))
+    return list(plants.items())
+
+
+def read_readings(path):
+    """Growth reading per plant key from a readings file (last one wins); see ``python -m plant_care growth``."""
+    from plant_care.chunked_io import read_chunks
+
+    readings = {}
+    for chunk in read_chunks(path, columns=READING_COLUMNS):
+        keys = normalize_names(chunk["Plant Name"].to_numpy())
+        for key, sunlight, soil, height in zip(keys, chunk["Sunlight Hours"], chunk["Soil Type"],
+                                               chunk["Height (cm)"]):
+            readings[key] = (sunlight, soil, height)
+    return readings
+
+
+def _grouped_row_hashes(frame, keys):
+    # One uint64 per row, grouped by plant key, in row order
+    grouped = {}
+    for key, value in zip(keys, pd.util.hash_pandas_object(frame, index=False).tolist()):
+        grouped.setdefault(key, []).append(value)
+    return grouped
+
+
+def input_fingerprints(plant_keys, readings=None, fmt=HTML, dpi=DEFAULT_DPI):
+    """Fingerprint of every input a plant's dossier is rendered from, per plant key.
+
+    Rows are hashed per table in one vectorized pass, so editing one plant
+    only changes that plant's fingerprint.
+    """
+    readings = readings or {}
+    tables = {}
+    for table, column in NAME_COLUMNS.items():
+        frame = load_dataset(table)
+        tables[table] = _grouped_row_hashes(frame, normalize_names(frame[column].to_numpy()))
+    scores = get_season_scores().table
+    tables["season_scores"] = _grouped_row_hashes(scores, scores["key"].to_numpy())
+
+    fingerprints = {}
+    for key in plant_keys:
+        digest = hashlib.blake2b(f"{_FORMAT_VERSION}:{fmt}:{dpi}:{key}".encode(), digest_size=16)
+        for table in tables.values():
+            digest.update(repr(table.get(key, ())).encode())
+        digest.update(repr(readings.get(key)).encode())
+        path = image_path(key)
+        if path is not None:
+            stat = os.stat(path)
+            digest.update(f"{stat.st_size}:{stat.st_mtime_ns}".encode())
+        fingerprints[key] = digest.hexdigest()
+    return fingerprints
+
+
+def load_manifest(output_dir):
+    """Output file name -> {"plant", "fingerprint"} of the dossiers already in ``output_dir``."""
+    try:
+        with open(os.path.join(output_dir, MANIFEST_FILE), encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return manifest.get("files", {}) if manifest.get("version") == _FORMAT_VERSION else {}
+
+
+def save_manifest(output_dir, files):
+    data = json.dumps({"version": _FORMAT_VERSION, "files": files}, indent=1, sort_keys=True)
+    _write_atomic(os.path.join(output_dir, MANIFEST_FILE), data.encode("utf-8"))
+
+
+def _init_worker():
+    # Load the datasets and derived stores once per worker; every plant it renders reuses them
+    import warnings
+
+    warnings.filterwarnings("ignore", message="Glyph .* missing from font")
+    get_name_index()
+    get_phenology()
+    get_season_scores()
+
+
+def _render_one(task):
+    # Runs in a worker process: errors come back as values so one plant never stops a run
+    key, name, reading, path, fmt, dpi = task
+    start = time.perf_counter()
+    try:
+        _write_atomic(path, RENDERERS[fmt](build_dossier(name, reading), dpi))
+    except Exception as e:  # noqa: BLE001 -- reported per plant
+        return key, None, f"{type(e).__name__}: {e}", time.perf_counter() - start
+    return key, path, None, time.perf_counter() - start
+
+
+def generate(output_dir, plant_names=None, fmt=HTML, workers=None, readings=None, force=False,
+             dpi=DEFAULT_DPI, chunksize=4):
+    """Render dossiers into ``output_dir``; yields ``(key, status, path, error, seconds)``.
+
+    ``status`` is "written", "skipped" (fingerprint and file unchanged) or
+    "failed" (including requested plants missing from the catalog).
+    ``plant_names`` defaults to the whole catalog; ``readings`` maps plant
+    keys to growth readings (see :func:`read_readings`). ``workers=1``
+    renders in this process. The manifest is saved even if the run stops
+    early, so an interrupted run resumes where it stopped.
+    """
+    if fmt not in RENDERERS:
+        raise ValueError(f"unknown format {fmt!r} (choose from {', '.join(FORMATS)})")
+    catalog = catalog_plants()
+    if plant_names is not None:
+        wanted = dict.fromkeys(normalize_name(name) for name in plant_names)
+        for key in wanted.keys() - dict(catalog).keys():
+            yield key, "failed", None, "not in plant_data.csv", 0.0
+        catalog = [(key, name) for key, name in catalog if key in wanted]
+    readings = readings or {}
+    os.makedirs(output_dir, exist_ok=True)
+
+    manifest = load_manifest(output_dir)
+    fingerprints = input_fingerprints([key for key, _ in catalog], readings, fmt, dpi)
+    tasks = []
+    for key, name in catalog:
+        path = os.path.join(output_dir, dossier_filename(key, fmt))
+        entry = manifest.get(os.path.basename(path))
+        if (not force and entry and entry["plant"] == key and entry["fingerprint"] == fingerprints[key]
+                and os.path.exists(path)):
+            yield key, "skipped", path, None, 0.0
+            continue
+        tasks.append((key, name, readings.get(key), path, fmt, dpi))
+
+    def record(results):
+        for key, path, error, seconds in results:
+            if error is None:
+                manifest[os.path.basename(path)] = {"plant": key, "fingerprint": fingerprints[key]}
+            else:
+                manifest.pop(dossier_filename(key, fmt), None)
+            yield key, "failed" if error else "written", path, error, seconds
+
+    try:
+        if not tasks:
+            return
+        if workers == 1:
+            _init_worker()
+            yield from record(map(_render_one, tasks))
+            return
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as executor:
+            yield from record(executor.map(_render_one, tasks, chunksize=chunksize))
+    finally:
+        save_manifest(output_dir, manifest)
@@ -0,0 +1,267 @@
+"""Persistent favorites, shared by every session and worker process.
+
+Favorites used to live in a per-session list and vanished with the session.
+They are now stored in an embedded SQLite database (WAL mode, so readers
+never block the writer) keyed by user. Writes from all sessions of a process
+go through one background writer thread that commits them in batches, so
+sessions never wait on each other for the database lock. Each session keeps
+its favorites in a :class:`UserFavorites` (an in-memory set plus insertion
+order), which is what membership checks and the sidebar read.
+
+A new database is seeded with favorites.csv for :data:`DEFAULT_USER`.
+
+A batch that cannot be committed is retried a few times; if it still fails it
+is logged and kept in :attr:`FavoritesStore.failed`, and each user with a
+change in it gets an error (:meth:`FavoritesStore.error_for`) so the page can
+tell them their change was not saved. The error is cleared once one of their
+changes is committed again.
+
+The user key is not authenticated by this module: :func:`user_key` uses the
+logged-in identity when Streamlit authentication is configured and otherwise
+a ``?user=`` label, which only keeps lists apart and is not access control.
+"""
+
+import atexit
+import logging
+import os
+import queue
+import sqlite3
+import threading
+import time
+
+import pandas as pd
+
+from plant_care.datasets import DATA_DIR
+
+DB_PATH = os.environ.get("PLANT_CARE_FAVORITES_DB", os.path.join(DATA_DIR, "favorites.db"))
+SEED_FILE = os.path.join(DATA_DIR, "favorites.csv")
+
+# Favorites of visitors that do not pass ?user=... (and of favorites.csv)
+DEFAULT_USER = "default"
+
+# Keys of logged-in users start with this; ?user= labels may not
+AUTH_PREFIX = "auth:"
+
+# The writer commits up to BATCH_SIZE queued changes per transaction, waiting
+# at most FLUSH_INTERVAL seconds for more to arrive
+BATCH_SIZE = 500
+FLUSH_INTERVAL = 0.05
+
+# Attempts per batch (seconds between them grow linearly) before it is reported as failed
+WRITE_ATTEMPTS = 3
+RETRY_DELAY = 0.5
+# Failed changes kept for inspection
+MAX_FAILED = 1000
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA_VERSION = 1
+_ADD, _REMOVE = "add", "remove"
+
+
+class FavoritesStore:
+    """SQLite-backed favorites with a batching background writer."""
+
+    def __init__(self, path=DB_PATH, seed_file=SEED_FILE):
+        self.path = path
+        self.seed_file = seed_file
+        self.batches = 0
+        self.writes = 0
+        self.failed = []
+        self.last_error = None
+        self._user_errors = {}
+        self._local = threading.local()
+        self._queue = queue.Queue()
+        self._writer = None
+        self._writer_lock = threading.Lock()
+        self._init_schema()
+
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=30, isolation_level=None, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def _reader(self):
+        # sqlite3 connections must not be shared between threads
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._local.conn = self._connect()
+        return conn
+
+    def _init_schema(self):
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            if conn.execute("PRAGMA user_version").fetchone()[0] < _SCHEMA_VERSION:
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS favorites ("
+                    " user TEXT NOT NULL, plant TEXT NOT NULL, added_at REAL NOT NULL,"
+                    " PRIMARY KEY (user, plant)) WITHOUT ROWID"
+                )
+                conn.executemany(
+                    "INSERT OR IGNORE INTO favorites VALUES (?, ?, ?)",
+                    [(DEFAULT_USER, plant, time.time() + i * 1e-6) for i, plant in enumerate(self._seed())],
+                )
+                conn.execute(f"PRAGMA user_version={_SCHEMA_VERSION}")
+            conn.execute("COMMIT")
+        finally:
+            conn.close()
+
+    def _seed(self):
+        """Plant names from favorites.csv (empty if the file is missing)."""
+        try:
+            names = pd.read_csv(self.seed_file)["Plant Name"]
+        except (OSError, KeyError, pd.errors.EmptyDataError):
+            return []
+        return [name.strip() for name in names.dropna().astype(str) if name.strip()]
+
+    def favorites(self, user):
+        """Committed favorites of ``user``, oldest first."""
+        rows = self._reader().execute(
+            "SELECT plant FROM favorites WHERE user = ? ORDER BY added_at", (user,)
+        ).fetchall()
+        return [plant for (plant,) in rows]
+
+    def add(self, user, plant):
+        """Queue ``plant`` to be added to ``user``'s favorites."""
+        self._submit((_ADD, user, plant, time.time()))
+
+    def remove(self, user, plant):
+        """Queue ``plant`` to be removed from ``user``'s favorites."""
+        self._submit((_REMOVE, user, plant, None))
+
+    def flush(self):
+        """Block until every queued change has been committed."""
+        if self._writer is not None:
+            self._queue.join()
+
+    def _submit(self, change):
+        with self._writer_lock:
+            if self._writer is None:
+                self._writer = threading.Thread(target=self._write_loop, name="favorites-writer", daemon=True)
+                self._writer.start()
+        self._queue.put(change)
+
+    def _write_loop(self):
+        conn = self._connect()
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + FLUSH_INTERVAL
+            while len(batch) < BATCH_SIZE:
+                try:
+                    batch.append(self._queue.get(timeout=max(0.0, deadline - time.monotonic())))
+                except queue.Empty:
+                    break
+            try:
+                self._commit_with_retries(conn, batch)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    def _commit_with_retries(self, conn, batch):
+        for attempt in range(1, WRITE_ATTEMPTS + 1):
+            try:
+                self._commit(conn, batch)
+            except sqlite3.Error as e:
+                error = e
+                logger.warning("favorites: commit of %d change(s) failed (attempt %d/%d): %s",
+                               len(batch), attempt, WRITE_ATTEMPTS, e)
+                if attempt < WRITE_ATTEMPTS:
+                    time.sleep(RETRY_DELAY * attempt)
+            else:
+                self.last_error = None
+                for _, user, _, _ in batch:
+                    self._user_errors.pop(user, None)
+                return
+        # Keep serving sessions, but record the lost changes so their users' pages can surface them
+        logger.error("favorites: giving up on %d change(s) in %s: %s", len(batch), self.path, error)
+        self.last_error = f"{type(error).__name__}: {error}"
+        self.failed = (self.failed + batch)[-MAX_FAILED:]
+        for _, user, _, _ in batch:
+            self._user_errors[user] = self.last_error
+
+    def error_for(self, user):
+        """Why ``user``'s latest changes could not be saved, or None."""
+        return self._user_errors.get(user)
+
+    def _commit(self, conn, batch):
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            for op, user, plant, added_at in batch:
+                if op == _ADD:
+                    conn.execute("INSERT OR IGNORE INTO favorites VALUES (?, ?, ?)", (user, plant, added_at))
+                else:
+                    conn.execute("DELETE FROM favorites WHERE user = ? AND plant = ?", (user, plant))
+            conn.execute("COMMIT")
+        except sqlite3.Error:
+            conn.execute("ROLLBACK")
+            raise
+        self.batches += 1
+        self.writes += len(batch)
+
+
+def user_key(email=None, label=None):
+    """Favorites key of a visitor: their login email if any, else the ``?user=`` label.
+
+    Labels cannot take the form of a logged-in user's key.
+    """
+    if email:
+        return f"{AUTH_PREFIX}{email}"
+    if not label or label.startswith(AUTH_PREFIX):
+        return DEFAULT_USER
+    return label
+
+
+class UserFavorites:
+    """One user's favorites for one session: O(1) membership, write-through."""
+
+    def __init__(self, store, user):
+        self.store = store
+        self.user = user
+        self._names = dict.fromkeys(store.favorites(user))  # ordered set
+
+    def __contains__(self, plant):
+        return plant in self._names
+
+    def __iter__(self):
+        return iter(list(self._names))
+
+    def __len__(self):
+        return len(self._names)
+
+    @property
+    def save_error(self):
+        """Why this user's latest changes could not be saved, or None."""
+        return self.store.error_for(self.user)
+
+    def add(self, plant):
+        """Add ``plant``; returns False if it already was a favorite."""
+        if plant in self._names:
+            return False
+        self._names[plant] = None
+        self.store.add(self.user, plant)
+        return True
+
+    def remove(self, plant):
+        """Remove ``plant``; returns False if it was not a favorite."""
+        if plant not in self._names:
+            return False
+        del self._names[plant]
+        self.store.remove(self.user, plant)
+        return True
+
+
+_lock = threading.Lock()
+_cached = {"store": None}
+
+
+def get_favorites_store():
+    """Process-wide store (pending writes are flushed at interpreter exit)."""
+    with _lock:
+        if _cached["store"] is None:
+            _cached["store"] = FavoritesStore()
+            atexit.register(_cached["store"].flush)
+        return _cached["store"]
@@ -0,0 +1,80 @@
+"""Rendered-chart cache for the analysis views in plant.py.
+
+Every rerun used to build new pyplot figures that were never closed. Charts
+are now drawn onto a standalone ``matplotlib.figure.Figure`` (not registered
+with pyplot), saved to PNG/SVG bytes, released, and the bytes are kept in a
+size-bounded LRU keyed by (chart type, plant, input parameters, dataset
+version). An identical chart is then served without touching matplotlib.
+"""
+
+import io
+import threading
+import time
+
+from plant_care.instrumentation import span
+from plant_care.lru import BytesLRU
+
+# Upper bound for rendered chart bytes kept in memory
+MEMORY_LIMIT_BYTES = 32 * 1024 * 1024
+
+# Same output settings st.pyplot uses
+DEFAULT_DPI = 200
+
+
+class FigureCache:
+    """LRU of rendered charts with hit/miss metrics."""
+
+    def __init__(self, limit_bytes=MEMORY_LIMIT_BYTES):
+        self._images = BytesLRU(limit_bytes)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.render_ms = 0.0
+
+    def render(self, key, draw, *args, figsize=(6, 4), fmt="png", dpi=DEFAULT_DPI):
+        """Bytes of the chart for ``key``, calling ``draw(fig, *args)`` on a miss."""
+        key = (key, fmt, figsize, dpi)
+        data = self._images.get(key)
+        if data is not None:
+            with self._lock:
+                self.hits += 1
+            return data
+
+        from matplotlib.figure import Figure
+
+        start = time.perf_counter()
+        fig = Figure(figsize=figsize)
+        try:
+            with span("chart.draw"):
+                draw(fig, *args)
+            with span("chart.savefig"):
+                buffer = io.BytesIO()
+                fig.savefig(buffer, format=fmt, dpi=dpi, bbox_inches="tight")
+        finally:
+            fig.clear()  # release artists and canvas right away
+        data = buffer.getvalue()
+        self._images.put(key, data)
+        with self._lock:
+            self.misses += 1
+            self.render_ms += (time.perf_counter() - start) * 1000
+        return data
+
+    def stats(self):
+        """Hit/miss counts, hit ratio, evictions and memory use."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 3) if lookups else 0.0,
+                "evictions": self._images.evictions,
+                "items": len(self._images),
+                "bytes": self._images.size,
+                "render_ms": round(self.render_ms, 3),
+            }
+
+    def clear(self):
+        self._images.clear()
+
+
+figure_cache = FigureCache()
@@ -0,0 +1,136 @@
+"""Search and sidebar filter engine for the home page plant list.
+
+The old ``filter_plants`` ran a regex ``str.contains`` and two ``isin`` masks,
+copying the frame after each step, on every keystroke. Here the catalog is
+encoded once per dataset version:
+
+* Soil Type and Watering become integer codes, so a selection is a boolean
+  lookup table indexed by the codes.
+* Plant names are lower-cased and factorized. Substring search is a literal
+  (non-regex) vectorized scan over the unique names only, narrowed to the
+  matches of an earlier query when the new one extends it (typing "cac" after
+  "ca" only re-checks the names that contained "ca").
+
+All predicates are and-ed into one mask and the resulting row positions are
+memoized per ``(query, soil, water)``.
+"""
+
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+from plant_care.datasets import dataset_version, load_plant_data
+from plant_care.name_index import normalize_name, normalize_names
+
+
+def _encode(values):
+    """Integer codes plus the category list (codes of -1 mean missing)."""
+    codes, categories = pd.factorize(pd.Series(values))
+    return codes, categories.tolist()
+
+
+def _lookup_table(categories, selected):
+    """Boolean table for ``table[codes]``; the extra last slot is for code -1."""
+    table = np.zeros(len(categories) + 1, dtype=bool)
+    selected = set(selected)
+    for code, category in enumerate(categories):
+        if category in selected:
+            table[code] = True
+    return table
+
+
+class PlantFilter:
+    """Pre-encoded catalog answering (query, soil, water) filter requests."""
+
+    def __init__(self, frame, cache_size=256):
+        self.frame = frame
+        self._name_codes, names = _encode(normalize_names(frame["Plant Name"].to_numpy()))
+        self._names = pd.Series(names, dtype="string")
+        self._soil_codes, self.soil_options = _encode(frame["Soil Type"].to_numpy())
+        self._water_codes, self.water_options = _encode(frame["Watering"].to_numpy())
+        self._cache_size = cache_size
+        self._cache = OrderedDict()
+        self._name_matches = OrderedDict()
+        self._cache_lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.frame)
+
+    def _matching_names(self, query):
+        """Ids of the unique lower-case names containing ``query``."""
+        with self._cache_lock:
+            matches = self._name_matches.get(query)
+            if matches is not None:
+                return matches
+            # Only names matching the longest earlier query contained in this one can match
+            narrower = [known for known in self._name_matches if known in query]
+            candidates = self._name_matches[max(narrower, key=len)] if narrower else None
+
+        names = self._names if candidates is None else self._names.iloc[candidates]
+        found = names.str.contains(query, regex=False).to_numpy(dtype=bool, na_value=False)
+        matches = np.flatnonzero(found) if candidates is None else candidates[found]
+
+        with self._cache_lock:
+            self._name_matches[query] = matches
+            while len(self._name_matches) > self._cache_size:
+                self._name_matches.popitem(last=False)
+        return matches
+
+    def _compute(self, query, soil, water):
+        mask = None
+        predicates = []
+        if query:
+            name_table = np.zeros(len(self._names) + 1, dtype=bool)
+            name_table[self._matching_names(query)] = True
+            predicates.append((name_table, self._name_codes))
+        if soil:
+            predicates.append((_lookup_table(self.soil_options, soil), self._soil_codes))
+        if water:
+            predicates.append((_lookup_table(self.water_options, water), self._water_codes))
+
+        for table, codes in predicates:
+            if mask is None:
+                mask = table[codes]
+            else:
+                mask &= table[codes]
+        if mask is None:
+            positions = np.arange(len(self.frame))
+        else:
+            positions = np.flatnonzero(mask)
+        positions.flags.writeable = False
+        return positions
+
+    def positions(self, query="", soil=(), water=()):
+        """Row positions matching every predicate (memoized, read-only)."""
+        key = (normalize_name(query) if query else "", tuple(sorted(soil)), tuple(sorted(water)))
+        with self._cache_lock:
+            positions = self._cache.get(key)
+            if positions is not None:
+                self._cache.move_to_end(key)
+                return positions
+        positions = self._compute(*key)
+        with self._cache_lock:
+            self._cache[key] = positions
+            while len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+        return positions
+
+    def apply(self, query="", soil=(), water=()):
+        """Matching rows of the catalog, in catalog order."""
+        return self.frame.iloc[self.positions(query, soil, water)]
+
+
+_lock = threading.Lock()
+_cached = {"version": None, "filter": None}
+
+
+def get_plant_filter():
+    """Filter engine for the current plant catalog, rebuilt when it changes."""
+    version = dataset_version("plants")
+    with _lock:
+        if _cached["version"] != version:
+            _cached["filter"] = PlantFilter(load_plant_data())
+            _cached["version"] = version
+        return _cached["filter"]
@@ -0,0 +1,145 @@
+"""Growth-condition scoring, for one plant in the UI or many pots at once.
+
+A reading (sunlight hours, soil type, height) is compared with the plant's
+ideal values from plant_data.csv. The total absolute deviation gives the
+Fast/Moderate/Slow growth class and each factor gets a recommendation code.
+The same NumPy code scores a single reading from plant.py and whole frames
+of sensor readings in :func:`analyze_growth_batch`.
+"""
+
+import numpy as np
+import pandas as pd
+
+from plant_care.name_index import normalize_names
+
+# Convert categorical values to numeric for comparison (unknown soils are 0)
+SOIL_MAPPING = {"Sandy": 1, "Clay": 2, "Loamy": 3, "Silty": 4, "Peaty": 5}
+SOIL_TYPES = list(SOIL_MAPPING)
+GROWTH_MAPPING = {"Slow": 1, "Medium": 2, "Fast": 3}
+
+# Deviations up to this total still count as "Moderate" growth
+MODERATE_DEVIATION = 10
+
+UNKNOWN_PLANT = "Unknown"
+
+# Recommendation codes
+INCREASE_SUNLIGHT = "increase_sunlight"
+REDUCE_SUNLIGHT = "reduce_sunlight"
+SUNLIGHT_OK = "sunlight_ok"
+CHANGE_SOIL = "change_soil"
+SOIL_OK = "soil_ok"
+INCREASE_HEIGHT = "increase_height"
+TALLER_THAN_USUAL = "taller_than_usual"
+HEIGHT_OK = "height_ok"
+
+# Columns expected in a readings file (same names as plant_data.csv)
+READING_COLUMNS = ["Plant Name", "Sunlight Hours", "Soil Type", "Height (cm)"]
+
+
+def soil_numeric(soil_types):
+    """Numeric soil codes for an array of soil type names."""
+    return pd.Series(soil_types, dtype=object).map(SOIL_MAPPING).fillna(0).to_numpy(dtype=float)
+
+
+def ideal_table(plant_df):
+    """Ideal conditions per normalized plant key (first row wins on duplicates)."""
+    ideal = pd.DataFrame({
+        "key": normalize_names(plant_df["Plant Name"].to_numpy()).to_numpy(),
+        "ideal_sunlight": pd.to_numeric(plant_df["Sunlight Hours"], errors="coerce").to_numpy(),
+        "ideal_soil": plant_df["Soil Type"].to_numpy(),
+        "ideal_height": pd.to_numeric(plant_df["Height (cm)"], errors="coerce").to_numpy(),
+    })
+    ideal["ideal_soil_numeric"] = soil_numeric(ideal["ideal_soil"])
+    return ideal.dropna(subset=["key"]).drop_duplicates("key").set_index("key")
+
+
+def score_growth(sunlight, soil, height, ideal_sunlight, ideal_soil, ideal_height):
+    """Deviation, growth class and recommendation codes for array inputs.
+
+    ``soil`` and ``ideal_soil`` are numeric soil codes. Rows whose ideal
+    sunlight is missing (plant not in the catalog) or whose sunlight or height
+    reading is missing get NaN deviation, the "Unknown" growth class and no
+    advice. A missing ideal height leaves height out of the deviation and
+    gets no height advice.
+    """
+    sunlight, soil, height = (np.asarray(a, dtype=float) for a in (sunlight, soil, height))
+    ideal_sunlight, ideal_soil, ideal_height = (
+        np.asarray(a, dtype=float) for a in (ideal_sunlight, ideal_soil, ideal_height)
+    )
+    unknown = np.isnan(ideal_sunlight) | np.isnan(sunlight) | np.isnan(height)
+    no_ideal_height = np.isnan(ideal_height)
+    height_deviation = np.where(no_ideal_height, 0, np.abs(height - ideal_height))
+    deviation = np.abs(sunlight - ideal_sunlight) + np.abs(soil - ideal_soil) + height_deviation
+    deviation = np.where(unknown, np.nan, deviation)
+    return {
+        "deviation": deviation,
+        "growth_rate": np.select(
+            [unknown, deviation == 0, deviation <= MODERATE_DEVIATION],
+            [UNKNOWN_PLANT, "Fast", "Moderate"],
+            "Slow",
+        ),
+        "sunlight_advice": np.select(
+            [unknown, sunlight < ideal_sunlight, sunlight > ideal_sunlight],
+            ["", INCREASE_SUNLIGHT, REDUCE_SUNLIGHT],
+            SUNLIGHT_OK,
+        ),
+        "soil_advice": np.select([unknown, soil != ideal_soil], ["", CHANGE_SOIL], SOIL_OK),
+        "height_advice": np.select(
+            [unknown | no_ideal_height, height < ideal_height, height > ideal_height],
+            ["", INCREASE_HEIGHT, TALLER_THAN_USUAL],
+            HEIGHT_OK,
+        ),
+    }
+
+
+def score_reading(plant_details, sunlight_hours, soil_type, plant_height):
+    """Score one reading against one catalog row (a Series from plant_data.csv).
+
+    Raises ``KeyError`` if the row lacks one of the ideal-condition columns.
+    """
+    ideal_sunlight = int(plant_details["Sunlight Hours"])
+    ideal_soil = plant_details["Soil Type"]
+    ideal_height = int(plant_details["Height (cm)"]) if pd.notna(plant_details["Height (cm)"]) else np.nan
+    user_soil_numeric = SOIL_MAPPING.get(soil_type, 0)
+    ideal_soil_numeric = SOIL_MAPPING.get(ideal_soil, 0)
+
+    scores = score_growth(
+        sunlight_hours, user_soil_numeric, plant_height, ideal_sunlight, ideal_soil_numeric, ideal_height
+    )
+    result = {name: value.item() for name, value in scores.items()}
+    result.update(
+        ideal_sunlight=ideal_sunlight,
+        ideal_soil=ideal_soil,
+        ideal_height=ideal_height,
+        user_soil_numeric=user_soil_numeric,
+        ideal_soil_numeric=ideal_soil_numeric,
+    )
+    return result
+
+
+def analyze_growth_batch(readings, ideal):
+    """Score a frame of readings against an :func:`ideal_table` in one pass.
+
+    Extra columns in ``readings`` (pot ids, timestamps...) are passed through.
+    """
+    missing = [col for col in READING_COLUMNS if col not in readings.columns]
+    if missing:
+        raise KeyError(f"readings are missing columns: {', '.join(missing)}")
+
+    keys = normalize_names(readings["Plant Name"].to_numpy())
+    matched = ideal.reindex(keys.to_numpy())
+    scores = score_growth(
+        pd.to_numeric(readings["Sunlight Hours"], errors="coerce").to_numpy(),
+        soil_numeric(readings["Soil Type"].to_numpy()),
+        pd.to_numeric(readings["Height (cm)"], errors="coerce").to_numpy(),
+        matched["ideal_sunlight"].to_numpy(),
+        matched["ideal_soil_numeric"].to_numpy(),
+        matched["ideal_height"].to_numpy(),
+    )
+    result = readings.reset_index(drop=True)
+    result["Ideal Sunlight Hours"] = matched["ideal_sunlight"].to_numpy()
+    result["Ideal Soil Type"] = matched["ideal_soil"].to_numpy()
+    result["Ideal Height (cm)"] = matched["ideal_height"].to_numpy()
+    for name, values in scores.items():
+        result[name] = values
+    return result
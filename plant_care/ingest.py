@@ -0,0 +1,288 @@
+"""Streaming ingestion of environment sensor readings.
+
+Readings have the columns of environment_data.csv (plant name, season,
+temperature, humidity, AQI; extra columns such as a timestamp are ignored)
+and arrive append-only in files or on stdin. Each chunk is folded into
+running per-(plant, season) aggregates (count, sum, min, max of every
+reading column), so history is never re-scanned: the aggregates are saved
+to a state file together with the byte offset reached in every input file,
+and the next run continues from there.
+
+Readers run in their own threads and hand chunks to the aggregator through a
+bounded queue, which caps the memory held by bursty input at
+``max_pending * chunksize`` rows. When the queue is full the reader either
+blocks (the default; stdin producers then block on the pipe) or drops the
+chunk and counts it.
+
+The means feed :func:`plant_care.seasons.score_seasons` and the environment
+charts exactly like ``season_means(environment_data.csv)`` does.
+"""
+
+import io
+import itertools
+import os
+import queue
+import sys
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+
+from plant_care.datasets import CACHE_DIR, ENV_NUMERIC_COLUMNS, prepare_environment
+from plant_care.name_index import normalize_names
+from plant_care.seasons import SeasonScores, score_seasons
+
+STATE_FILE = os.path.join(CACHE_DIR, "sensor_aggregates.npz")
+
+DEFAULT_CHUNKSIZE = 10_000
+DEFAULT_MAX_PENDING = 8
+
+# What a reader does when the queue is full
+BLOCK, DROP = "block", "drop"
+
+STATS = ["count", "sum", "min", "max"]
+_FORMAT_VERSION = 1
+
+
+class SensorAggregates:
+    """Running per-(plant key, season) count/sum/min/max of the reading columns."""
+
+    def __init__(self, table=None, offsets=None, rows=0, dropped_rows=0, version=0):
+        columns = pd.MultiIndex.from_product([ENV_NUMERIC_COLUMNS, STATS])
+        index = pd.MultiIndex.from_arrays([[], []], names=["key", "season"])
+        self.table = table if table is not None else pd.DataFrame(columns=columns, index=index, dtype=float)
+        self.offsets = dict(offsets or {})
+        self.rows = rows
+        self.dropped_rows = dropped_rows
+        self.version = version
+        # (mtime_ns, size) of the state file it was loaded from, set by get_sensor_aggregates
+        self.signature = None
+        self._scores = None
+
+    def update(self, chunk):
+        """Fold one chunk of readings into the aggregates; returns the rows used."""
+        chunk = prepare_environment(chunk.copy(deep=False))
+        missing = [col for col in ["plant name", "season", *ENV_NUMERIC_COLUMNS] if col not in chunk.columns]
+        if missing:
+            raise ValueError(f"readings are missing column(s): {', '.join(missing)}")
+
+        readings = chunk[ENV_NUMERIC_COLUMNS].assign(
+            key=normalize_names(chunk["plant name"].to_numpy()).to_numpy(),
+            season=chunk["season"].astype("string").str.strip().to_numpy(),
+        )
+        grouped = readings.groupby(["key", "season"])[ENV_NUMERIC_COLUMNS].agg(STATS).astype(float)
+        if grouped.empty:
+            return 0
+
+        index = self.table.index.union(grouped.index)
+        old = self.table.reindex(index)
+        new = grouped.reindex(index)
+        merged = old.copy()
+        for col in ENV_NUMERIC_COLUMNS:
+            for stat in ("count", "sum"):
+                merged[(col, stat)] = old[(col, stat)].fillna(0) + new[(col, stat)].fillna(0)
+            merged[(col, "min")] = np.fmin(old[(col, "min")], new[(col, "min")])
+            merged[(col, "max")] = np.fmax(old[(col, "max")], new[(col, "max")])
+        self.table = merged
+        used = int(readings[["key", "season"]].notna().all(axis=1).sum())
+        self.rows += used
+        self.version += 1
+        self._scores = None
+        return used
+
+    def means(self):
+        """Per-(key, season) means in the layout of :func:`plant_care.seasons.season_means`."""
+        means = pd.DataFrame(index=self.table.index)
+        for col in ENV_NUMERIC_COLUMNS:
+            count = self.table[(col, "count")]
+            means[col] = self.table[(col, "sum")] / count.where(count > 0)
+        return means.reset_index()
+
+    def summary(self):
+        """Flat table with mean, min, max and count per reading column."""
+        summary = pd.DataFrame(index=self.table.index)
+        for col in ENV_NUMERIC_COLUMNS:
+            count = self.table[(col, "count")]
+            summary[f"{col} mean"] = self.table[(col, "sum")] / count.where(count > 0)
+            summary[f"{col} min"] = self.table[(col, "min")]
+            summary[f"{col} max"] = self.table[(col, "max")]
+            summary[f"{col} count"] = count.astype(np.int64)
+        return summary.reset_index()
+
+    def season_scores(self):
+        """Default-range :class:`SeasonScores` of the current means (cached per update)."""
+        if self._scores is None:
+            self._scores = SeasonScores(score_seasons(self.means()))
+        return self._scores
+
+    def save(self, path=STATE_FILE):
+        """Write the aggregates and input offsets (atomically)."""
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp.npz"
+        np.savez(
+            tmp_path,
+            format_version=np.array(_FORMAT_VERSION),
+            keys=self.table.index.get_level_values("key").to_numpy(dtype=str),
+            seasons=self.table.index.get_level_values("season").to_numpy(dtype=str),
+            values=self.table.to_numpy(dtype=float),
+            offset_paths=np.array(list(self.offsets), dtype=str),
+            offset_values=np.array(list(self.offsets.values()), dtype=np.int64),
+            counters=np.array([self.rows, self.dropped_rows, self.version], dtype=np.int64),
+        )
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path=STATE_FILE):
+        """Saved aggregates, or None if there is no (readable) state file."""
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                if int(data["format_version"]) != _FORMAT_VERSION:
+                    return None
+                index = pd.MultiIndex.from_arrays([data["keys"].tolist(), data["seasons"].tolist()],
+                                                  names=["key", "season"])
+                columns = pd.MultiIndex.from_product([ENV_NUMERIC_COLUMNS, STATS])
+                table = pd.DataFrame(data["values"], index=index, columns=columns)
+                offsets = dict(zip(data["offset_paths"].tolist(), data["offset_values"].tolist()))
+                rows, dropped_rows, version = data["counters"].tolist()
+        except (OSError, KeyError, ValueError):
+            return None
+        return cls(table, offsets, rows, dropped_rows, version)
+
+
+def iter_file_chunks(path, chunksize=DEFAULT_CHUNKSIZE, offset=0, follow=False, poll_interval=1.0, stop=None):
+    """Yield ``(chunk, offset)`` for complete lines of an append-only CSV.
+
+    Reading starts at byte ``offset`` (the header is always re-read), and
+    ``offset`` in each pair is where the next run should continue. With
+    ``follow``, waits for more lines like ``tail -f`` until ``stop`` is set;
+    a trailing line without a newline is then left for the next poll. A file
+    that shrank below ``offset`` is treated as rotated and read from the top.
+    """
+    with open(path, "rb") as f:
+        header = f.readline()
+        data_start = f.tell()
+        if offset < data_start or offset > os.fstat(f.fileno()).st_size:
+            offset = data_start
+        f.seek(offset)
+        while stop is None or not stop.is_set():
+            position = f.tell()
+            lines = list(itertools.islice(f, chunksize))
+            if lines and follow and not lines[-1].endswith(b"\n"):
+                # Partial line still being written: keep it for the next poll
+                f.seek(position + sum(map(len, lines[:-1])))
+                lines.pop()
+            if lines:
+                yield pd.read_csv(io.BytesIO(header + b"".join(lines))), f.tell()
+                continue
+            if not follow:
+                return
+            if os.fstat(f.fileno()).st_size < f.tell():
+                f.seek(data_start)
+            time.sleep(poll_interval)
+
+
+def _iter_source(source, chunksize, offset, follow, poll_interval, stop):
+    if source == "-":
+        for chunk in pd.read_csv(sys.stdin, chunksize=chunksize):
+            yield chunk, None
+    else:
+        yield from iter_file_chunks(source, chunksize, offset, follow, poll_interval, stop)
+
+
+def ingest(sources, aggregates, chunksize=DEFAULT_CHUNKSIZE, max_pending=DEFAULT_MAX_PENDING, on_full=BLOCK,
+           follow=False, poll_interval=1.0, state_path=None, checkpoint_interval=5.0):
+    """Stream ``sources`` (paths, ``-`` for stdin) into ``aggregates``.
+
+    Returns counters: chunks and rows applied, rows dropped by the ``drop``
+    policy and the highest queue depth seen. With ``state_path`` the
+    aggregates are saved every ``checkpoint_interval`` seconds and at the end.
+    With ``follow`` this runs until interrupted.
+    """
+    if on_full not in (BLOCK, DROP):
+        raise ValueError(f"on_full must be {BLOCK!r} or {DROP!r}")
+    pending = queue.Queue(maxsize=max_pending)
+    stop = threading.Event()
+    done = object()
+    stats = {"chunks": 0, "rows": 0, "dropped_rows": 0, "max_pending": 0}
+    stats_lock = threading.Lock()
+    errors = []
+
+    def read(source):
+        key = source if source == "-" else os.path.abspath(source)
+        try:
+            for chunk, offset in _iter_source(source, chunksize, aggregates.offsets.get(key, 0), follow,
+                                              poll_interval, stop):
+                item = (key, chunk, offset)
+                if on_full == BLOCK:
+                    while not stop.is_set():
+                        try:
+                            pending.put(item, timeout=0.1)
+                            break
+                        except queue.Full:
+                            pass
+                else:
+                    try:
+                        pending.put_nowait(item)
+                    except queue.Full:
+                        with stats_lock:
+                            stats["dropped_rows"] += len(chunk)
+        except Exception as e:  # surfaced by the aggregator below
+            errors.append(e)
+        finally:
+            pending.put(done)
+
+    readers = [threading.Thread(target=read, args=(source,), name=f"ingest-{source}", daemon=True)
+               for source in sources]
+    for reader in readers:
+        reader.start()
+
+    finished = 0
+    last_checkpoint = time.monotonic()
+    try:
+        while finished < len(readers):
+            stats["max_pending"] = max(stats["max_pending"], pending.qsize())
+            item = pending.get()
+            if item is done:
+                finished += 1
+                continue
+            key, chunk, offset = item
+            stats["rows"] += aggregates.update(chunk)
+            stats["chunks"] += 1
+            if offset is not None:
+                aggregates.offsets[key] = offset
+            if state_path and time.monotonic() - last_checkpoint >= checkpoint_interval:
+                aggregates.save(state_path)
+                last_checkpoint = time.monotonic()
+        if errors:
+            raise errors[0]
+    finally:
+        stop.set()
+        aggregates.dropped_rows += stats["dropped_rows"]
+        if state_path:
+            aggregates.save(state_path)
+    return stats
+
+
+_lock = threading.Lock()
+_cached = {"signature": None, "aggregates": None}
+
+
+def get_sensor_aggregates(path=STATE_FILE):
+    """Aggregates saved by ``python -m plant_care ingest``, reloaded when the file changes.
+
+    Returns None while nothing has been ingested.
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    signature = (path, stat.st_mtime_ns, stat.st_size)
+    with _lock:
+        if _cached["signature"] != signature:
+            aggregates = SensorAggregates.load(path)
+            if aggregates is not None:
+                aggregates.signature = signature[1:]
+            _cached["aggregates"] = aggregates
+            _cached["signature"] = signature
+        return _cached["aggregates"]
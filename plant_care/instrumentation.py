@@ -0,0 +1,288 @@
+"""Opt-in timing and allocation instrumentation for the Streamlit pages.
+
+Profiling is off unless ``PLANT_CARE_PROFILE=1`` is set (every rerun) or
+``PLANT_CARE_PROFILE_TOKEN`` is set and a session opens the app with
+``?profile=<token>`` (that session's reruns); without the token anonymous
+visitors cannot switch it on. While a profiled rerun runs, :func:`span`
+records how long each stage takes (dataset loads, filtering, thumbnail
+decode, chart rendering, image serialization...) and :func:`profiled_rerun`
+records the rerun's total time and the memory it allocated (``tracemalloc``:
+peak and retained bytes). Allocation tracing is process-wide, so it only
+runs while at least one profiled rerun is active, and allocations are only
+recorded for reruns that did not overlap another profiled rerun. Outside a
+profiled rerun :func:`span` is a shared no-op.
+
+Recent samples per (page, stage) are kept in bounded windows and reported as
+p50/p90/p99. A background thread writes them every ``PLANT_CARE_PROFILE_INTERVAL``
+seconds to ``metrics.json`` and ``metrics.prom`` (Prometheus text format)
+in the cache directory, and :func:`diagnostics_panel` shows them in the
+sidebar of profiled sessions.
+"""
+
+import atexit
+import hmac
+import json
+import os
+import threading
+import time
+import tracemalloc
+from collections import deque
+
+import numpy as np
+
+ENABLED = os.environ.get("PLANT_CARE_PROFILE", "").lower() in ("1", "true", "yes", "on")
+PROFILE_TOKEN = os.environ.get("PLANT_CARE_PROFILE_TOKEN", "")
+FLUSH_INTERVAL = float(os.environ.get("PLANT_CARE_PROFILE_INTERVAL", 30))
+
+# Samples kept per (page, stage) for the percentiles
+WINDOW = 1000
+QUANTILES = (0.5, 0.9, 0.99)
+
+RERUN = "rerun"
+
+_local = threading.local()
+
+
+class _NullSpan:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Series:
+    """Bounded window of samples plus all-time count and sum."""
+
+    def __init__(self):
+        self.samples = deque(maxlen=WINDOW)
+        self.count = 0
+        self.total = 0.0
+
+    def add(self, value):
+        self.samples.append(value)
+        self.count += 1
+        self.total += value
+
+    def summary(self):
+        quantiles = np.quantile(np.fromiter(self.samples, dtype=float), QUANTILES) if self.samples else []
+        return {
+            "count": self.count,
+            "sum": self.total,
+            **{f"p{round(q * 100)}": float(value) for q, value in zip(QUANTILES, quantiles)},
+        }
+
+
+class Registry:
+    """Stage timings (seconds) and per-rerun allocations (bytes) by page."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.timings = {}
+        self.allocations = {}
+
+    def record(self, table, page, name, value):
+        with self._lock:
+            series = table.get((page, name))
+            if series is None:
+                series = table[(page, name)] = _Series()
+            series.add(value)
+
+    def snapshot(self):
+        """{"stages": [...], "allocations": [...]} with one summary per (page, name)."""
+        with self._lock:
+            return {
+                "generated_at": time.time(),
+                "stages": [dict(page=page, stage=stage, **series.summary())
+                           for (page, stage), series in sorted(self.timings.items())],
+                "allocations": [dict(page=page, kind=kind, **series.summary())
+                                for (page, kind), series in sorted(self.allocations.items())],
+            }
+
+
+registry = Registry()
+
+
+class _Span:
+    def __init__(self, rerun, stage):
+        self.rerun = rerun
+        self.stage = stage
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        registry.record(registry.timings, self.rerun["page"], self.stage, time.perf_counter() - self.start)
+        return False
+
+
+def span(stage):
+    """Time ``stage`` when the current thread is running a profiled rerun."""
+    rerun = getattr(_local, "rerun", None)
+    if rerun is None:
+        return _NULL_SPAN
+    return _Span(rerun, stage)
+
+
+def is_profiling():
+    """True inside a profiled rerun."""
+    return getattr(_local, "rerun", None) is not None
+
+
+def profile_requested(token):
+    """True if ``token`` (the ``?profile=`` value) matches ``PLANT_CARE_PROFILE_TOKEN``."""
+    return bool(PROFILE_TOKEN) and token is not None and hmac.compare_digest(str(token), PROFILE_TOKEN)
+
+
+def profiling_available(requested=False):
+    """True if reruns of this session are profiled (and the diagnostics panel is shown)."""
+    return ENABLED or requested
+
+
+# Profiled reruns in flight; tracemalloc runs only while there is one. Every rerun that
+# starts while another is active bumps the epoch, which marks both as overlapping.
+_tracing_lock = threading.Lock()
+_tracing = {"active": 0, "epoch": 0, "owner": False}
+
+
+class profiled_rerun:
+    """Profile one script run of ``page`` if profiling is enabled or ``requested``."""
+
+    def __init__(self, page, requested=False):
+        self.page = page
+        self.active = profiling_available(requested)
+
+    def __enter__(self):
+        if not self.active:
+            return self
+        with _tracing_lock:
+            self.alone = _tracing["active"] == 0
+            if self.alone:
+                if not tracemalloc.is_tracing():
+                    tracemalloc.start()
+                    _tracing["owner"] = True
+                tracemalloc.reset_peak()
+            else:
+                _tracing["epoch"] += 1
+            _tracing["active"] += 1
+            self.epoch = _tracing["epoch"]
+            self.base_memory = tracemalloc.get_traced_memory()[0]
+        _local.rerun = {"page": self.page}
+        _start_flusher()
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        # st.rerun()/st.switch_page() end a run by raising; the run is still recorded
+        if not self.active:
+            return False
+        elapsed = time.perf_counter() - self.start
+        _local.rerun = None
+        with _tracing_lock:
+            current, peak = tracemalloc.get_traced_memory()
+            solo = self.alone and self.epoch == _tracing["epoch"]
+            _tracing["active"] -= 1
+            if _tracing["active"] == 0 and _tracing["owner"]:
+                tracemalloc.stop()
+                _tracing["owner"] = False
+        registry.record(registry.timings, self.page, RERUN, elapsed)
+        if solo:
+            registry.record(registry.allocations, self.page, "peak_bytes", max(0, peak - self.base_memory))
+            registry.record(registry.allocations, self.page, "retained_bytes", current - self.base_memory)
+        return False
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def prometheus_text(snapshot):
+    """Render a :meth:`Registry.snapshot` as Prometheus summaries."""
+    lines = []
+    for metric, help_text, rows, label in (
+        ("plant_care_stage_seconds", "Duration of instrumented stages per rerun.", snapshot["stages"], "stage"),
+        ("plant_care_rerun_memory_bytes", "Memory allocated per rerun (tracemalloc).", snapshot["allocations"], "kind"),
+    ):
+        lines.append(f"# HELP {metric} {help_text}")
+        lines.append(f"# TYPE {metric} summary")
+        for row in rows:
+            labels = f'page="{_escape(row["page"])}",{label}="{_escape(row[label])}"'
+            for q in QUANTILES:
+                key = f"p{round(q * 100)}"
+                if key in row:
+                    lines.append(f'{metric}{{{labels},quantile="{q}"}} {row[key]:.9g}')
+            lines.append(f"{metric}_sum{{{labels}}} {row['sum']:.9g}")
+            lines.append(f"{metric}_count{{{labels}}} {row['count']}")
+    return "\n".join(lines) + "\n"
+
+
+def metrics_dir():
+    from plant_care.datasets import CACHE_DIR
+
+    return os.environ.get("PLANT_CARE_METRICS_DIR", CACHE_DIR)
+
+
+def _write_atomic(path, text):
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(text)
+    os.replace(tmp_path, path)
+
+
+def flush(directory=None):
+    """Write metrics.json and metrics.prom; returns their paths."""
+    directory = directory or metrics_dir()
+    os.makedirs(directory, exist_ok=True)
+    snapshot = registry.snapshot()
+    json_path = os.path.join(directory, "metrics.json")
+    prom_path = os.path.join(directory, "metrics.prom")
+    _write_atomic(json_path, json.dumps(snapshot, indent=1))
+    _write_atomic(prom_path, prometheus_text(snapshot))
+    return json_path, prom_path
+
+
+_flusher_lock = threading.Lock()
+_flusher = {"thread": None}
+
+
+def _flush_loop():
+    while True:
+        time.sleep(FLUSH_INTERVAL)
+        try:
+            flush()
+        except OSError:
+            pass  # read-only deployments still get the diagnostics panel
+
+
+def _start_flusher():
+    with _flusher_lock:
+        if _flusher["thread"] is None:
+            _flusher["thread"] = threading.Thread(target=_flush_loop, name="metrics-flush", daemon=True)
+            _flusher["thread"].start()
+            atexit.register(lambda: flush() if registry.timings else None)
+
+
+def diagnostics_panel():
+    """Sidebar expander with the stage percentiles."""
+    import pandas as pd
+    import streamlit as st
+
+    snapshot = registry.snapshot()
+    with st.sidebar.expander("🩺 Diagnostics", expanded=False):
+        if not snapshot["stages"]:
+            st.write("No profiled reruns yet.")
+            return
+        stages = pd.DataFrame(snapshot["stages"]).set_index(["page", "stage"])
+        for col in ("sum", "p50", "p90", "p99"):
+            if col in stages:
+                stages[col] = stages[col] * 1000  # ms
+        st.write("⏱️ Stage time (ms)")
+        st.dataframe(stages.round(2))
+        if snapshot["allocations"]:
+            allocations = pd.DataFrame(snapshot["allocations"]).set_index(["page", "kind"])
+            st.write("🧠 Allocated per rerun (KiB)")
+            st.dataframe((allocations.drop(columns=["count", "sum"]) / 1024).round(1))
@@ -0,0 +1,237 @@
+"""Leaf-color health analysis of plant photos.
+
+A photo is decoded at reduced size (the JPEG decoder downscales while
+decoding), converted to HSV and classified per pixel with array operations:
+pixels that are too grey or too dark to carry a hue (background, shadows)
+are ignored, and the rest fall into hue bands -- green, yellow, brown and
+purplish -- with dark green split off by brightness. The band ratios and a
+hue histogram are then mapped onto the leaf issues of
+:data:`plant_care.analysis.LEAF_ISSUES` ("Yellow", "Brown", "Purplish",
+"Dark Green"; drooping is a shape, not a color, and is not detected).
+
+Ratios are shares of the colored pixels, so close-ups of the leaves work
+best: flowers and terracotta pots count as yellow/brown too.
+
+Measurements are cached on disk by the blake2b digest of the image bytes,
+so re-scoring an unchanged photo (or the same upload twice) is a file read;
+issue thresholds are applied on top of the cached ratios and can change
+without invalidating it. :func:`analyze_files` scores many photos on a
+process pool.
+"""
+
+import hashlib
+import io
+import json
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from typing import Optional, Tuple
+
+import numpy as np
+from PIL import Image
+
+from plant_care.datasets import CACHE_DIR
+
+CACHE_SUBDIR = os.path.join(CACHE_DIR, "leaf_colors")
+
+# Longest side of the image the ratios are measured on
+ANALYSIS_SIZE = 128
+
+# Pixels need this much saturation and brightness (0-1) to count as colored
+MIN_SATURATION = 0.25
+MIN_VALUE = 0.15
+
+# Hue bands in degrees; brown is a dark orange/yellow and dark green a dark green
+GREEN_HUES = (70, 170)
+YELLOW_HUES = (45, 70)
+BROWN_HUES = (10, 70)
+PURPLE_HUES = (260, 335)
+BROWN_MAX_VALUE = 0.65
+YELLOW_MIN_VALUE = 0.45
+DARK_GREEN_MAX_VALUE = 0.35
+
+HUE_BINS = 36
+
+# Leaf issue -> (ratio measured, share of colored pixels above which it is reported)
+ISSUE_THRESHOLDS = {
+    "Yellow": ("yellow", 0.20),
+    "Brown": ("brown", 0.30),
+    "Purplish": ("purplish", 0.15),
+    "Dark Green": ("dark_green", 0.60),
+}
+# Excess nitrogen only shows on mostly green foliage
+MIN_GREEN_FOR_DARK = 0.30
+
+IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png", ".webp", ".bmp")
+
+# Bump when the measurement itself changes, so older cache entries are ignored
+_FORMAT_VERSION = 1
+
+
+@dataclass(frozen=True)
+class LeafColorResult:
+    digest: str
+    width: int
+    height: int
+    coverage: float          # share of pixels colored enough to classify
+    green: float             # shares of the colored pixels
+    yellow: float
+    brown: float
+    purplish: float
+    dark_green: float        # share of the green pixels that are dark
+    hue_histogram: Tuple[float, ...]
+    cached: bool = False
+
+    @property
+    def issues(self) -> Tuple[str, ...]:
+        """Leaf issues whose ratio is above its threshold, strongest first."""
+        found = []
+        for issue, (ratio, threshold) in ISSUE_THRESHOLDS.items():
+            value = getattr(self, ratio)
+            if issue == "Dark Green" and self.green < MIN_GREEN_FOR_DARK:
+                continue
+            if value >= threshold:
+                found.append((value / threshold, issue))
+        return tuple(issue for _, issue in sorted(found, reverse=True))
+
+    @property
+    def primary_issue(self) -> Optional[str]:
+        return self.issues[0] if self.issues else None
+
+
+def content_digest(data):
+    """Cache key of an image's bytes."""
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def hsv_pixels(data, size=ANALYSIS_SIZE):
+    """Decode image bytes at most ``size`` pixels wide/high; returns (hue degrees, saturation, value)."""
+    with Image.open(io.BytesIO(data)) as img:
+        img.draft("RGB", (size, size))
+        img = img.convert("RGB")
+        img.thumbnail((size, size))
+        hsv = np.asarray(img.convert("HSV"))
+    hue = hsv[..., 0].astype(np.float32) * (360 / 256)
+    return hue, hsv[..., 1] / np.float32(255), hsv[..., 2] / np.float32(255)
+
+
+def _between(hue, band):
+    return (hue >= band[0]) & (hue < band[1])
+
+
+def measure(data, digest=None):
+    """:class:`LeafColorResult` for image bytes (not cached)."""
+    hue, saturation, value = hsv_pixels(data)
+    colored = (saturation >= MIN_SATURATION) & (value >= MIN_VALUE)
+    n_colored = int(colored.sum())
+    share = 1 / n_colored if n_colored else 0.0
+
+    green = colored & _between(hue, GREEN_HUES)
+    yellow = colored & _between(hue, YELLOW_HUES) & (value >= YELLOW_MIN_VALUE)
+    brown = colored & _between(hue, BROWN_HUES) & (value < BROWN_MAX_VALUE) & ~yellow
+    purplish = colored & _between(hue, PURPLE_HUES)
+    n_green = int(green.sum())
+    dark_green = int((green & (value < DARK_GREEN_MAX_VALUE)).sum())
+
+    histogram = np.bincount((hue[colored] * (HUE_BINS / 360)).astype(np.int64), minlength=HUE_BINS)[:HUE_BINS]
+    return LeafColorResult(
+        digest=digest or content_digest(data),
+        width=hue.shape[1],
+        height=hue.shape[0],
+        coverage=round(n_colored / hue.size, 4) if hue.size else 0.0,
+        green=round(n_green * share, 4),
+        yellow=round(int(yellow.sum()) * share, 4),
+        brown=round(int(brown.sum()) * share, 4),
+        purplish=round(int(purplish.sum()) * share, 4),
+        dark_green=round(dark_green / n_green, 4) if n_green else 0.0,
+        hue_histogram=tuple(np.round(histogram * share, 4).tolist()),
+    )
+
+
+def _cache_file(digest, cache_dir):
+    return os.path.join(cache_dir, digest[:2], f"{digest}.v{_FORMAT_VERSION}.json")
+
+
+def _read_cached(digest, cache_dir):
+    try:
+        with open(_cache_file(digest, cache_dir), encoding="utf-8") as f:
+            fields = json.load(f)
+        fields["hue_histogram"] = tuple(fields["hue_histogram"])
+        return LeafColorResult(**fields, cached=True)
+    except (OSError, ValueError, TypeError):
+        return None
+
+
+def _write_cached(result, cache_dir):
+    path = _cache_file(result.digest, cache_dir)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    fields = asdict(result)
+    del fields["cached"]
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(fields, f)
+    os.replace(tmp_path, path)
+
+
+def analyze_bytes(data, cache_dir=CACHE_SUBDIR):
+    """Cached :class:`LeafColorResult` for image bytes (e.g. an upload).
+
+    Raises ``OSError`` (``PIL.UnidentifiedImageError``) if they are not an image.
+    """
+    digest = content_digest(data)
+    if cache_dir:
+        cached = _read_cached(digest, cache_dir)
+        if cached is not None:
+            return cached
+    result = measure(data, digest)
+    if cache_dir:
+        try:
+            _write_cached(result, cache_dir)
+        except OSError:
+            pass  # read-only deployments just measure again
+    return result
+
+
+def analyze_file(path, cache_dir=CACHE_SUBDIR):
+    """Cached :class:`LeafColorResult` for an image file."""
+    with open(path, "rb") as f:
+        return analyze_bytes(f.read(), cache_dir)
+
+
+def _analyze_one(args):
+    # Runs in a worker process: errors come back as values so one bad photo never stops a batch
+    path, cache_dir = args
+    try:
+        return path, analyze_file(path, cache_dir), None
+    except Image.UnidentifiedImageError:
+        return path, None, "UnidentifiedImageError: not a readable image"
+    except (OSError, ValueError, Image.DecompressionBombError) as e:
+        return path, None, f"{type(e).__name__}: {e}"
+
+
+def iter_image_files(paths):
+    """Image files among ``paths``, walking directories (sorted)."""
+    for path in paths:
+        if os.path.isdir(path):
+            for root, dirs, files in os.walk(path):
+                dirs.sort()
+                for name in sorted(files):
+                    if name.lower().endswith(IMAGE_EXTENSIONS):
+                        yield os.path.join(root, name)
+        else:
+            yield path
+
+
+def analyze_files(paths, workers=None, cache_dir=CACHE_SUBDIR, chunksize=8):
+    """Yield ``(path, result, error)`` for image files, in order, scored on a process pool.
+
+    ``workers=1`` scores in this process. Workers read and write the same
+    on-disk cache, so already-measured photos cost one small file read.
+    """
+    tasks = ((path, cache_dir) for path in paths)
+    if workers == 1:
+        yield from map(_analyze_one, tasks)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from executor.map(_analyze_one, tasks, chunksize=chunksize)
@@ -0,0 +1,44 @@
+"""Size-bounded LRU for encoded bytes (thumbnails, rendered charts...)."""
+
+import threading
+from collections import OrderedDict
+
+
+class BytesLRU:
+    """LRU of ``bytes`` values bounded by their total size."""
+
+    def __init__(self, limit_bytes):
+        self.limit_bytes = limit_bytes
+        self.size = 0
+        self.evictions = 0
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            data = self._items.get(key)
+            if data is not None:
+                self._items.move_to_end(key)
+            return data
+
+    def put(self, key, data):
+        with self._lock:
+            old = self._items.pop(key, None)
+            if old is not None:
+                self.size -= len(old)
+            if len(data) > self.limit_bytes:
+                return
+            self._items[key] = data
+            self.size += len(data)
+            while self.size > self.limit_bytes:
+                _, evicted = self._items.popitem(last=False)
+                self.size -= len(evicted)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+            self.size = 0
+
+    def __len__(self):
+        return len(self._items)
@@ -0,0 +1,106 @@
+"""Normalized plant-name index shared by every lookup in the app.
+
+Looking a plant up used to lower-case and mask a whole column on every click.
+The index is built once per dataset version and maps a normalized plant key
+to its row positions in each table, so a lookup is a dict access no matter
+how large the catalog grows.
+"""
+
+import threading
+
+import numpy as np
+import pandas as pd
+
+from plant_care.datasets import dataset_version, load_dataset
+
+# Column holding the plant name in each dataset
+NAME_COLUMNS = {
+    "plants": "Plant Name",
+    "flowering": "Plant Name",
+    "environment": "plant name",
+}
+
+_NO_ROWS = np.empty(0, dtype=np.intp)
+
+
+def normalize_name(name):
+    """Key used for every plant-name comparison (trimmed, lower-case)."""
+    return str(name).strip().lower()
+
+
+def normalize_names(names):
+    """Vectorized :func:`normalize_name` over a Series of names."""
+    return pd.Series(names).astype("string").str.strip().str.lower()
+
+
+class NameIndex:
+    """Plant key -> row positions in each table.
+
+    Per table, row positions are stored grouped by key in one ``order`` array
+    with group boundaries in ``bounds``; a dict maps each key to its group, so
+    a lookup is one dict access plus an array slice.
+    """
+
+    def __init__(self, frames):
+        self.frames = frames
+        self._tables = {}
+        for table, frame in frames.items():
+            keys = normalize_names(frame[NAME_COLUMNS[table]].to_numpy())
+            codes, uniques = pd.factorize(keys)  # -1 marks a missing name
+            order = np.argsort(codes, kind="stable")
+            sorted_codes = codes[order]
+            starts = np.flatnonzero(np.r_[True, sorted_codes[1:] != sorted_codes[:-1]])
+            bounds = np.r_[starts, len(order)]
+            group_codes = sorted_codes[starts] if len(order) else sorted_codes
+            uniques = uniques.tolist()
+            groups = {
+                uniques[code]: group
+                for group, code in enumerate(group_codes.tolist())
+                if code >= 0
+            }
+            self._tables[table] = (groups, order, bounds)
+
+    def __contains__(self, name):
+        key = normalize_name(name)
+        return any(key in groups for groups, _, _ in self._tables.values())
+
+    def keys(self):
+        """Every plant key found in at least one table."""
+        keys = set()
+        for groups, _, _ in self._tables.values():
+            keys.update(groups)
+        return keys
+
+    def positions(self, table, name):
+        """Row positions of ``name`` in ``table`` (empty if it is not there)."""
+        groups, order, bounds = self._tables[table]
+        group = groups.get(normalize_name(name))
+        if group is None:
+            return _NO_ROWS
+        return order[bounds[group]:bounds[group + 1]]
+
+    def rows(self, table, name):
+        """All rows of ``table`` for the plant, as a DataFrame."""
+        return self.frames[table].iloc[self.positions(table, name)]
+
+    def row(self, table, name):
+        """First row of ``table`` for the plant, or None if it is missing."""
+        positions = self.positions(table, name)
+        if len(positions) == 0:
+            return None
+        return self.frames[table].iloc[positions[0]]
+
+
+_lock = threading.Lock()
+_cached = {"versions": None, "index": None}
+
+
+def get_name_index():
+    """Return the index for the current dataset versions, rebuilding if stale."""
+    versions = tuple(dataset_version(table) for table in NAME_COLUMNS)
+    with _lock:
+        if _cached["versions"] != versions:
+            frames = {table: load_dataset(table) for table in NAME_COLUMNS}
+            _cached["index"] = NameIndex(frames)
+            _cached["versions"] = versions
+        return _cached["index"]
@@ -0,0 +1,240 @@
+"""Parse-once store for plant_flowering_fruiting.csv.
+
+The flowering view used to split the month and seasonal-height strings and
+rebuild month/season count dicts on every render (and crashed on values like
+"All Year"). This module parses the CSV once into columnar arrays:
+
+* ``flowering_mask`` / ``fruiting_mask``: 12-bit month masks (bit 0 = January).
+  "March-June" covers March through June, "All Year" sets every bit.
+* ``heights``: ``(plants, len(HEIGHT_SEASONS), 2)`` array of min/max heights,
+  NaN where the plant has no value for a season.
+
+Season counts and best seasons are then bitwise/array operations. The parsed
+store is saved to a ``.npz`` file keyed by the CSV's content hash, so a new
+worker loads it without re-parsing. Malformed values are recorded in
+``errors`` at ingest instead of failing a render.
+"""
+
+import os
+import threading
+
+import numpy as np
+import pandas as pd
+
+from plant_care.datasets import CACHE_DIR, dataset_digest, load_flowering_data
+from plant_care.name_index import normalize_names
+
+MONTHS = ["January", "February", "March", "April", "May", "June",
+          "July", "August", "September", "October", "November", "December"]
+_MONTH_BITS = {month.lower(): i for i, month in enumerate(MONTHS)}
+ALL_MONTHS = (1 << 12) - 1
+
+# Define seasons and their corresponding months
+SEASONS = {
+    "Winter": ["December", "January", "February"],
+    "Spring": ["March", "April", "May"],
+    "Summer": ["June", "July", "August"],
+    "Fall": ["September", "October", "November"],
+}
+SEASON_MASKS = np.array(
+    [sum(1 << _MONTH_BITS[month.lower()] for month in months) for months in SEASONS.values()],
+    dtype=np.uint16,
+)
+
+# Seasons that can appear in "Height Based on Season (cm)", in display order
+HEIGHT_SEASONS = ["Spring", "Summer", "Fall", "Winter", "All Year"]
+_HEIGHT_SEASON_INDEX = {season.lower(): i for i, season in enumerate(HEIGHT_SEASONS)}
+
+# Number of set bits for every 12-bit mask
+_POPCOUNT = np.array([bin(mask).count("1") for mask in range(ALL_MONTHS + 1)], dtype=np.uint8)
+
+CACHE_FILE = os.path.join(CACHE_DIR, "phenology.npz")
+_FORMAT_VERSION = 1
+
+
+def parse_months(text):
+    """12-bit mask for "March-June", "March" or "All Year" (0 for N/A).
+
+    Raises ``ValueError`` for unknown month names.
+    """
+    if pd.isna(text) or not str(text).strip() or str(text).strip().upper() == "N/A":
+        return 0
+    text = str(text).strip()
+    if text.lower() == "all year":
+        return ALL_MONTHS
+    parts = [part.strip().lower() for part in text.split("-")]
+    if len(parts) > 2 or any(part not in _MONTH_BITS for part in parts):
+        raise ValueError(f"unrecognized month range {text!r}")
+    start, end = _MONTH_BITS[parts[0]], _MONTH_BITS[parts[-1]]
+    mask = 0
+    month = start
+    while True:  # walk forward, wrapping around the year for e.g. "November-February"
+        mask |= 1 << month
+        if month == end:
+            return mask
+        month = (month + 1) % 12
+
+
+def parse_heights(text):
+    """{season index: (min, max)} for "30-90 (Spring) | 50-120 (Summer)".
+
+    Raises ``ValueError`` for malformed entries or unknown seasons.
+    """
+    heights = {}
+    if pd.isna(text) or not str(text).strip():
+        return heights
+    for season_height in str(text).split("|"):
+        # Extract the height range and season
+        try:
+            height_range, season = season_height.strip().split(" (")
+            season = season.replace(")", "").strip()
+            height_min, height_max = map(int, height_range.split("-"))
+        except ValueError:
+            raise ValueError(f"malformed seasonal height {season_height.strip()!r}") from None
+        if season.lower() not in _HEIGHT_SEASON_INDEX:
+            raise ValueError(f"unknown season {season!r} in seasonal height")
+        heights[_HEIGHT_SEASON_INDEX[season.lower()]] = (height_min, height_max)
+    return heights
+
+
+def month_flags(mask):
+    """Array of twelve 0/1 flags for a month mask."""
+    return (int(mask) >> np.arange(12)) & 1
+
+
+def season_counts(masks):
+    """Months per season covered by each mask, shape ``(len(masks), 4)``."""
+    masks = np.asarray(masks, dtype=np.uint16)
+    return _POPCOUNT[masks[:, None] & SEASON_MASKS[None, :]]
+
+
+def best_season_names(masks):
+    """Season with the most covered months per mask (first season wins ties)."""
+    return np.array(list(SEASONS))[season_counts(masks).argmax(axis=1)]
+
+
+class PhenologyStore:
+    """Columnar flowering/fruiting data for every plant in the CSV."""
+
+    def __init__(self, keys, flowering, fruiting, flowering_mask, fruiting_mask, heights, valid, errors=()):
+        self.keys = keys
+        self.flowering = flowering
+        self.fruiting = fruiting
+        self.flowering_mask = flowering_mask
+        self.fruiting_mask = fruiting_mask
+        self.heights = heights
+        self.valid = valid
+        self.errors = list(errors)
+        self._positions = {}
+        for position, key in enumerate(keys.tolist()):
+            self._positions.setdefault(key, position)
+        self.best_flowering_season = best_season_names(flowering_mask)
+        self.best_fruiting_season = best_season_names(fruiting_mask)
+
+    def __len__(self):
+        return len(self.keys)
+
+    @classmethod
+    def from_frame(cls, df):
+        """Parse and validate a plant_flowering_fruiting.csv frame."""
+        n = len(df)
+        flowering_mask = np.zeros(n, dtype=np.uint16)
+        fruiting_mask = np.zeros(n, dtype=np.uint16)
+        heights = np.full((n, len(HEIGHT_SEASONS), 2), np.nan, dtype=np.float32)
+        valid = np.ones(n, dtype=bool)
+        errors = []
+
+        columns = zip(df["Flowering Months"].tolist(), df["Fruiting Months"].tolist(),
+                      df["Height Based on Season (cm)"].tolist())
+        for row, (flowering_months, fruiting_months, height_data) in enumerate(columns):
+            for column, text, target in (("Flowering Months", flowering_months, flowering_mask),
+                                         ("Fruiting Months", fruiting_months, fruiting_mask)):
+                try:
+                    target[row] = parse_months(text)
+                except ValueError as e:
+                    valid[row] = False
+                    errors.append((row, column, str(e)))
+            try:
+                for season, bounds in parse_heights(height_data).items():
+                    heights[row, season] = bounds
+            except ValueError as e:
+                valid[row] = False
+                errors.append((row, "Height Based on Season (cm)", str(e)))
+
+        flowering = (df["Flowering"] == "Yes").to_numpy(dtype=bool)
+        fruiting = (df["Fruiting"] == "Yes").to_numpy(dtype=bool)
+        keys = normalize_names(df["Plant Name"].to_numpy()).fillna("").to_numpy(dtype=str)
+        # Months only count when the plant actually flowers/fruits
+        return cls(keys, flowering, fruiting, np.where(flowering, flowering_mask, 0).astype(np.uint16),
+                   np.where(fruiting, fruiting_mask, 0).astype(np.uint16), heights, valid, errors)
+
+    def save(self, path, digest):
+        """Write the store to ``path`` tagged with the source CSV's digest."""
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp.npz"
+        np.savez(
+            tmp_path,
+            format_version=np.array(_FORMAT_VERSION),
+            digest=np.array(digest),
+            keys=self.keys,
+            flowering=self.flowering,
+            fruiting=self.fruiting,
+            flowering_mask=self.flowering_mask,
+            fruiting_mask=self.fruiting_mask,
+            heights=self.heights,
+            valid=self.valid,
+            error_rows=np.array([row for row, _, _ in self.errors], dtype=np.int64),
+            error_columns=np.array([column for _, column, _ in self.errors], dtype=str),
+            error_messages=np.array([message for _, _, message in self.errors], dtype=str),
+        )
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path, digest):
+        """Read a saved store, or return None if it is missing or stale."""
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                if int(data["format_version"]) != _FORMAT_VERSION or str(data["digest"]) != digest:
+                    return None
+                errors = zip(data["error_rows"].tolist(), data["error_columns"].tolist(),
+                             data["error_messages"].tolist())
+                return cls(data["keys"], data["flowering"], data["fruiting"], data["flowering_mask"],
+                           data["fruiting_mask"], data["heights"], data["valid"], errors)
+        except (OSError, KeyError, ValueError):
+            return None
+
+    def position(self, key):
+        """Row of a plant key, or None if the plant is not in the CSV."""
+        return self._positions.get(key)
+
+    def row_errors(self, position):
+        """Validation messages recorded for one row."""
+        return [f"{column}: {message}" for row, column, message in self.errors if row == position]
+
+    def season_heights(self, position):
+        """(seasons, min heights, max heights) present for one row."""
+        heights = self.heights[position]
+        present = ~np.isnan(heights[:, 0])
+        seasons = [season for season, keep in zip(HEIGHT_SEASONS, present) if keep]
+        return seasons, heights[present, 0].astype(int), heights[present, 1].astype(int)
+
+
+_lock = threading.Lock()
+_cached = {"digest": None, "store": None}
+
+
+def get_phenology():
+    """Store for the current CSV: memory, then the .npz cache, then parsing."""
+    digest = dataset_digest("flowering")
+    with _lock:
+        if _cached["digest"] != digest:
+            store = PhenologyStore.load(CACHE_FILE, digest)
+            if store is None:
+                store = PhenologyStore.from_frame(load_flowering_data())
+                try:
+                    store.save(CACHE_FILE, digest)
+                except OSError:
+                    pass  # read-only deployments just keep the in-memory store
+            _cached["store"] = store
+            _cached["digest"] = digest
+        return _cached["store"]
@@ -0,0 +1,207 @@
+"""Care-schedule planning for many pots at once (``python -m plant_care schedule``).
+
+plant_data.csv gives each plant type a ``Watering`` level, a ``Temperature``
+range ("15-25°C", parsed once into numeric min/max columns by the loader)
+and its ideal ``Sunlight Hours``; environment_data.csv gives the mean
+temperature and humidity of each plant's seasons. :class:`CareTable` turns
+these into one array per field, indexed by (plant type, season):
+
+* watering interval: the level's interval in days, shortened in seasons hotter
+  than the plant's range, lengthened in colder and very humid ones;
+* temperature alerts: seasons whose mean temperature is outside the range.
+
+:func:`plan` then builds the calendar of a chunk of pots over a horizon
+(30 or 90 days) with array operations: each pot is mapped to its plant type
+once, each day to its season once, and a single loop over the days (not the
+pots) advances every pot's watering clock together. Only days with a
+watering or an alert are emitted. :func:`plan_file` streams a pots file
+through it chunk by chunk, so memory stays bounded by the chunk size.
+"""
+
+import datetime
+
+import numpy as np
+import pandas as pd
+
+from plant_care.chunked_io import DEFAULT_CHUNKSIZE, read_chunks
+from plant_care.datasets import TEMPERATURE_MAX, TEMPERATURE_MIN
+from plant_care.name_index import normalize_names
+from plant_care.seasons import HUMIDITY, TEMPERATURE
+
+# Days between waterings per Watering level (levels not listed use the default)
+WATERING_INTERVALS = {"frequent": 2, "regular": 3, "moderate": 5, "medium": 5, "low": 10}
+DEFAULT_WATERING_INTERVAL = 7
+
+# Interval multipliers for seasons hotter/colder than the plant's range, and humid ones
+HOT_FACTOR = 0.6
+COLD_FACTOR = 1.5
+HUMID_FACTOR = 1.25
+HUMID_THRESHOLD = 80
+
+# Hours of sunlight a pot may be off its plant's ideal before it is flagged
+SUNLIGHT_TOLERANCE = 2
+
+# Season of environment_data.csv each calendar month falls in (these can be adjusted to the local climate)
+MONTH_SEASONS = ["winter", "winter", "spring", "spring", "summer", "summer",
+                 "monsoon", "monsoon", "monsoon", "monsoon", "winter", "winter"]
+
+# Columns of a pots file; only the plant name is required
+POT_ID, PLANT_NAME, LAST_WATERED, SUNLIGHT = "Pot ID", "Plant Name", "Last Watered", "Sunlight Hours"
+
+# Alert codes, one bit each
+TOO_HOT, TOO_COLD, LOW_SUNLIGHT, HIGH_SUNLIGHT, UNKNOWN_PLANT = (
+    "too_hot", "too_cold", "low_sunlight", "too_much_sunlight", "unknown_plant",
+)
+ALERTS = (TOO_HOT, TOO_COLD, LOW_SUNLIGHT, HIGH_SUNLIGHT, UNKNOWN_PLANT)
+_ALERT_TEXT = np.array(["; ".join(code for bit, code in enumerate(ALERTS) if bits >> bit & 1)
+                        for bits in range(1 << len(ALERTS))], dtype=object)
+
+
+class CareTable:
+    """Per plant type (and season) care arrays built from the catalog and the season means.
+
+    The arrays have one extra last row, :attr:`unknown`, with no temperature
+    range or season means, which pots of plants missing from the catalog read.
+    """
+
+    def __init__(self, plants, season_means):
+        keys = normalize_names(plants["Plant Name"].to_numpy())
+        first = ~keys.duplicated().to_numpy()  # first row wins on duplicates
+        self.keys = keys.to_numpy()[first]
+        self._codes = {key: code for code, key in enumerate(self.keys)}
+        self.seasons = tuple(dict.fromkeys(MONTH_SEASONS))
+        n = self.unknown = len(self.keys)
+
+        def with_unknown(values, fill):
+            return np.append(values, np.array([fill], dtype=values.dtype))
+
+        self.names = with_unknown(plants["Plant Name"].to_numpy(dtype=object)[first], "")
+        levels = plants["Watering"].astype("string").str.strip().str.lower().to_numpy()[first]
+        self.base_interval = with_unknown(pd.Series(levels, dtype=object).map(WATERING_INTERVALS).fillna(
+            DEFAULT_WATERING_INTERVAL).to_numpy(dtype=float), DEFAULT_WATERING_INTERVAL)
+        self.temp_min = with_unknown(plants[TEMPERATURE_MIN].to_numpy(dtype=float)[first], np.nan)
+        self.temp_max = with_unknown(plants[TEMPERATURE_MAX].to_numpy(dtype=float)[first], np.nan)
+        self.sunlight = with_unknown(
+            pd.to_numeric(plants["Sunlight Hours"], errors="coerce").to_numpy(dtype=float)[first], np.nan)
+
+        # (plant, season) means; NaN where a plant has no readings for a season
+        temperature = np.full((n + 1, len(self.seasons)), np.nan)
+        humidity = np.full((n + 1, len(self.seasons)), np.nan)
+        plant_codes = pd.Series(season_means["key"].to_numpy()).map(self._codes).to_numpy(dtype=float)
+        season_codes = pd.Series(season_means["season"].str.strip().str.lower().to_numpy()).map(
+            {season: code for code, season in enumerate(self.seasons)}).to_numpy(dtype=float)
+        known = ~(np.isnan(plant_codes) | np.isnan(season_codes))
+        rows, cols = plant_codes[known].astype(np.intp), season_codes[known].astype(np.intp)
+        temperature[rows, cols] = season_means[TEMPERATURE].to_numpy(dtype=float)[known]
+        humidity[rows, cols] = season_means[HUMIDITY].to_numpy(dtype=float)[known]
+        self.temperature = temperature
+
+        # NaN comparisons are False, so seasons without readings keep the base interval and raise no alert
+        self.too_hot = temperature > self.temp_max[:, None]
+        self.too_cold = temperature < self.temp_min[:, None]
+        factor = np.where(self.too_hot, HOT_FACTOR, np.where(self.too_cold, COLD_FACTOR, 1.0))
+        factor = factor * np.where(humidity >= HUMID_THRESHOLD, HUMID_FACTOR, 1.0)
+        self.interval = np.maximum(1, np.rint(self.base_interval[:, None] * factor)).astype(np.int16)
+
+    def __len__(self):
+        return len(self.keys)
+
+    @classmethod
+    def load(cls):
+        """Table for the current plant_data.csv and environment season means."""
+        from plant_care.datasets import load_plant_data
+        from plant_care.views import get_season_scores
+
+        return cls(load_plant_data(), get_season_scores().table)
+
+    def codes(self, plant_names):
+        """Plant-type code of each name (-1 if it is not in the catalog)."""
+        keys = normalize_names(np.asarray(plant_names, dtype=object))
+        return keys.map(self._codes).fillna(-1).to_numpy(dtype=np.intp)
+
+
+def day_seasons(start, days, seasons):
+    """Dates of the horizon and the season code of each."""
+    dates = pd.date_range(pd.Timestamp(start), periods=days, freq="D")
+    codes = {season: code for code, season in enumerate(seasons)}
+    return dates, np.array([codes[MONTH_SEASONS[month - 1]] for month in dates.month], dtype=np.intp)
+
+
+def plan(pots, table, start, days=30, first_row=0):
+    """Watering and alert calendar of a frame of pots over ``days`` days from ``start``.
+
+    Returns one row per (pot, day) with a watering or an alert: pot id,
+    plant name, date, season, water flag, alerts and the season's mean
+    temperature. Pots without a "Pot ID" column are numbered by row,
+    starting at ``first_row`` (the chunk's offset in a streamed file); a
+    missing or unparsable "Last Watered" date makes the pot due on the
+    first day.
+    """
+    if days < 1:
+        raise ValueError(f"days must be at least 1, got {days}")
+    n = len(pots)
+    pot_ids = pots[POT_ID].to_numpy() if POT_ID in pots.columns else np.arange(first_row, first_row + n)
+    codes = table.codes(pots[PLANT_NAME].to_numpy())
+    known = codes >= 0
+    plant = np.where(known, codes, table.unknown)  # unknown pots have no care data; masked below
+    dates, season = day_seasons(start, days, table.seasons)
+
+    # Days since the last watering at the start (the interval itself if unknown, so the pot is due)
+    interval = table.interval[plant[:, None], season[None, :]].astype(np.int32)  # (pots, days)
+    since = np.full(n, np.iinfo(np.int32).max // 2, dtype=np.int32)
+    if LAST_WATERED in pots.columns:
+        last = pd.to_datetime(pots[LAST_WATERED], errors="coerce").to_numpy(dtype="datetime64[D]")
+        elapsed = (np.datetime64(dates[0].date(), "D") - last).astype("timedelta64[D]").astype(float)
+        valid = ~np.isnat(last)
+        since[valid] = np.maximum(elapsed[valid], 0).astype(np.int32)
+
+    # One step per day for all pots at once; a pot is watered when its clock reaches the interval
+    water = np.zeros((n, days), dtype=bool)
+    for day in range(days):
+        due = since >= interval[:, day]
+        water[:, day] = due
+        since = np.where(due, 1, since + 1)
+    water &= known[:, None]
+
+    bits = (table.too_hot[plant[:, None], season[None, :]] * (1 << ALERTS.index(TOO_HOT))
+            | table.too_cold[plant[:, None], season[None, :]] * (1 << ALERTS.index(TOO_COLD)))
+    if SUNLIGHT in pots.columns:
+        hours = pd.to_numeric(pots[SUNLIGHT], errors="coerce").to_numpy(dtype=float)
+        ideal = table.sunlight[plant]
+        sun_bits = (np.where(hours < ideal - SUNLIGHT_TOLERANCE, 1 << ALERTS.index(LOW_SUNLIGHT), 0)
+                    | np.where(hours > ideal + SUNLIGHT_TOLERANCE, 1 << ALERTS.index(HIGH_SUNLIGHT), 0))
+        bits = bits | sun_bits[:, None]
+    bits = np.where(known[:, None], bits, 0)
+    bits[~known, 0] = 1 << ALERTS.index(UNKNOWN_PLANT)  # reported once, on the first day
+
+    pot_index, day_index = np.nonzero(water | (bits != 0))
+
+    # Repeated text columns are categoricals over per-pot (or per-season) values, so the
+    # calendar never materializes one string per row
+    def per_pot(values):
+        codes, uniques = pd.factorize(values)
+        return pd.Categorical.from_codes(codes[pot_index], uniques)
+
+    seasons = [season.capitalize() for season in table.seasons]
+    return pd.DataFrame({
+        POT_ID: per_pot(pot_ids),
+        PLANT_NAME: per_pot(np.where(known, table.names[plant], pots[PLANT_NAME].to_numpy())),
+        "Date": dates.to_numpy(dtype="datetime64[D]")[day_index],
+        "Season": pd.Categorical.from_codes(season[day_index], seasons),
+        "Water": water[pot_index, day_index],
+        "Alerts": pd.Categorical.from_codes(bits[pot_index, day_index], _ALERT_TEXT),
+        "Season Temperature (°C)": table.temperature[plant[pot_index], season[day_index]],
+    })
+
+
+def plan_file(path, start=None, days=30, chunksize=DEFAULT_CHUNKSIZE, table=None):
+    """Yield :func:`plan` calendars for a pots file (CSV/Parquet, - for stdin), one chunk of pots at a time."""
+    if table is None:
+        table = CareTable.load()
+    start = start or datetime.date.today()
+    first_row = 0
+    for chunk in read_chunks(path, chunksize):
+        if PLANT_NAME not in chunk.columns:
+            raise KeyError(f"pots are missing the {PLANT_NAME!r} column")
+        yield plan(chunk, table, start, days, first_row)
+        first_row += len(chunk)
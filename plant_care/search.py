@@ -0,0 +1,227 @@
+"""Prefix and typo-tolerant search over the plant names of all three CSVs.
+
+"Check Plant" needs an exact name and the home search only finds
+substrings, so "snak plant" finds nothing. The index answers ranked top-k
+suggestions from two structures built once per dataset version:
+
+* prefix: sorted arrays of whole names and of every word suffix ("snake
+  plant", "plant"), so the completions of a prefix are one contiguous,
+  trie-ordered range found by binary search;
+* fuzzy: an inverted index of padded character trigrams. A name within edit
+  distance ``d`` of the query shares at least ``grams(query) - 4d`` trigrams
+  with it (a swap of adjacent letters, one edit, changes four), so only those
+  candidates get a bounded edit-distance check.
+
+Suggestions rank exact matches first, then name prefixes, word prefixes and
+finally fuzzy matches by distance.
+"""
+
+import threading
+from bisect import bisect_left, insort
+from collections import namedtuple
+
+import numpy as np
+
+from plant_care.datasets import dataset_version, load_dataset
+from plant_care.name_index import NAME_COLUMNS, normalize_name, normalize_names
+
+# Bit per table a name appears in, in NAME_COLUMNS order
+TABLE_BITS = {table: 1 << i for i, table in enumerate(NAME_COLUMNS)}
+
+EXACT, PREFIX, WORD_PREFIX, FUZZY = "exact", "prefix", "word", "fuzzy"
+
+DEFAULT_LIMIT = 5
+MAX_DISTANCE = 2
+
+# Trigrams one edit can change: 3 for an insertion, deletion or substitution, 4 for a swap
+GRAMS_PER_EDIT = 4
+
+# At most this many trigram candidates (most shared trigrams first) get an edit-distance check
+MAX_FUZZY_CANDIDATES = 200
+
+_PAD = "\x00"  # cannot appear in a plant name
+_END = "￿"
+
+Suggestion = namedtuple("Suggestion", ["name", "key", "match", "distance"])
+
+
+def max_distance_for(query):
+    """Typos tolerated for a query: none up to 2 characters, 1 up to 5, then 2."""
+    if len(query) <= 2:
+        return 0
+    return 1 if len(query) <= 5 else MAX_DISTANCE
+
+
+def trigrams(key):
+    """Distinct trigrams of a key padded at both ends ("ab" -> "\\0\\0a", "\\0ab", "ab\\0")."""
+    padded = f"{_PAD}{_PAD}{key}{_PAD}"
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def edit_distance(a, b, limit):
+    """Optimal-string-alignment distance of ``a`` and ``b``, or ``limit + 1`` if above ``limit``.
+
+    Bit-parallel (Myers/Hyyrö): one column of the DP matrix per character of
+    ``b``, packed into the bits of a Python int, plus Hyyrö's transposition term.
+    """
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    if not a:
+        return len(b)
+    mask = (1 << len(a)) - 1
+    last = 1 << (len(a) - 1)
+    match_bits = {}
+    for i, char in enumerate(a):
+        match_bits[char] = match_bits.get(char, 0) | (1 << i)
+    vp, vn, d0, previous_eq = mask, 0, 0, 0
+    score, remaining = len(a), len(b)
+    for char in b:
+        eq = match_bits.get(char, 0)
+        transposed = (((~d0) & eq) << 1) & previous_eq  # "teh" -> "the"
+        d0 = ((((eq & vp) + vp) ^ vp) | eq | vn | transposed) & mask
+        hp = (vn | ~(d0 | vp)) & mask
+        hn = d0 & vp
+        if hp & last:
+            score += 1
+        elif hn & last:
+            score -= 1
+        remaining -= 1
+        if score - remaining > limit:
+            return limit + 1
+        hp = ((hp << 1) | 1) & mask
+        hn = (hn << 1) & mask
+        vp = (hn | ~(d0 | hp)) & mask
+        vn = d0 & hp
+        previous_eq = eq
+    return score if score <= limit else limit + 1
+
+
+class SearchIndex:
+    """Ranked name suggestions over a list of (display name, tables bitmask)."""
+
+    def __init__(self, names):
+        # names: {key: (display name, tables bitmask)}
+        self.keys = sorted(names)
+        self.names = [names[key][0] for key in self.keys]
+        self.tables = np.array([names[key][1] for key in self.keys], dtype=np.uint8)
+
+        # Word suffixes: "snake plant" is found from "sn" and from "pl"
+        suffixes = []
+        for key_id, key in enumerate(self.keys):
+            for start in range(1, len(key)):
+                if key[start - 1] == " " and key[start] != " ":
+                    suffixes.append((key[start:], key_id))
+        suffixes.sort()
+        self._suffixes = [suffix for suffix, _ in suffixes]
+        self._suffix_ids = np.array([key_id for _, key_id in suffixes], dtype=np.int32)
+
+        postings = {}
+        gram_counts = []
+        for key_id, key in enumerate(self.keys):
+            grams = trigrams(key)
+            gram_counts.append(len(grams))
+            for gram in grams:
+                postings.setdefault(gram, []).append(key_id)
+        self._postings = {gram: np.array(ids, dtype=np.int32) for gram, ids in postings.items()}
+        self._gram_counts = np.array(gram_counts, dtype=np.int32)
+        self._lengths = np.array([len(key) for key in self.keys], dtype=np.int32)
+
+    def __len__(self):
+        return len(self.keys)
+
+    @classmethod
+    def from_frames(cls, frames):
+        """Index the name column of every table (display names from the first table listing a plant)."""
+        names = {}
+        for table, frame in frames.items():
+            display = frame[NAME_COLUMNS[table]].astype("string").str.strip()
+            keys = normalize_names(frame[NAME_COLUMNS[table]].to_numpy())
+            for key, name in zip(keys.tolist(), display.tolist()):
+                if not isinstance(key, str) or not key:
+                    continue
+                name_, bits = names.get(key, (name, 0))
+                names[key] = (name_, bits | TABLE_BITS[table])
+        return cls(names)
+
+    def _prefix_range(self, values, prefix):
+        return bisect_left(values, prefix), bisect_left(values, prefix + _END)
+
+    def suggest(self, query, limit=DEFAULT_LIMIT, table=None, max_distance=None):
+        """Up to ``limit`` ranked :class:`Suggestion` s for ``query``.
+
+        ``table`` restricts suggestions to names present in that table;
+        ``max_distance`` overrides :func:`max_distance_for`.
+        """
+        query = normalize_name(query)
+        if not query or limit <= 0:
+            return []
+        mask = TABLE_BITS[table] if table is not None else 0xFF
+        results = []
+        seen = set()
+
+        def take(key_id, match, distance=0):
+            if key_id in seen or not self.tables[key_id] & mask:
+                return False
+            seen.add(key_id)
+            results.append(Suggestion(self.names[key_id], self.keys[key_id], match, distance))
+            return len(results) >= limit
+
+        # Whole-name prefixes in trie order ("rose" < "rose 1" < "rose 10"); an exact match comes first
+        lo, hi = self._prefix_range(self.keys, query)
+        for key_id in range(lo, hi):
+            if take(key_id, EXACT if self.keys[key_id] == query else PREFIX):
+                return results
+
+        # Prefixes of later words
+        lo, hi = self._prefix_range(self._suffixes, query)
+        for key_id in self._suffix_ids[lo:hi].tolist():
+            if take(key_id, WORD_PREFIX):
+                return results
+
+        for key_id, distance in self._fuzzy(query, max_distance, limit):
+            if take(key_id, FUZZY, distance):
+                return results
+        return results
+
+    def _fuzzy(self, query, max_distance=None, need=DEFAULT_LIMIT):
+        """(key id, distance) of the ``need`` closest names within the edit-distance bound."""
+        limit = max_distance_for(query) if max_distance is None else max_distance
+        if limit <= 0:
+            return []
+        grams = trigrams(query)
+        lists = [self._postings[gram] for gram in grams if gram in self._postings]
+        if not lists and len(grams) > GRAMS_PER_EDIT * limit:
+            return []  # short queries can be within the bound of names they share no trigram with
+        counts = np.bincount(np.concatenate(lists) if lists else np.zeros(0, dtype=np.intp),
+                             minlength=len(self.keys))
+        ids = np.flatnonzero(counts >= len(grams) - GRAMS_PER_EDIT * limit)
+        ids = ids[np.abs(self._lengths[ids] - len(query)) <= limit]
+        # Each edit changes at most GRAMS_PER_EDIT trigrams, on either side: a name with G trigrams
+        # sharing c with the query is at least (max(G, query trigrams) - c) / GRAMS_PER_EDIT edits away
+        missing = np.maximum(self._gram_counts[ids], len(grams)) - counts[ids]
+        keep = missing <= GRAMS_PER_EDIT * limit
+        ids, missing = ids[keep], missing[keep]
+        order = np.argsort(missing, kind="stable")[:MAX_FUZZY_CANDIDATES]
+        matches = []
+        for key_id, unshared in zip(ids[order].tolist(), missing[order].tolist()):
+            lower_bound = -(-unshared // GRAMS_PER_EDIT)
+            if len(matches) >= need and matches[need - 1][0] < lower_bound:
+                break  # no remaining candidate can rank higher
+            distance = edit_distance(query, self.keys[key_id], limit)
+            if distance <= limit:
+                insort(matches, (distance, len(self.keys[key_id]), self.keys[key_id], key_id))
+        return [(key_id, distance) for distance, _, _, key_id in matches[:need]]
+
+
+_lock = threading.Lock()
+_cached = {"versions": None, "index": None}
+
+
+def get_search_index():
+    """Return the index for the current dataset versions, rebuilding if stale."""
+    versions = tuple(dataset_version(table) for table in NAME_COLUMNS)
+    with _lock:
+        if _cached["versions"] != versions:
+            _cached["index"] = SearchIndex.from_frames({table: load_dataset(table) for table in NAME_COLUMNS})
+            _cached["versions"] = versions
+        return _cached["index"]
@@ -0,0 +1,112 @@
+"""Season scoring for every plant in environment_data.csv.
+
+plant.py used to average one plant's readings per season and score each
+season with a nested Python function on every click. Here the whole file is
+grouped by (plant, season) once and scored with array arithmetic; the
+resulting (plant, season, score) table is stored as a materialized view (see
+:mod:`plant_care.views`) and read by the UI and batch jobs alike.
+
+A season's score is the sum of three parts, each highest near the ideal:
+
+* temperature: ``max(0, 100 - |temp - mid(temp range)| * 5)``
+* humidity:    ``max(0, 100 - |humidity - mid(humidity range)| * 3)``
+* AQI:         ``max(0, 100 - (aqi - threshold) * 2)`` (lower is better)
+"""
+
+import numpy as np
+import pandas as pd
+
+from plant_care.datasets import ENV_NUMERIC_COLUMNS, TEMPERATURE_MAX, TEMPERATURE_MIN
+from plant_care.name_index import normalize_names
+
+TEMPERATURE, HUMIDITY, AQI = ENV_NUMERIC_COLUMNS
+
+# Ideal ranges used for plants without their own (these values can be adjusted per plant type)
+DEFAULT_IDEAL_RANGES = {
+    "temp_min": 18,
+    "temp_max": 30,
+    "humidity_min": 40,
+    "humidity_max": 70,
+    "aqi_threshold": 50,
+}
+IDEAL_RANGE_COLUMNS = list(DEFAULT_IDEAL_RANGES)
+
+
+def ideal_ranges_from_catalog(plant_df):
+    """Per-plant ideal ranges taking the temperature range from plant_data.csv.
+
+    "15-25°C" becomes temp_min=15, temp_max=25 (pre-split by the loader);
+    humidity and AQI keep the defaults. Rows whose range cannot be parsed are
+    left out.
+    """
+    ranges = pd.DataFrame({
+        "key": normalize_names(plant_df["Plant Name"].to_numpy()).to_numpy(),
+        "temp_min": plant_df[TEMPERATURE_MIN].to_numpy(),
+        "temp_max": plant_df[TEMPERATURE_MAX].to_numpy(),
+    }).dropna().drop_duplicates("key")
+    for col in ("humidity_min", "humidity_max", "aqi_threshold"):
+        ranges[col] = DEFAULT_IDEAL_RANGES[col]
+    return ranges.set_index("key")[IDEAL_RANGE_COLUMNS]
+
+
+def season_means(env_df):
+    """Mean temperature, humidity and AQI per (plant key, season)."""
+    grouped = env_df.assign(key=normalize_names(env_df["plant name"].to_numpy()).to_numpy())
+    return grouped.groupby(["key", "season"], sort=True)[ENV_NUMERIC_COLUMNS].mean().reset_index()
+
+
+def score_seasons(means, ideal_ranges=None):
+    """Add the score columns to a :func:`season_means` table in one pass.
+
+    ``ideal_ranges`` is an optional frame indexed by plant key with the
+    :data:`IDEAL_RANGE_COLUMNS`; plants missing from it use the defaults.
+    """
+    if ideal_ranges is None:
+        ranges = pd.DataFrame(DEFAULT_IDEAL_RANGES, index=means.index)
+    else:
+        ranges = ideal_ranges.reindex(means["key"].to_numpy()).reset_index(drop=True)
+        ranges = ranges.fillna(DEFAULT_IDEAL_RANGES).set_index(means.index)
+
+    temp_mid = (ranges["temp_min"].to_numpy() + ranges["temp_max"].to_numpy()) / 2
+    humidity_mid = (ranges["humidity_min"].to_numpy() + ranges["humidity_max"].to_numpy()) / 2
+    scored = means.copy()
+    scored["temp_score"] = np.maximum(0, 100 - np.abs((means[TEMPERATURE].to_numpy() - temp_mid) * 5))
+    scored["humidity_score"] = np.maximum(0, 100 - np.abs((means[HUMIDITY].to_numpy() - humidity_mid) * 3))
+    scored["aqi_score"] = np.maximum(0, 100 - (means[AQI].to_numpy() - ranges["aqi_threshold"].to_numpy()) * 2)
+    scored["score"] = scored["temp_score"] + scored["humidity_score"] + scored["aqi_score"]
+    return scored
+
+
+def best_seasons(scored):
+    """Highest-scoring season per plant (ties go to the alphabetically first season)."""
+    ordered = scored.sort_values(["key", "score"], ascending=[True, False], kind="stable")
+    return ordered.drop_duplicates("key").set_index("key")[["season", "score"]]
+
+
+class SeasonScores:
+    """Scored (plant, season) table with per-plant lookups."""
+
+    def __init__(self, scored):
+        self.table = scored.sort_values(["key", "season"], kind="stable").reset_index(drop=True)
+        self.best = best_seasons(self.table)
+        keys = self.table["key"].to_numpy()
+        starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]]) if len(keys) else np.empty(0, dtype=int)
+        ends = np.r_[starts[1:], len(keys)]
+        self._slices = {keys[start]: (start, end) for start, end in zip(starts, ends)}
+
+    def for_plant(self, key):
+        """Seasons of one plant, indexed by season (empty if it has no readings)."""
+        start, end = self._slices.get(key, (0, 0))
+        return self.table.iloc[start:end].set_index("season")
+
+    def best_season(self, key):
+        """Best season of one plant, or None if it has no readings."""
+        if key not in self._slices:
+            return None
+        return self.best.at[key, "season"]
+
+
+def compute_season_scores(env_df, ideal_ranges=None):
+    """Build :class:`SeasonScores` for every plant in ``env_df``."""
+    return SeasonScores(score_seasons(season_means(env_df), ideal_ranges))
+
@@ -0,0 +1,226 @@
+"""Thumbnails for the plant grid on the home page.
+
+Decoding every full-resolution JPEG on every rerun dominated the home page.
+Thumbnails are generated once per size bucket, written to an on-disk cache
+keyed by source path and mtime, and the encoded bytes of the most recently
+used ones are kept in a bounded in-memory LRU. The full image is only read
+by the detail view.
+
+:func:`get_thumbnails` loads a whole grid page at once: cached thumbnails
+are returned directly and the rest are decoded concurrently on a shared
+thread pool (Pillow releases the GIL while decoding). Each image gets a
+timeout, and an image that is broken or too slow is shown as a placeholder.
+A slow image keeps loading in the background and is cached for the next
+rerun.
+"""
+
+import hashlib
+import io
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from functools import lru_cache
+
+from PIL import Image
+
+from plant_care.datasets import DATA_DIR
+from plant_care.lru import BytesLRU
+
+# Folder containing plant images
+IMAGE_FOLDER = os.path.join(DATA_DIR, "plant_images")
+
+# Generated thumbnails live here, one file per (source, mtime, bucket)
+THUMBNAIL_DIR = os.environ.get("PLANT_CARE_THUMBNAIL_DIR", os.path.join(DATA_DIR, ".thumbnail_cache"))
+
+# Thumbnail widths in pixels; requests are rounded up to the next bucket
+SIZE_BUCKETS = (160, 320, 640)
+DEFAULT_WIDTH = 320
+
+# Upper bound for encoded thumbnail bytes kept in memory
+MEMORY_LIMIT_BYTES = 16 * 1024 * 1024
+
+JPEG_QUALITY = 85
+
+# Threads decoding grid images, and seconds a grid waits for one image
+PREFETCH_WORKERS = int(os.environ.get("PLANT_CARE_IMAGE_WORKERS", min(8, (os.cpu_count() or 1) + 4)))
+IMAGE_TIMEOUT = float(os.environ.get("PLANT_CARE_IMAGE_TIMEOUT", 5.0))
+
+PLACEHOLDER_COLOR = (233, 240, 233)
+
+
+def image_filename(plant_name):
+    """File name of a plant's photo, e.g. "Aloe Vera" -> "aloe_vera.jpg"."""
+    return f"{plant_name.lower().replace(' ', '_')}.jpg"
+
+
+def _stat_image(plant_name):
+    """Return (path, stat) of a non-empty plant image, or (path, None)."""
+    img_path = os.path.join(IMAGE_FOLDER, image_filename(plant_name))
+    try:
+        stat = os.stat(img_path)
+    except OSError:
+        return img_path, None
+    return img_path, (stat if stat.st_size > 0 else None)
+
+
+def image_path(plant_name):
+    """Path of the full-size plant image, or None if it is missing."""
+    img_path, stat = _stat_image(plant_name)
+    return img_path if stat is not None else None
+
+
+def size_bucket(width):
+    """Smallest bucket at least ``width`` wide (the largest one otherwise)."""
+    for bucket in SIZE_BUCKETS:
+        if width <= bucket:
+            return bucket
+    return SIZE_BUCKETS[-1]
+
+
+_memory = BytesLRU(MEMORY_LIMIT_BYTES)
+_stats = {"memory_hits": 0, "disk_hits": 0, "generated": 0, "placeholders": 0, "timeouts": 0}
+_stats_lock = threading.Lock()
+
+
+def _count(stat):
+    with _stats_lock:
+        _stats[stat] += 1
+
+
+def _cache_file(img_path, mtime_ns, bucket):
+    key = f"{os.path.abspath(img_path)}:{mtime_ns}:{bucket}".encode()
+    return os.path.join(THUMBNAIL_DIR, f"{hashlib.sha1(key).hexdigest()}_{bucket}.jpg")
+
+
+def render_thumbnail(img_path, bucket):
+    """Decode ``img_path`` at reduced size and re-encode it as a JPEG."""
+    with Image.open(img_path) as img:
+        # Let the JPEG decoder downscale while decoding instead of afterwards
+        img.draft("RGB", (bucket, bucket))
+        img = img.convert("RGB")
+        img.thumbnail((bucket, bucket))
+        buffer = io.BytesIO()
+        img.save(buffer, format="JPEG", quality=JPEG_QUALITY, optimize=True)
+    return buffer.getvalue()
+
+
+def _write_atomic(path, data):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+def get_thumbnail(plant_name, width=DEFAULT_WIDTH):
+    """Encoded JPEG thumbnail of a plant's image, or None if it has no image.
+
+    Raises ``OSError`` if the source image exists but cannot be decoded.
+    """
+    img_path, stat = _stat_image(plant_name)
+    if stat is None:
+        return None
+    bucket = size_bucket(width)
+    key = (img_path, stat.st_mtime_ns, bucket)
+
+    data = _memory.get(key)
+    if data is not None:
+        _count("memory_hits")
+        return data
+
+    cache_file = _cache_file(img_path, stat.st_mtime_ns, bucket)
+    try:
+        with open(cache_file, "rb") as f:
+            data = f.read()
+        _count("disk_hits")
+    except OSError:
+        data = render_thumbnail(img_path, bucket)
+        try:
+            _write_atomic(cache_file, data)
+        except OSError:
+            pass  # read-only deployments still get the in-memory copy
+        _count("generated")
+
+    _memory.put(key, data)
+    return data
+
+
+@lru_cache(maxsize=None)
+def placeholder_thumbnail(width=DEFAULT_WIDTH):
+    """Plain JPEG shown instead of an image that cannot be decoded in time."""
+    from PIL import ImageDraw
+
+    bucket = size_bucket(width)
+    img = Image.new("RGB", (bucket, bucket * 3 // 4), PLACEHOLDER_COLOR)
+    draw = ImageDraw.Draw(img)
+    draw.text((bucket // 2, bucket * 3 // 8), "Image unavailable", fill=(90, 110, 90), anchor="mm")
+    buffer = io.BytesIO()
+    img.save(buffer, format="JPEG", quality=JPEG_QUALITY)
+    return buffer.getvalue()
+
+
+_pool_lock = threading.Lock()
+_pool = {"executor": None}
+_inflight = {}
+
+
+def _executor():
+    with _pool_lock:
+        if _pool["executor"] is None:
+            _pool["executor"] = ThreadPoolExecutor(max_workers=PREFETCH_WORKERS, thread_name_prefix="thumbnails")
+        return _pool["executor"]
+
+
+def _submit(plant_name, width):
+    """Future for one thumbnail, shared with any load of it already running."""
+    key = (plant_name, size_bucket(width))
+    executor = _executor()
+    with _pool_lock:
+        future = _inflight.get(key)
+        if future is None:
+            future = executor.submit(get_thumbnail, plant_name, width)
+            _inflight[key] = future
+            future.add_done_callback(lambda _: _inflight.pop(key, None))
+        return future
+
+
+def get_thumbnails(plant_names, width=DEFAULT_WIDTH, timeout=IMAGE_TIMEOUT):
+    """Thumbnails for a grid page, in the order of ``plant_names``.
+
+    Each entry is JPEG bytes, None for a plant without an image, or the
+    placeholder for an image that failed to decode or took longer than
+    ``timeout`` seconds.
+    """
+    deadline = time.monotonic() + timeout
+    results = [None] * len(plant_names)
+    pending = []
+    for position, plant_name in enumerate(plant_names):
+        img_path, stat = _stat_image(plant_name)
+        if stat is None:
+            continue
+        data = _memory.get((img_path, stat.st_mtime_ns, size_bucket(width)))
+        if data is not None:
+            _count("memory_hits")
+            results[position] = data
+        else:
+            pending.append((position, _submit(plant_name, width)))
+
+    for position, future in pending:
+        try:
+            # The loads run concurrently, so the whole page waits at most ``timeout``
+            results[position] = future.result(timeout=max(0.0, deadline - time.monotonic()))
+        except FutureTimeoutError:
+            _count("timeouts")
+            results[position] = placeholder_thumbnail(width)
+        except Exception:
+            _count("placeholders")
+            results[position] = placeholder_thumbnail(width)
+    return results
+
+
+def thumbnail_stats():
+    """Hit counters and current memory use of the thumbnail cache."""
+    with _stats_lock:
+        return dict(_stats, memory_items=len(_memory), memory_bytes=_memory.size)
@@ -0,0 +1,178 @@
+"""Catalog-wide derived tables ("materialized views").
+
+Some tables are derived from a whole dataset and read on every click: the
+growth-rate encoding behind the "Sunlight Hours vs Growth Rate" chart, the
+per-(plant, season) environment scores and the soil/watering distributions
+shown next to the filters. Each view is built once from its source datasets
+and written to ``.plant_care_cache/views/<view>/`` in the columnar format of
+:mod:`plant_care.columnar`, tagged with the digests of its sources. (Each
+plant's best flowering/fruiting season is kept by :mod:`plant_care.phenology`,
+which analyze_flowering and the dossiers read directly.)
+
+A view is looked up in memory, then on disk, and only rebuilt when one of
+*its* sources changed: editing environment_data.csv rebuilds the season
+scores and leaves the catalog views untouched, and a new worker process
+memory-maps the stored views instead of recomputing them.
+"""
+
+import hashlib
+import os
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+
+from plant_care.columnar import read_columnar, write_columnar
+from plant_care.datasets import CACHE_DIR, dataset_digest, load_dataset
+from plant_care.growth import GROWTH_MAPPING
+from plant_care.instrumentation import span
+from plant_care.seasons import SeasonScores, score_seasons, season_means
+
+VIEWS_DIR = os.path.join(CACHE_DIR, "views")
+
+# Bump when a builder changes, so stored views built by older code are ignored
+_FORMAT_VERSION = 1
+
+
+def _growth_rates(plants):
+    """Sunlight hours and numeric growth rate (1=Slow, 2=Medium, 3=Fast) per plant."""
+    rates = pd.DataFrame({
+        "Plant Name": plants["Plant Name"],
+        "Sunlight Hours": plants["Sunlight Hours"],
+        "Growth Rate Num": plants["Growth Rate"].map(GROWTH_MAPPING),
+    })
+    return rates.dropna(subset=["Growth Rate Num", "Sunlight Hours"]).reset_index(drop=True)
+
+
+def _season_scores(environment):
+    """Default-range score table of every (plant key, season), see :mod:`plant_care.seasons`."""
+    return score_seasons(season_means(environment))
+
+
+def _distribution(column):
+    def build(plants):
+        counts = plants[column].value_counts(sort=False).sort_index()
+        return pd.DataFrame({column: counts.index.to_numpy(dtype=object), "count": counts.to_numpy(dtype=np.int64)})
+    build.__doc__ = f"Number of catalog plants per {column.lower()} value."
+    return build
+
+
+# name -> (source datasets, builder taking the source frames in that order)
+VIEWS = {
+    "growth_rates": (("plants",), _growth_rates),
+    "season_scores": (("environment",), _season_scores),
+    "soil_counts": (("plants",), _distribution("Soil Type")),
+    "watering_counts": (("plants",), _distribution("Watering")),
+}
+
+
+class _Entry:
+    def __init__(self):
+        self.frame = None
+        self.digest = None
+        self.source = None
+        self.builds = 0
+        self.reads = 0
+        self.last_build_ms = 0.0
+
+
+_lock = threading.Lock()
+_entries = {name: _Entry() for name in VIEWS}
+
+
+def view_path(name):
+    """Directory of a stored view."""
+    return os.path.join(VIEWS_DIR, name)
+
+
+def view_digest(name):
+    """Digest of the view's builder version and the current contents of its sources."""
+    sources, _ = VIEWS[name]
+    hasher = hashlib.blake2b(digest_size=16)
+    hasher.update(f"{name}:{_FORMAT_VERSION}".encode())
+    for source in sources:
+        hasher.update(f"|{source}={dataset_digest(source)}".encode())
+    return hasher.hexdigest()
+
+
+def _refresh(name, entry):
+    digest = view_digest(name)
+    if entry.frame is not None and entry.digest == digest:
+        return False
+    frame = read_columnar(view_path(name), digest)
+    if frame is not None:
+        entry.source = "stored"
+        entry.reads += 1
+    else:
+        sources, build = VIEWS[name]
+        start = time.perf_counter()
+        with span(f"views.build.{name}"):
+            frame = build(*(load_dataset(source) for source in sources))
+        entry.last_build_ms = (time.perf_counter() - start) * 1000
+        entry.source = "built"
+        entry.builds += 1
+        try:
+            write_columnar(frame, view_path(name), digest)
+        except OSError:
+            pass  # read-only deployments rebuild per process
+    entry.frame = frame
+    entry.digest = digest
+    return True
+
+
+def _current(name):
+    entry = _entries[name]
+    with _lock:
+        _refresh(name, entry)
+        return entry.frame.copy(deep=False), entry.digest
+
+
+def get_view(name):
+    """The named view for the current source data (shallow copy, do not mutate)."""
+    return _current(name)[0]
+
+
+def refresh_views(names=None):
+    """Bring the named views (default: all) up to date; returns {name: "built"/"stored"/"current"}."""
+    results = {}
+    with _lock:
+        for name in names or VIEWS:
+            entry = _entries[name]
+            results[name] = entry.source if _refresh(name, entry) else "current"
+    return results
+
+
+def view_stats():
+    """Builds, disk reads and last build time per view."""
+    with _lock:
+        return {
+            name: {
+                "source": entry.source,
+                "rows": None if entry.frame is None else len(entry.frame),
+                "builds": entry.builds,
+                "reads": entry.reads,
+                "last_build_ms": round(entry.last_build_ms, 3),
+            }
+            for name, entry in _entries.items()
+        }
+
+
+_scores_lock = threading.Lock()
+_cached_scores = {"digest": None, "scores": None}
+
+
+def get_season_scores():
+    """Default-range :class:`SeasonScores` for environment_data.csv, from the stored view."""
+    with _scores_lock:
+        if _cached_scores["digest"] != view_digest("season_scores"):
+            table, digest = _current("season_scores")
+            _cached_scores["scores"] = SeasonScores(table)
+            _cached_scores["digest"] = digest
+        return _cached_scores["scores"]
+
+
+def counts(name):
+    """{value: plants} of a distribution view (``soil_counts`` or ``watering_counts``)."""
+    frame = get_view(name)
+    return dict(zip(frame.iloc[:, 0].tolist(), frame["count"].tolist()))
@@ -0,0 +1,33 @@
+"""Multi-chunk Parquet output of ChunkWriter."""
+
+import datetime
+
+import pandas as pd
+
+from plant_care.chunked_io import ChunkWriter, read_chunks
+from plant_care.schedule import PLANT_NAME, plan_file
+
+
+def test_later_chunks_may_grow_categories_and_fill_missing_columns(tmp_path):
+    path = str(tmp_path / "out.parquet")
+    first = pd.DataFrame({"name": pd.Categorical(["a", "b"]), "note": [None, None]})
+    second = pd.DataFrame({"name": pd.Categorical([f"n{i}" for i in range(300)]), "note": ["x"] * 300})
+    with ChunkWriter(path) as writer:
+        writer.write(first)
+        writer.write(second)
+    written = pd.concat(read_chunks(path))
+    assert len(written) == 302
+    assert written["name"].astype(str).tolist() == ["a", "b"] + [f"n{i}" for i in range(300)]
+    assert written["note"].isna().sum() == 2
+
+
+def test_schedule_parquet_across_chunks(tmp_path):
+    pots = tmp_path / "pots.csv"
+    pd.DataFrame({PLANT_NAME: ["Rose"] * 300 + [f"Unknown {i}" for i in range(300)]}).to_csv(pots, index=False)
+    path = str(tmp_path / "schedule.parquet")
+    with ChunkWriter(path) as writer:
+        for calendar in plan_file(str(pots), datetime.date(2026, 1, 1), days=30, chunksize=300):
+            writer.write(calendar)
+    written = pd.concat(read_chunks(path))
+    assert written[PLANT_NAME].nunique() == 301
+    assert written["Pot ID"].nunique() == 600
@@ -0,0 +1,32 @@
+"""Failed favorite writes are reported to the affected user only, until they save again."""
+
+import sqlite3
+
+from plant_care import favorites
+from plant_care.favorites import FavoritesStore, UserFavorites
+
+
+def test_save_errors_are_per_user_and_cleared_on_success(tmp_path, monkeypatch):
+    monkeypatch.setattr(favorites, "RETRY_DELAY", 0)
+    store = FavoritesStore(str(tmp_path / "favorites.db"), str(tmp_path / "no_seed.csv"))
+    alice, bob = UserFavorites(store, "alice"), UserFavorites(store, "bob")
+
+    def fail(conn, batch):
+        raise sqlite3.OperationalError("disk I/O error")
+
+    commit = store._commit
+    store._commit = fail
+    alice.add("Rose")
+    store.flush()
+    assert alice.save_error and bob.save_error is None
+    assert [change[1:3] for change in store.failed] == [("alice", "Rose")]
+
+    store._commit = commit
+    bob.add("Tulip")
+    store.flush()
+    assert alice.save_error and store.last_error is None
+
+    alice.add("Fern")
+    store.flush()
+    assert alice.save_error is None
+    assert store.favorites("alice") == ["Fern"]
@@ -0,0 +1,27 @@
+"""Batch growth scoring of incomplete readings and catalog rows."""
+
+import numpy as np
+import pandas as pd
+
+from plant_care.growth import UNKNOWN_PLANT, analyze_growth_batch, ideal_table
+
+
+def catalog(height):
+    return pd.DataFrame({"Plant Name": ["Rose"], "Sunlight Hours": [6], "Soil Type": ["Loamy"], "Height (cm)": [height]})
+
+
+def test_blank_reading_cells_are_not_scored():
+    readings = pd.DataFrame({"Plant Name": ["Rose", "Rose"], "Sunlight Hours": [np.nan, 6],
+                             "Soil Type": ["Loamy", "Loamy"], "Height (cm)": [100, np.nan]})
+    scored = analyze_growth_batch(readings, ideal_table(catalog(100)))
+    assert scored["growth_rate"].tolist() == [UNKNOWN_PLANT, UNKNOWN_PLANT]
+    assert scored["deviation"].isna().all()
+    assert (scored[["sunlight_advice", "soil_advice", "height_advice"]] == "").all().all()
+
+
+def test_missing_catalog_height_gets_no_height_advice():
+    readings = pd.DataFrame({"Plant Name": ["Rose"], "Sunlight Hours": [6], "Soil Type": ["Loamy"], "Height (cm)": [80]})
+    scored = analyze_growth_batch(readings, ideal_table(catalog(np.nan)))
+    assert scored["Ideal Height (cm)"].isna().all()
+    assert scored.loc[0, "height_advice"] == ""
+    assert scored.loc[0, "growth_rate"] == "Fast"
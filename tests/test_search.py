@@ -0,0 +1,38 @@
+"""Fuzzy recall of the search index against a brute-force edit-distance scan."""
+
+import pytest
+
+from plant_care.search import edit_distance, get_search_index, max_distance_for
+
+
+def single_edits(key, alphabet):
+    """Every insertion, deletion, substitution and adjacent swap of ``key``."""
+    variants = {key[:i] + key[i + 1:] for i in range(len(key))}
+    variants |= {key[:i] + key[i + 1] + key[i] + key[i + 2:] for i in range(len(key) - 1)}
+    for char in alphabet:
+        variants |= {key[:i] + char + key[i:] for i in range(len(key) + 1)}
+        variants |= {key[:i] + char + key[i + 1:] for i in range(len(key))}
+    return variants
+
+
+def test_fuzzy_matches_brute_force_scan():
+    index = get_search_index()
+    alphabet = sorted(set("".join(index.keys)))
+    queries = set().union(*(single_edits(key, alphabet) for key in index.keys))
+    missed = []
+    for query in sorted(queries):
+        limit = max_distance_for(query)
+        if limit <= 0 or query != query.strip() or "  " in query:
+            continue  # not a normalized query
+        expected = {i for i, key in enumerate(index.keys) if edit_distance(query, key, limit) <= limit}
+        found = {key_id for key_id, _ in index._fuzzy(query, need=len(index.keys))}
+        if expected - found:
+            missed.append(query)
+    assert missed == []
+
+
+@pytest.mark.parametrize("query, name", [
+    ("rsoe", "Rose"), ("orse", "Rose"), ("tuilp", "Tulip"), ("tluip", "Tulip"), ("fren", "Fern"), ("plam", "Palm"),
+])
+def test_adjacent_swaps_are_suggested(query, name):
+    assert name in [suggestion.name for suggestion in get_search_index().suggest(query)]